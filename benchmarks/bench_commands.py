@@ -0,0 +1,280 @@
+"""Benchmark for the latency and allocations of the hot paths of the commands."""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, List
+
+import yaml
+
+from discord_bot.audio import AudioSource
+from discord_bot.command import Manager, Music
+from tests.test_checks import (
+    __CTX__,
+    AuthorMock,
+    CommandMock,
+    ContextMock,
+    RoleMock,
+    TextChannelMock,
+    VoiceChannelMock,
+    VoiceClientMock,
+)
+
+
+@dataclass
+class BenchAuthor(AuthorMock):
+    """Mock class for ctx.author, which has a name."""
+
+    name: str = "Ninja"
+
+
+@dataclass
+class BenchVoiceClient(VoiceClientMock):
+    """Mock class for ctx.voice_client, which plays without ffmpeg."""
+
+    source: Any = None
+
+    def play(self, source: Any, after: Callable | None = None):
+        """Mock play method."""
+        self.source = source
+        self.playing = True
+
+    def stop(self):
+        """Mock stop method (without calling the after function)."""
+        self.source = None
+        self.playing = False
+        self.paused = False
+
+
+@dataclass
+class BenchContext(ContextMock):
+    """Mock class for ctx, which supports the typing indicator."""
+
+    def typing(self):
+        """Mock typing method."""
+        return contextlib.nullcontext()
+
+    async def send(self, *args, **kwargs):
+        """Mock send method."""
+
+
+class BenchPlayer:
+    """Mock class for the audio stream (without spawning ffmpeg)."""
+
+    def __init__(self, audio_source: AudioSource, volume: int):
+        self.title = audio_source.title
+        self.user = audio_source.user
+        self.yt_url = audio_source.yt_url
+        self.volume = volume
+
+    @classmethod
+    async def from_audio_source(cls, audio_source: AudioSource, volume: int, **_):
+        return cls(audio_source, volume)
+
+    def with_volume(self, volume: int) -> "BenchPlayer":
+        self.volume = volume
+        return self
+
+    def cleanup(self):
+        pass
+
+
+class BenchBot:
+    """Mock class for commands.Bot."""
+
+    command_prefix = "!"
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.cogs: Dict[str, Any] = {}
+
+    def get_cog(self, name: str) -> Any:
+        return self.cogs.get(name)
+
+    def get_guild(self, guild_id: int) -> None:
+        return None
+
+    def dispatch(self, event: str, *args):
+        pass
+
+
+async def extract(url: str, guild_id: int | None = None) -> Dict[str, Any]:
+    """Mock extract function, which answers like a YouTube search."""
+    return {
+        "url": f"https://rr1---sn-4g5e6nzz.googlevideo.com/videoplayback?expire=9{url}",
+        "acodec": "opus",
+        "entries": [{"title": f"🎵 {url} 🎵", "url": f"https://youtu.be/{hash(url)}"}],
+    }
+
+
+def create_ctx(roles: int, channels: int) -> BenchContext:
+    """Creates the mock context of a Discord Server with the given sizes."""
+    guild = replace(
+        __CTX__.guild,
+        roles=[RoleMock(id=i, name=f"Role #{i}") for i in range(roles)]
+        + __CTX__.guild.roles,
+        text_channels=[
+            TextChannelMock(id=i, name=f"text #{i}") for i in range(channels)
+        ]
+        + __CTX__.guild.text_channels,
+        voice_channels=[
+            VoiceChannelMock(id=i, name=f"voice #{i}") for i in range(channels)
+        ]
+        + __CTX__.guild.voice_channels,
+    )
+    voice_client = BenchVoiceClient(
+        channel=__CTX__.voice_client.channel, playing=False, paused=False
+    )
+    return BenchContext(
+        author=BenchAuthor(**vars(__CTX__.author)),
+        channel=__CTX__.channel,
+        command=__CTX__.command,
+        guild=guild,
+        voice_client=voice_client,
+    )
+
+
+async def measure(
+    name: str, run: Callable[[int], Awaitable], iterations: int
+) -> Dict[str, Any]:
+    """Measures the latency and the allocated memory of each call."""
+    latencies: List[float] = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await run(i)
+        latencies.append(time.perf_counter() - start)
+
+    # Measure the allocations in a separate pass, as tracing slows down every call
+    peaks: List[int] = []
+    tracemalloc.start()
+    for i in range(iterations, iterations + min(iterations, 100)):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await run(i)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "name": name,
+        "iterations": iterations,
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p99_us": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1e6,
+        "mean_us": statistics.fmean(latencies) * 1e6,
+        "alloc_kib": statistics.fmean(peaks) / 1024,
+    }
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Runs all benchmarks."""
+    with open(args.config, "r", encoding="utf-8") as file:
+        config = yaml.safe_load(file)
+
+    bot = BenchBot()
+    manager = Manager(bot, **config["manager"])
+    music = Music(bot, cache_path=":memory:", playlist_size=None)
+    music.extractor.extract = extract
+    music.transformer = BenchPlayer
+    bot.cogs.update(Manager=manager, Music=music)
+
+    ctx = create_ctx(args.roles, args.channels)
+    session = music.sessions.get(ctx.guild.id)
+    songs = [
+        AudioSource(
+            title=f"Song #{i}",
+            user="Ninja",
+            yt_url=f"https://youtu.be/{i}",
+            priority=i % 5,
+            stream_url=f"https://stream/{i}",
+        )
+        for i in range(args.queue)
+    ]
+
+    async def refill():
+        """Keeps the playlist at the given queue size."""
+        size = await session.playlist.size()
+        for song in songs[: max(0, args.queue - size)]:
+            await session.playlist.add(replace(song))
+
+    async def check(i: int):
+        ctx.command = CommandMock(name=("play", "add", "show")[i % 3])
+        await manager.bot_check(ctx)
+
+    async def add(i: int):
+        await Music.add.callback(music, ctx, f"never gonna give you up {i}")
+        await session.playlist.pop()
+
+    async def show(i: int):
+        await Music.show.callback(music, ctx, 10, 1 + i % 5)
+
+    async def play(i: int):
+        ctx.voice_client.stop()
+        await Music.play.callback(music, ctx)
+        await refill()
+
+    async def playlist(i: int):
+        await session.playlist.add(replace(songs[i % len(songs)]))
+        await session.playlist.peek(10)
+        await session.playlist.pop()
+
+    await refill()
+    results = []
+    for name, func in [
+        ("checks", check),
+        ("!add", add),
+        ("!show", show),
+        ("!play", play),
+        ("playlist", playlist),
+    ]:
+        results.append(await measure(name, func, args.iterations))
+
+    session.prefetcher.cancel()
+    await music.cog_unload()
+    return results
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queue", type=int, default=1000, help="Number of songs")
+    parser.add_argument("--roles", type=int, default=100, help="Number of roles")
+    parser.add_argument("--channels", type=int, default=100, help="Number of channels")
+    parser.add_argument("--iterations", type=int, default=1000, help="Calls per path")
+    parser.add_argument("--config", default="config.yaml", help="Path to config.yaml")
+    parser.add_argument("--json", help="Path to write the machine-readable results")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    print(f"{'path':<10} {'p50 (us)':>10} {'p99 (us)':>10} {'alloc (KiB)':>12}")
+    for result in results:
+        print(
+            f"{result['name']:<10} {result['p50_us']:>10.1f} {result['p99_us']:>10.1f}"
+            f" {result['alloc_kib']:>12.1f}"
+        )
+
+    if args.json:
+        report = {
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "parameters": {
+                "queue": args.queue,
+                "roles": args.roles,
+                "channels": args.channels,
+                "iterations": args.iterations,
+            },
+            "results": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Microbenchmark for Playlist.add() and Playlist.pop() of discord_bot/audio/playlist.py."""
+
+import argparse
+import asyncio
+import heapq
+import random
+import time
+from dataclasses import dataclass, field
+
+from discord_bot.audio import AudioSource, Playlist
+
+
+@dataclass(order=True)
+class LegacyAudioSource:
+    """The audio source as it was compared before (dataclass-generated __lt__)."""
+
+    title: str = field(compare=False)
+    user: str = field(compare=False)
+    yt_url: str = field(compare=False)
+    priority: int
+
+
+class LegacyPlaylist:
+    """The playlist as it was before (heap of the audio sources themselves)."""
+
+    def __init__(self, max_size: int | None = None):
+        self._playlist = []
+        self._max_size = max_size
+        self._lock = asyncio.Lock()
+
+    async def add(self, audio_source: LegacyAudioSource):
+        """Adds an audio source to the playlist."""
+        async with self._lock:
+            if self._max_size is not None and len(self._playlist) >= self._max_size:
+                raise ValueError(
+                    "The playlist has reached the maximum limit of audio sources!"
+                )
+            heapq.heappush(self._playlist, audio_source)
+
+    async def pop(self) -> LegacyAudioSource:
+        """Removes and returns the next audio source from the playlist."""
+        async with self._lock:
+            return heapq.heappop(self._playlist)
+
+
+async def add_pop(playlist, items: list) -> float:
+    """Adds and pops all audio sources and returns the elapsed time in seconds."""
+    start = time.perf_counter()
+    for item in items:
+        await playlist.add(item)
+    for _ in items:
+        await playlist.pop()
+    return time.perf_counter() - start
+
+
+async def run(args: argparse.Namespace):
+    """Measures the legacy and the current playlist."""
+    rng = random.Random(0)
+    priorities = [rng.randrange(args.roles) for _ in range(args.size)]
+    legacy = [
+        LegacyAudioSource(title=str(i), user="u", yt_url=f"y{i}", priority=priority)
+        for i, priority in enumerate(priorities)
+    ]
+    current = [
+        AudioSource(title=str(i), user="u", yt_url=f"y{i}", priority=priority)
+        for i, priority in enumerate(priorities)
+    ]
+
+    legacy_time = min(
+        [await add_pop(LegacyPlaylist(), legacy) for _ in range(args.repeat)]
+    )
+    current_time = min([await add_pop(Playlist(), current) for _ in range(args.repeat)])
+    print(f"add/pop {args.size} songs with {args.roles} priorities")
+    print(f"legacy heap:      {legacy_time * 1e3:8.3f} ms")
+    print(f"Playlist:         {current_time * 1e3:8.3f} ms")
+    print(f"speedup:          {legacy_time / current_time:8.2f}x")
+
+
+def main():
+    """Runs the microbenchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1000, help="Number of songs")
+    parser.add_argument("--roles", type=int, default=5, help="Number of priorities")
+    parser.add_argument("--repeat", type=int, default=20, help="Number of repeats")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
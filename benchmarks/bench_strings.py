@@ -0,0 +1,93 @@
+"""Microbenchmark for remove_emojis() of discord_bot/util/strings.py."""
+
+import argparse
+import random
+import re
+import timeit
+
+from discord_bot.util import remove_emojis
+
+# Building blocks of the generated video titles
+WORDS = (
+    "Official", "Music", "Video", "Lyrics", "Live", "Remix", "Lo-Fi", "Beats",
+    "Never", "Gonna", "Give", "You", "Up", "(Audio)", "[4K]", "ft.", "Best", "Of",
+    "2024", "Mix", "Cover", "Acoustic", "Session", "米津玄師", "Lemon", "아이유",
+    "Чайковский", "Café", "Über",
+)  # fmt: skip
+EMOJIS = (
+    "🔥", "🎵", "🎶", "❤️", "👍🏽", "👨‍👩‍👧", "🇩🇪", "1️⃣", "✨", "🎉", "🏳️‍🌈", "😂",
+)  # fmt: skip
+
+
+def legacy_remove_emojis(s: str) -> str:
+    """Removes emojis as before (compiles the regex and substitutes each word)."""
+    pattern = re.compile(
+        pattern="["
+        "\U0001f600-\U0001f64f"  # emoticons
+        "\U0001f300-\U0001f5ff"  # symbols & pictographs
+        "\U0001f680-\U0001f6ff"  # transport & map symbols
+        "\U0001f1e0-\U0001f1ff"  # flags (iOS)
+        "\U00002700-\U000027bf"  # Dingbats
+        "\U0001f900-\U0001f9ff"  # Supplemental Symbols and Pictographs
+        "\U00002600-\U000026ff"  # Misc symbols
+        "\U0001fa70-\U0001faff"  # Extended symbols
+        "\U000025a0-\U000025ff"  # Geometric shapes
+        "]+",
+        flags=re.UNICODE,
+    )
+    words = s.split(" ")
+    new_words = []
+    for word in words:
+        new_word = pattern.sub(r"", word)
+        if new_word:
+            new_words.append(new_word)
+    return " ".join(new_words)
+
+
+def generate_titles(size: int, emoji_ratio: float, seed: int = 0) -> list:
+    """Generates video titles, of which emoji_ratio contain emojis."""
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(size):
+        words = rng.choices(WORDS, k=rng.randint(3, 12))
+        if rng.random() < emoji_ratio:
+            for _ in range(rng.randint(1, 3)):
+                words.insert(rng.randint(0, len(words)), rng.choice(EMOJIS))
+        titles.append(" ".join(words))
+    return titles
+
+
+def main():
+    """Runs the microbenchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=5000, help="Number of titles")
+    parser.add_argument(
+        "--emojis", type=float, default=0.2, help="Ratio of titles with emojis"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Number of repeats")
+    args = parser.parse_args()
+
+    titles = generate_titles(args.size, args.emojis)
+
+    legacy_time = min(
+        timeit.repeat(
+            lambda: [legacy_remove_emojis(title) for title in titles],
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+    current_time = min(
+        timeit.repeat(
+            lambda: [remove_emojis(title) for title in titles],
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+    print(f"remove emojis of {args.size} titles ({args.emojis:.0%} with emojis)")
+    print(f"compiled per call: {legacy_time * 1e3:8.3f} ms")
+    print(f"precompiled:       {current_time * 1e3:8.3f} ms")
+    print(f"speedup:           {legacy_time / current_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
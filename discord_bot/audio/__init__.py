@@ -1,6 +1,15 @@
+from discord_bot.audio.cache import MetadataCache
+from discord_bot.audio.extractor import Extractor
 from discord_bot.audio.playlist import AudioSource, Playlist
+from discord_bot.audio.resolver import StreamResolver
 
 
-__all__ = ["AudioSource", "Playlist"]
+__all__ = [
+    "AudioSource",
+    "Extractor",
+    "MetadataCache",
+    "Playlist",
+    "StreamResolver",
+]
 
 assert __all__ == sorted(__all__), f"__all__ needs to be sorted into {sorted(__all__)}!"
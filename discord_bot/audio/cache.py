@@ -0,0 +1,200 @@
+import os
+import sqlite3
+import time
+from typing import Dict
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from discord_bot.util.metrics import METADATA_CACHE_HITS, METADATA_CACHE_MISSES
+
+# Hosts that serve the same YouTube video under different URLs
+YOUTUBE_HOSTS = {
+    "youtube.com",
+    "www.youtube.com",
+    "m.youtube.com",
+    "music.youtube.com",
+    "youtu.be",
+}
+
+# Version of the database schema
+SCHEMA_VERSION = 1
+
+# Query parameters that do not change the requested video
+IGNORED_PARAMS = {"feature", "si", "pp", "ab_channel", "t", "start_radio"}
+
+
+def normalize(url_or_search: str) -> str:
+    """
+    Normalizes an URL or a search term to a cache key.
+
+    YouTube URLs are reduced to the ID of the video, so that different URLs of the
+    same video share the same key. Search terms are lowercased and their whitespaces
+    are collapsed.
+
+    Args:
+        url_or_search (str):
+            Either the URL of the YouTube video or a search term
+
+    Returns:
+        str:
+            The normalized cache key
+    """
+    if not url_or_search.startswith(("https://", "http://")):
+        # Case: Search term
+        return "search:" + " ".join(url_or_search.lower().split())
+
+    # Case: URL
+    parts = urlsplit(url_or_search)
+    host = parts.netloc.lower()
+    params = parse_qsl(parts.query)
+    if host in YOUTUBE_HOSTS:
+        if host == "youtu.be":
+            # Case: Short URL of the video
+            return "youtube:" + parts.path.strip("/")
+        if parts.path.startswith(("/shorts/", "/live/", "/embed/")):
+            # Case: Video ID is part of the path
+            return "youtube:" + parts.path.split("/")[2]
+        for key, value in params:
+            if key == "v":
+                # Case: Video ID is part of the query
+                return "youtube:" + value
+    query = urlencode(sorted((k, v) for k, v in params if k not in IGNORED_PARAMS))
+    return f"url:{host}{parts.path.rstrip('/')}" + (f"?{query}" if query else "")
+
+
+class MetadataCache:
+    """
+    Represents a file-backed cache for the metadata of YouTube videos.
+
+    The metadata is stored in a SQLite database, so that it survives restarts of the
+    bot. Entries expire after ttl seconds and the least recently used entries are
+    evicted, if the cache holds more than max_size entries.
+
+    Attributes:
+        path (str):
+            The path to the SQLite database
+
+        ttl (int):
+            The time in seconds after an entry expires
+
+        max_size (int):
+            The maximum number of entries in the cache
+
+        hits (int):
+            The number of lookups that were found in the cache
+
+        misses (int):
+            The number of lookups that were not found in the cache
+    """
+
+    def __init__(self, path: str = "cache.db", ttl: int = 86400, max_size: int = 1000):
+        if ttl <= 0:
+            raise ValueError("ttl needs to be higher than 0!")
+        if max_size <= 0:
+            raise ValueError("max_size needs to be higher than 0!")
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version < SCHEMA_VERSION:
+            # Case: Cache was created with an older schema
+            self._conn.execute("DROP TABLE IF EXISTS metadata")
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "key TEXT PRIMARY KEY, "
+            "title TEXT NOT NULL, "
+            "yt_url TEXT NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS metadata_accessed_at ON metadata(accessed_at)"
+        )
+
+    def get(self, url_or_search: str) -> Dict[str, str] | None:
+        """
+        Returns the cached metadata of an URL or a search term.
+
+        Args:
+            url_or_search (str):
+                Either the URL of the YouTube video or a search term
+
+        Returns:
+            Dict[str, str] | None:
+                The metadata with the keys title and yt_url or None if the entry is
+                not cached (anymore)
+        """
+        key = normalize(url_or_search)
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT title, yt_url, created_at FROM metadata WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None or row[2] + self.ttl <= now:
+            # Case: Entry is not cached or expired
+            if row is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM metadata WHERE key = ?", (key,))
+            self.misses += 1
+            METADATA_CACHE_MISSES.inc()
+            return None
+
+        # Case: Entry is cached
+        with self._conn:
+            self._conn.execute(
+                "UPDATE metadata SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        self.hits += 1
+        METADATA_CACHE_HITS.inc()
+        return {"title": row[0], "yt_url": row[1]}
+
+    def put(self, url_or_search: str, *, title: str, yt_url: str):
+        """
+        Caches the metadata of an URL or a search term.
+
+        The metadata is stored under the key of the URL or the search term and under
+        the key of the YouTube URL, so that both can be looked up afterwards.
+
+        Args:
+            url_or_search (str):
+                Either the URL of the YouTube video or a search term
+
+            title (str):
+                The title of the YouTube video
+
+            yt_url (str):
+                The URL of the YouTube video
+        """
+        now = time.time()
+        keys = {normalize(url_or_search), normalize(yt_url)}
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?)",
+                [(key, title, yt_url, now, now) for key in keys],
+            )
+            (size,) = self._conn.execute("SELECT COUNT(*) FROM metadata").fetchone()
+            if size > self.max_size:
+                # Case: Evict the least recently used entries
+                self._conn.execute(
+                    "DELETE FROM metadata WHERE key IN ("
+                    "SELECT key FROM metadata ORDER BY accessed_at ASC LIMIT ?)",
+                    (size - self.max_size,),
+                )
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit and miss counters of the cache."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        """Closes the connection to the SQLite database."""
+        self._conn.close()
@@ -0,0 +1,321 @@
+import asyncio
+import multiprocessing
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Hashable, List, Tuple
+
+import yt_dlp
+
+from discord_bot.util.metrics import EXTRACT_SECONDS
+
+# The YoutubeDL instances of the current worker
+_local = threading.local()
+
+# Marks the end of the streamed playlist entries
+_END = object()
+
+
+def _get_ydl(options: Dict[str, Any], flat: bool = False) -> yt_dlp.YoutubeDL:
+    """Returns the (flat) YoutubeDL instance of the worker."""
+    name = "flat_ydl" if flat else "ydl"
+    ydl = getattr(_local, name, None)
+    if ydl is None:
+        # Case: First extraction of the worker
+        if flat:
+            options = {**options, "noplaylist": False, "extract_flat": True}
+        ydl = yt_dlp.YoutubeDL(options)
+        setattr(_local, name, ydl)
+    return ydl
+
+
+def _extract_info(options: Dict[str, Any], url: str, sanitize: bool) -> Dict[str, Any]:
+    """Extracts the information of an URL with the YoutubeDL instance of the worker."""
+    ydl = _get_ydl(options)
+    info = ydl.extract_info(url, download=False)
+    if sanitize:
+        # Case: Information needs to be sent to another process
+        info = ydl.sanitize_info(info)
+    return info
+
+
+def _extract_entries(
+    options: Dict[str, Any],
+    url: str,
+    sanitize: bool,
+    callback: Callable[[Dict[str, Any]], None] | None = None,
+    stop: threading.Event | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Extracts the flat entries of a playlist with the YoutubeDL instance of the worker.
+
+    The entries are fetched page by page. Each entry is passed to the callback as
+    soon as it is fetched. Without a callback, the entries are returned at the end.
+    """
+    ydl = _get_ydl(options, flat=True)
+    info = ydl.extract_info(url, download=False, process=False)
+    while info.get("_type") in ("url", "url_transparent"):
+        # Case: URL redirects to the playlist (e.g. watch?v=...&list=...)
+        info = ydl.extract_info(
+            info["url"], download=False, process=False, ie_key=info.get("ie_key")
+        )
+
+    entries = []
+    for entry in info.get("entries") or []:
+        if stop is not None and stop.is_set():
+            # Case: Consumer does not need any more entries
+            break
+        if sanitize:
+            entry = ydl.sanitize_info(entry)
+        if callback is None:
+            entries.append(entry)
+        else:
+            callback(entry)
+    return entries
+
+
+@dataclass
+class _Job:
+    """Represents a pending extraction."""
+
+    args: Tuple
+    future: asyncio.Future
+    url: str
+    timeout: bool = True
+    started: bool = False
+    timer: asyncio.TimerHandle | None = None
+
+
+class Extractor:
+    """
+    Represents a dedicated pool of workers to extract information with yt-dlp.
+
+    Each worker owns its own YoutubeDL instance. Pending extractions are queued per
+    Discord Server and dispatched in a round-robin fashion, so that a burst of
+    extractions from one Discord Server does not starve the others.
+
+    Attributes:
+        options (Dict[str, Any]):
+            The options of the YoutubeDL instances
+
+        workers (int):
+            The number of workers
+
+        mode (str):
+            The type of workers, either "thread" or "process"
+
+        timeout (float):
+            The time in seconds after a running extraction is cancelled
+
+        queue_timeout (float):
+            The time in seconds after a queued extraction, that did not start yet, is
+            cancelled
+    """
+
+    def __init__(
+        self,
+        options: Dict[str, Any],
+        workers: int = 4,
+        mode: str = "thread",
+        timeout: float = 30,
+        queue_timeout: float = 300,
+    ):
+        if workers <= 0:
+            raise ValueError("workers needs to be higher than 0!")
+        if mode not in ("thread", "process"):
+            raise ValueError("mode needs to be either 'thread' or 'process'!")
+        if timeout <= 0:
+            raise ValueError("timeout needs to be higher than 0!")
+        if queue_timeout <= 0:
+            raise ValueError("queue_timeout needs to be higher than 0!")
+
+        self.options = options
+        self.workers = workers
+        self.mode = mode
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+
+        self._executor: Executor
+        if mode == "thread":
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="yt-dlp"
+            )
+        else:
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        self._pending: OrderedDict[Hashable, Deque[_Job]] = OrderedDict()
+        self._running = 0
+
+    @EXTRACT_SECONDS.time()
+    async def extract(self, url: str, guild_id: Hashable = None) -> Dict[str, Any]:
+        """
+        Extracts the information of an URL or a search term.
+
+        Args:
+            url (str):
+                Either the URL of the YouTube video or a search term
+
+            guild_id (Hashable):
+                The ID of the Discord Server that requested the extraction
+
+        Returns:
+            Dict[str, Any]:
+                The extracted information
+        """
+        job = self._submit(
+            (_extract_info, self.options, url, self.mode == "process"), guild_id, url
+        )
+        try:
+            return await job.future
+        finally:
+            # Case: Drop the extraction, if it is still queued
+            job.future.cancel()
+
+    async def iterate(
+        self, url: str, guild_id: Hashable = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Extracts the flat entries (ID, URL and title) of a playlist.
+
+        The entries are yielded as they stream in, so that the consumer does not need
+        to wait for the whole playlist. With process workers, all entries arrive at
+        once after the playlist was extracted.
+
+        Args:
+            url (str):
+                The URL of the YouTube playlist
+
+            guild_id (Hashable):
+                The ID of the Discord Server that requested the extraction
+
+        Yields:
+            Dict[str, Any]:
+                The flat entry of each video in the playlist
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        stop = threading.Event()
+        if self.mode == "thread":
+            # Case: Entries are streamed from the worker thread
+            args = (
+                _extract_entries,
+                self.options,
+                url,
+                False,
+                lambda entry: loop.call_soon_threadsafe(queue.put_nowait, entry),
+                stop,
+            )
+        else:
+            # Case: Entries are returned from the worker process at once
+            args = (_extract_entries, self.options, url, True)
+
+        def done(future: asyncio.Future):
+            if not future.cancelled() and future.exception() is None:
+                for entry in future.result():
+                    queue.put_nowait(entry)
+            queue.put_nowait(_END)
+
+        # The whole playlist may take longer than the timeout, but each entry may not
+        job = self._submit(args, guild_id, url, timeout=False)
+        future = job.future
+        future.add_done_callback(done)
+        try:
+            while True:
+                try:
+                    entry = await asyncio.wait_for(queue.get(), self.timeout)
+                except asyncio.TimeoutError:
+                    if not job.started:
+                        # Case: Extraction is still queued (until the queue_timeout)
+                        continue
+                    raise yt_dlp.utils.DownloadError(
+                        f"Extraction of {url} timed out after {self.timeout} seconds!"
+                    )
+                if entry is _END:
+                    break
+                yield entry
+            if not future.cancelled() and future.exception() is not None:
+                raise future.exception()
+        finally:
+            stop.set()
+            future.cancel()
+
+    def _submit(
+        self, args: Tuple, guild_id: Hashable, url: str, timeout: bool = True
+    ) -> _Job:
+        """Queues a job for the workers and returns it."""
+        loop = asyncio.get_running_loop()
+        job = _Job(args=args, future=loop.create_future(), url=url, timeout=timeout)
+        job.timer = loop.call_later(
+            self.queue_timeout,
+            self._expire,
+            job,
+            f"Extraction of {url} was queued for {self.queue_timeout} seconds!",
+        )
+        self._pending.setdefault(guild_id, deque()).append(job)
+        self._dispatch()
+        return job
+
+    def _expire(self, job: _Job, message: str):
+        """Fails an extraction, that was queued or running for too long."""
+        if not job.future.done():
+            job.future.set_exception(yt_dlp.utils.DownloadError(message))
+
+    def _dispatch(self):
+        """Starts the pending extractions in round-robin order of the servers."""
+        loop = asyncio.get_running_loop()
+        while self._running < self.workers and self._pending:
+            guild_id, jobs = self._pending.popitem(last=False)
+            job = jobs.popleft()
+            if jobs:
+                # Case: Server has more pending jobs - move it to the end of the queue
+                self._pending[guild_id] = jobs
+            if job.future.done():
+                # Case: Extraction was cancelled or expired in the queue
+                continue
+
+            # The timeout only starts, when a worker picks up the extraction
+            job.timer.cancel()
+            job.started = True
+            if job.timeout:
+                job.timer = loop.call_later(
+                    self.timeout,
+                    self._expire,
+                    job,
+                    f"Extraction of {job.url} timed out after {self.timeout} seconds!",
+                )
+            self._running += 1
+            future = loop.run_in_executor(self._executor, *job.args)
+            future.add_done_callback(lambda f, job=job: self._done(job, f))
+
+    def _done(self, job: _Job, future: asyncio.Future):
+        """Forwards the result of a finished extraction and starts the next one."""
+        self._running -= 1
+        job.timer.cancel()
+        if not job.future.done():
+            if future.cancelled():
+                job.future.cancel()
+            elif future.exception() is not None:
+                job.future.set_exception(future.exception())
+            else:
+                job.future.set_result(future.result())
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the number of running and queued extractions (per server)."""
+        queued = {guild_id: len(jobs) for guild_id, jobs in self._pending.items()}
+        return {
+            "running": self._running,
+            "queued": sum(queued.values()),
+            "queued_per_guild": queued,
+        }
+
+    def close(self):
+        """Shuts down the workers and cancels all queued extractions."""
+        for jobs in self._pending.values():
+            for job in jobs:
+                job.timer.cancel()
+                job.future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,9 +1,14 @@
 import asyncio
-import heapq
+import itertools
 from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Set, Tuple
 
+from sortedcontainers import SortedList
 
-@dataclass(order=True)
+from discord_bot.util.metrics import PLAYLIST_SECONDS
+
+
+@dataclass
 class AudioSource:
     """
     Represents an audio source (item) from a YouTube video.
@@ -15,36 +20,68 @@ class AudioSource:
         user (str):
             The user who requested the YouTube video.
 
-        stream_url (str):
-            The URL of the audio stream.
-
         yt_url (str):
             The URL of the YouTube video.
 
         priority (int):
             The priority of the audio file.
             Lower values represents higher priorities.
+
+        stream_url (str | None):
+            The URL of the audio stream.
+            None if the stream is not resolved yet.
+
+        codec (str | None):
+            The audio codec of the audio stream.
+            None if the stream is not resolved yet.
     """
 
     title: str = field(compare=False)
     user: str = field(compare=False)
-    stream_url: str = field(compare=False)
     yt_url: str = field(compare=False)
     priority: int
+    stream_url: str | None = field(default=None, compare=False)
+    codec: str | None = field(default=None, compare=False)
 
 
 class Playlist:
-    """Represents a playlist of audio sources."""
+    """
+    Represents a playlist of audio sources.
+
+    The audio sources are stored as (priority, sequence number, audio source) tuples,
+    indexed by their sequence number and by the YouTube URL of their audio source.
+    The monotonic sequence number keeps audio sources with the same priority in FIFO
+    order and makes each (priority, sequence number) key unique.
+
+    The keys are kept in a SortedList, so that adding, popping, removing and
+    selecting the entry at a position take O(log n). Moved entries get a new
+    sequence number, that is unique among all entries.
+
+    Each successful mutation is passed as (operation, *arguments) to the optional
+    journal, so that the playlist can be rebuilt by replaying the same mutations.
+    """
 
-    def __init__(self, max_size: int | None = None):
-        self._playlist = []
+    def __init__(
+        self,
+        max_size: int | None = None,
+        journal: Callable[..., None] | None = None,
+    ):
+        self._order: SortedList = SortedList()
+        self._entries: Dict[float, Tuple[int, float, AudioSource]] = {}
+        self._urls: Dict[str, Set[float]] = {}
         self._max_size = max_size
+        self._counter = itertools.count()
+        self._front_counter = itertools.count(-1, -1)
         self._lock = asyncio.Lock()
+        self._journal = journal
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
     async def empty(self) -> bool:
         """Checks whether the playlist has no audio sources stored."""
         async with self._lock:
-            return len(self._playlist) == 0
+            return len(self._entries) == 0
 
     async def full(self) -> bool:
         """Checks whether the playlist has reached the max amount of audio sources."""
@@ -52,30 +89,213 @@ class Playlist:
             if self._max_size is None:
                 return False
             else:
-                return len(self._playlist) == self._max_size
+                return len(self._entries) == self._max_size
 
     async def clear(self):
         """Removes all stored audio sources from the playlist."""
         async with self._lock:
-            self._playlist = []
+            self._order = SortedList()
+            self._entries = {}
+            self._urls = {}
+            self._record("clear")
 
+    @PLAYLIST_SECONDS.time("add")
     async def add(self, audio_source: AudioSource):
         """Adds an audio source to the playlist."""
         async with self._lock:
-            if self._max_size is not None and len(self._playlist) >= self._max_size:
+            if self._max_size is not None and len(self._entries) >= self._max_size:
                 raise ValueError(
                     "The playlist has reached the maximum limit of audio sources!"
                 )
-            heapq.heappush(self._playlist, audio_source)
+            self._push((audio_source.priority, next(self._counter), audio_source))
+            self._record("add", audio_source)
 
+    @PLAYLIST_SECONDS.time("pop")
     async def pop(self) -> AudioSource:
         """Removes and returns the next audio source from the playlist."""
         async with self._lock:
-            return heapq.heappop(self._playlist)
+            if not self._order:
+                raise IndexError("The playlist has no audio sources!")
+            entry = self._select(1)
+            self._unindex(entry)
+            self._record("pop")
+            return entry[2]
+
+    @PLAYLIST_SECONDS.time("remove")
+    async def remove(self, position: int) -> AudioSource:
+        """
+        Removes and returns the audio source at the given position.
+
+        Args:
+            position (int):
+                The position (starting from 1) of the audio source
+
+        Returns:
+            AudioSource:
+                The removed audio source
+        """
+        async with self._lock:
+            entry = self._select(position)
+            self._unindex(entry)
+            self._record("remove", position)
+            return entry[2]
+
+    @PLAYLIST_SECONDS.time("move")
+    async def move(self, position: int, new_position: int) -> AudioSource:
+        """
+        Moves the audio source from the given position to the new position.
+
+        The moved audio source takes over the priority of its new neighbours.
+
+        Args:
+            position (int):
+                The current position (starting from 1) of the audio source
+
+            new_position (int):
+                The new position (starting from 1) of the audio source
+
+        Returns:
+            AudioSource:
+                The moved audio source
+        """
+        async with self._lock:
+            audio_source = self._move(position, new_position)
+            self._record("move", position, new_position)
+            return audio_source
+
+    @PLAYLIST_SECONDS.time("dedupe")
+    async def dedupe(self) -> int:
+        """
+        Removes the audio sources with the same YouTube URL, except of the first one.
+
+        Returns:
+            int:
+                The number of removed audio sources
+        """
+        async with self._lock:
+            duplicates = []
+            for seqs in self._urls.values():
+                if len(seqs) > 1:
+                    entries = sorted(self._entries[seq] for seq in seqs)
+                    duplicates.extend(entries[1:])
+            for entry in duplicates:
+                self._unindex(entry)
+            self._record("dedupe")
+            return len(duplicates)
+
+    async def size(self) -> int:
+        """Returns the number of stored audio sources."""
+        async with self._lock:
+            return len(self._entries)
+
+    @PLAYLIST_SECONDS.time("peek")
+    async def peek(self, n: int, offset: int = 0) -> List[AudioSource]:
+        """
+        Returns the audio sources at positions offset, ..., offset + n - 1 without
+        removing them from the playlist.
+
+        Only the selected slice of the sorted keys is copied under the lock.
+
+        Args:
+            n (int):
+                The number of audio sources to return
+
+            offset (int):
+                The number of next audio sources to skip
+
+        Returns:
+            List[AudioSource]:
+                The audio sources in the order they are played
+        """
+        async with self._lock:
+            return [
+                self._entries[seq][2]
+                for _, seq in self._order.islice(offset, offset + n)
+            ]
 
     async def iterate(self):
         """Asynchronously iterates over all items in the playlist."""
         async with self._lock:
-            playlist = heapq.nsmallest(len(self._playlist), self._playlist)
-            for i, item in enumerate(playlist, 0):
-                yield i, item
+            snapshot = [self._entries[seq][2] for _, seq in self._order]
+        for i, item in enumerate(snapshot, 0):
+            yield i, item
+
+    def snapshot(self) -> List[AudioSource]:
+        """
+        Returns all audio sources in the order they are played.
+
+        The snapshot is taken without awaiting the lock, so that no mutation can be
+        journaled in between of taking the snapshot and using it.
+        """
+        return [self._entries[seq][2] for _, seq in self._order]
+
+    def _record(self, operation: str, *args):
+        """Passes a successful mutation to the journal."""
+        if self._journal is not None:
+            self._journal(operation, *args)
+
+    def _push(self, entry: Tuple[int, float, AudioSource]):
+        """Adds an entry to the sorted keys and indexes it."""
+        self._order.add(entry[:2])
+        self._entries[entry[1]] = entry
+        self._urls.setdefault(entry[2].yt_url, set()).add(entry[1])
+
+    def _unindex(self, entry: Tuple[int, float, AudioSource]):
+        """Deletes an entry from the sorted keys and the index."""
+        self._order.remove(entry[:2])
+        del self._entries[entry[1]]
+        seqs = self._urls[entry[2].yt_url]
+        seqs.discard(entry[1])
+        if not seqs:
+            del self._urls[entry[2].yt_url]
+
+    def _select(self, position: int) -> Tuple[int, float, AudioSource]:
+        """Returns the entry at the given position (starting from 1)."""
+        if position < 1 or position > len(self._order):
+            raise IndexError(f"There is no audio source at position {position}!")
+        return self._entries[self._order[position - 1][1]]
+
+    def _move(self, position: int, new_position: int) -> AudioSource:
+        """Moves the entry from the given position to the new position."""
+        entry = self._select(position)
+        if new_position < 1 or new_position > len(self._order):
+            raise IndexError(f"There is no audio source at position {new_position}!")
+        if position == new_position:
+            return entry[2]
+
+        # Get the neighbours of the new position (without the moved entry)
+        def neighbour(i: int) -> Tuple[int, float] | None:
+            if i < 0 or i >= len(self._order) - 1:
+                return None
+            return self._order[i if i < position - 1 else i + 1]
+
+        prev_key = neighbour(new_position - 2)
+        next_key = neighbour(new_position - 1)
+
+        if prev_key is None:
+            # Case: Move to the front
+            priority, seq = next_key[0], next(self._front_counter)
+        elif next_key is None or prev_key[0] != next_key[0]:
+            # Case: Move to the end of the priority of the previous entry
+            priority, seq = prev_key[0], next(self._counter)
+        else:
+            # Case: Move in between of two entries with the same priority
+            priority, seq = prev_key[0], (prev_key[1] + next_key[1]) / 2
+            if seq in self._entries:
+                # Case: No unique sequence number left - renumber all entries
+                self._renumber()
+                return self._move(position, new_position)
+
+        self._unindex(entry)
+        entry[2].priority = priority
+        self._push((priority, seq, entry[2]))
+        return entry[2]
+
+    def _renumber(self):
+        """Assigns new consecutive sequence numbers to all entries."""
+        entries = [self._entries[seq] for _, seq in self._order]
+        self._order = SortedList()
+        self._entries = {}
+        self._urls = {}
+        for priority, _, item in entries:
+            self._push((priority, next(self._counter), item))
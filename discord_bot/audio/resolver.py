@@ -0,0 +1,100 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict
+from urllib.parse import parse_qs, urlsplit
+
+from discord_bot.audio.playlist import AudioSource
+
+
+def parse_expiry(stream_url: str) -> float | None:
+    """
+    Returns the expiry timestamp of a (signed) audio stream URL.
+
+    YouTube stores the expiry either as query parameter (...&expire=<ts>&...) or as
+    part of the path (.../expire/<ts>/...).
+
+    Args:
+        stream_url (str):
+            The URL of the audio stream
+
+    Returns:
+        float | None:
+            The expiry as UNIX timestamp or None if the URL does not expire
+    """
+    parts = urlsplit(stream_url)
+    expire = parse_qs(parts.query).get("expire")
+    if expire:
+        # Case: Expiry is part of the query
+        return float(expire[0])
+    segments = parts.path.split("/")
+    if "expire" in segments:
+        # Case: Expiry is part of the path
+        index = segments.index("expire") + 1
+        if index < len(segments) and segments[index].isdigit():
+            return float(segments[index])
+    return None
+
+
+class StreamResolver:
+    """
+    Resolves the audio stream URLs of audio sources right before they are played.
+
+    Concurrent resolutions of the same YouTube video share a single extraction.
+
+    Attributes:
+        extract (Callable[[str], Awaitable[Dict[str, Any]]]):
+            The coroutine function to extract the information of a YouTube video
+
+        margin (int):
+            The time in seconds before the expiry, where a stream URL gets refreshed
+    """
+
+    def __init__(
+        self,
+        extract: Callable[[str], Awaitable[Dict[str, Any]]],
+        margin: int = 600,
+    ):
+        if margin < 0:
+            raise ValueError("margin needs to be higher than or equal to 0!")
+
+        self.extract = extract
+        self.margin = margin
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def expired(self, audio_source: AudioSource) -> bool:
+        """Checks whether the stream URL of the audio source needs to be resolved."""
+        if audio_source.stream_url is None:
+            return True
+        expiry = parse_expiry(audio_source.stream_url)
+        return expiry is not None and expiry - self.margin <= time.time()
+
+    async def resolve(self, audio_source: AudioSource) -> AudioSource:
+        """
+        Resolves the stream URL of the audio source, if it is missing or expires soon.
+
+        Args:
+            audio_source (AudioSource):
+                The audio source to resolve
+
+        Returns:
+            AudioSource:
+                The same audio source with a valid stream URL
+        """
+        if not self.expired(audio_source):
+            # Case: Stream URL is still valid
+            return audio_source
+
+        yt_url = audio_source.yt_url
+        future = self._inflight.get(yt_url)
+        if future is None:
+            # Case: No other resolution of the same video is running
+            future = asyncio.ensure_future(self.extract(yt_url))
+            future.add_done_callback(lambda _: self._inflight.pop(yt_url, None))
+            self._inflight[yt_url] = future
+
+        # Shield the extraction, so that a cancelled caller does not cancel it for
+        # the other callers
+        data = await asyncio.shield(future)
+        audio_source.stream_url = data["url"]
+        audio_source.codec = data.get("acodec")
+        return audio_source
@@ -0,0 +1,15 @@
+from discord_bot.chat.cache import ResponseCache, normalize
+from discord_bot.chat.memory import ConversationMemory, Turn
+from discord_bot.chat.scheduler import ChatScheduler, Overloaded
+
+
+__all__ = [
+    "ChatScheduler",
+    "ConversationMemory",
+    "Overloaded",
+    "ResponseCache",
+    "Turn",
+    "normalize",
+]
+
+assert __all__ == sorted(__all__), f"__all__ needs to be sorted into {sorted(__all__)}!"
@@ -0,0 +1,112 @@
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+from discord_bot.util.metrics import CHAT_CACHE_HITS, CHAT_CACHE_MISSES
+
+
+def normalize(message: str) -> str:
+    """Normalizes a message, so that trivially different messages are equal."""
+    return " ".join(message.lower().split())
+
+
+class ResponseCache:
+    """
+    Represents the recent responses of the chat model to stateless messages.
+
+    Responses are keyed by the model, the system prompt and the normalized message.
+    Entries expire after ttl seconds and the least recently used entries above
+    max_size are evicted.
+
+    Attributes:
+        max_size (int):
+            The maximum number of cached responses
+
+        ttl (float):
+            The time in seconds after a cached response expires
+
+        hits (int):
+            The number of lookups that returned a cached response
+
+        misses (int):
+            The number of lookups that did not return a cached response
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 600):
+        if max_size <= 0:
+            raise ValueError("max_size needs to be higher than 0!")
+        if ttl <= 0:
+            raise ValueError("ttl needs to be higher than 0!")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Tuple[str, str, str], Tuple[float, str]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the fraction of lookups that returned a cached response."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, model: str, system: str, message: str) -> str | None:
+        """
+        Returns the cached response to a message.
+
+        Args:
+            model (str):
+                The name of the chat model
+
+            system (str):
+                The system prompt of the chat model
+
+            message (str):
+                The message of the user
+
+        Returns:
+            str | None:
+                The cached response (None if it is not cached or expired)
+        """
+        key = (model, system, normalize(message))
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            # Case: Response is not cached (anymore)
+            self._entries.pop(key, None)
+            self.misses += 1
+            CHAT_CACHE_MISSES.inc()
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        CHAT_CACHE_HITS.inc()
+        return entry[1]
+
+    def put(self, model: str, system: str, message: str, response: str):
+        """
+        Caches the response to a message.
+
+        Args:
+            model (str):
+                The name of the chat model
+
+            system (str):
+                The system prompt of the chat model
+
+            message (str):
+                The message of the user
+
+            response (str):
+                The response of the chat model
+        """
+        key = (model, system, normalize(message))
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            # Case: Evict the least recently used response
+            self._entries.popitem(last=False)
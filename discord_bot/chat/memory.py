@@ -0,0 +1,209 @@
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Deque, Dict, List
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimates the number of tokens of a text (roughly four characters each)."""
+    return len(text) // 4 + 1
+
+
+@dataclass
+class Turn:
+    """
+    Represents a single message of a conversation.
+
+    Attributes:
+        role (str):
+            The author of the message, either "user" or "assistant"
+
+        content (str):
+            The content of the message
+
+        tokens (int):
+            The estimated number of tokens of the message
+    """
+
+    role: str
+    content: str
+    tokens: int = field(init=False)
+
+    def __post_init__(self):
+        self.tokens = estimate_tokens(self.content)
+
+
+@dataclass
+class _Conversation:
+    """Represents the recent turns and the summary of the older turns."""
+
+    turns: Deque[Turn]
+    summary: str = ""
+    dropped: List[Turn] = field(default_factory=list)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class ConversationMemory:
+    """
+    Represents the bounded conversation history of each Discord channel.
+
+    The turns of each channel are kept in a ring buffer, so that the oldest turns are
+    dropped first. Dropped turns can optionally be folded into a summary of the
+    conversation. Only the most recent turns that fit into the token budget are sent
+    to the chat model. Conversations that were idle for longer than ttl seconds and
+    the least recently used conversations above max_channels are evicted.
+
+    Attributes:
+        max_turns (int):
+            The maximum number of turns kept per channel
+
+        max_tokens (int):
+            The maximum number of (estimated) tokens of the history sent to the model
+
+        ttl (float):
+            The time in seconds after an idle conversation is evicted
+
+        max_channels (int):
+            The maximum number of channels with a conversation
+
+        summarize (Callable[[str, List[Turn]], Awaitable[str]] | None):
+            The coroutine function to fold dropped turns into the summary (None
+            disables summarization)
+    """
+
+    def __init__(
+        self,
+        max_turns: int = 20,
+        max_tokens: int = 1024,
+        ttl: float = 3600,
+        max_channels: int = 1000,
+        summarize: Callable[[str, List[Turn]], Awaitable[str]] | None = None,
+    ):
+        if max_turns <= 0:
+            raise ValueError("max_turns needs to be higher than 0!")
+        if max_tokens <= 0:
+            raise ValueError("max_tokens needs to be higher than 0!")
+        if ttl <= 0:
+            raise ValueError("ttl needs to be higher than 0!")
+        if max_channels <= 0:
+            raise ValueError("max_channels needs to be higher than 0!")
+
+        self.max_turns = max_turns
+        self.max_tokens = max_tokens
+        self.ttl = ttl
+        self.max_channels = max_channels
+        self.summarize = summarize
+        self._conversations: OrderedDict[int, _Conversation] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._conversations)
+
+    def messages(self, channel_id: int, system: str, message: str) -> List[Dict]:
+        """
+        Returns the messages for the chat model, including the recent history.
+
+        Args:
+            channel_id (int):
+                The ID of the Discord channel
+
+            system (str):
+                The system prompt of the chat model
+
+            message (str):
+                The new message of the user
+
+        Returns:
+            List[Dict]:
+                The system prompt, the summary, the recent turns within the token
+                budget and the new message
+        """
+        self.evict_idle()
+        conversation = self._conversations.get(channel_id)
+        if conversation is None:
+            # Case: Channel has no conversation (anymore)
+            return [
+                {"role": "system", "content": system},
+                {"role": "user", "content": message},
+            ]
+
+        if conversation.summary:
+            # Case: Add the older turns as part of the system prompt
+            system = f"{system}\n\nSummary of the conversation:\n{conversation.summary}"
+
+        # Take the newest turns that fit into the token budget
+        budget = self.max_tokens - estimate_tokens(system) - estimate_tokens(message)
+        history: List[Turn] = []
+        for turn in reversed(conversation.turns):
+            budget -= turn.tokens
+            if budget < 0:
+                break
+            history.append(turn)
+
+        return (
+            [{"role": "system", "content": system}]
+            + [
+                {"role": turn.role, "content": turn.content}
+                for turn in reversed(history)
+            ]
+            + [{"role": "user", "content": message}]
+        )
+
+    async def append(self, channel_id: int, message: str, response: str):
+        """
+        Stores a message of the user and the response of the chat model.
+
+        Args:
+            channel_id (int):
+                The ID of the Discord channel
+
+            message (str):
+                The message of the user
+
+            response (str):
+                The response of the chat model
+        """
+        conversation = self._conversations.get(channel_id)
+        if conversation is None:
+            # Case: First turn of the channel
+            conversation = _Conversation(turns=deque(maxlen=self.max_turns))
+            self._conversations[channel_id] = conversation
+        self._conversations.move_to_end(channel_id)
+        conversation.last_used = time.monotonic()
+
+        for turn in (Turn("user", message), Turn("assistant", response)):
+            if self.summarize is not None and len(conversation.turns) == self.max_turns:
+                # Case: Oldest turn gets dropped from the ring buffer
+                conversation.dropped.append(conversation.turns[0])
+            conversation.turns.append(turn)
+
+        if len(conversation.dropped) >= max(2, self.max_turns // 2):
+            # Case: Fold the dropped turns into the summary (in batches, so that the
+            # chat model is not called for every turn)
+            dropped, conversation.dropped = conversation.dropped, []
+            conversation.summary = await self.summarize(conversation.summary, dropped)
+
+        while len(self._conversations) > self.max_channels:
+            # Case: Evict the least recently used conversation
+            self._conversations.popitem(last=False)
+
+    def has_history(self, channel_id: int) -> bool:
+        """Returns whether a Discord channel has a (not idle) conversation."""
+        self.evict_idle()
+        return channel_id in self._conversations
+
+    def clear(self, channel_id: int):
+        """Forgets the conversation of a Discord channel."""
+        self._conversations.pop(channel_id, None)
+
+    def evict_idle(self) -> int:
+        """Evicts the conversations that were idle for longer than ttl seconds."""
+        deadline = time.monotonic() - self.ttl
+        evicted = 0
+        while self._conversations:
+            channel_id, conversation = next(iter(self._conversations.items()))
+            if conversation.last_used > deadline:
+                # Case: Remaining conversations were used more recently
+                break
+            del self._conversations[channel_id]
+            evicted += 1
+        return evicted
@@ -0,0 +1,110 @@
+import asyncio
+from collections import Counter
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class Overloaded(Exception):
+    """Raised when the scheduler rejects a request instead of queueing it."""
+
+
+class ChatScheduler:
+    """
+    Represents the admission control of the requests to the chat model.
+
+    At most max_concurrency requests are generated at once and at most max_queue
+    requests wait for their turn. Each user can have at most max_per_user requests
+    queued or running. Further requests are rejected right away, instead of letting
+    the latency of everyone grow. Identical requests (same key) that arrive while
+    the first one is still queued or running share its result.
+
+    Attributes:
+        max_concurrency (int):
+            The maximum number of requests that are generated at once
+
+        max_per_user (int):
+            The maximum number of queued or running requests of each user
+
+        max_queue (int):
+            The maximum number of requests that wait for their turn
+    """
+
+    def __init__(
+        self, max_concurrency: int = 2, max_per_user: int = 1, max_queue: int = 8
+    ):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency needs to be higher than 0!")
+        if max_per_user <= 0:
+            raise ValueError("max_per_user needs to be higher than 0!")
+        if max_queue < 0:
+            raise ValueError("max_queue needs to be higher than or equal to 0!")
+
+        self.max_concurrency = max_concurrency
+        self.max_per_user = max_per_user
+        self.max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._per_user: Counter = Counter()
+        self._pending = 0
+
+    async def run(
+        self,
+        key: Hashable,
+        user_id: int,
+        generate: Callable[[], Awaitable[T]],
+    ) -> Tuple[T, bool]:
+        """
+        Runs the request or joins an identical request that is already in flight.
+
+        Args:
+            key (Hashable):
+                The key of identical requests (e.g. channel and normalized prompt)
+
+            user_id (int):
+                The ID of the user who sent the request
+
+            generate (Callable[[], Awaitable[T]]):
+                The coroutine function to generate the result
+
+        Returns:
+            Tuple[T, bool]:
+                The result and whether it was shared from an identical request
+
+        Raises:
+            Overloaded:
+                If the user or the queue has reached the limit
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            # Case: Identical request is in flight - wait for its result
+            return await asyncio.shield(future), True
+
+        if self._per_user[user_id] >= self.max_per_user:
+            raise Overloaded("Please wait for your previous message to be answered!")
+        if self._pending >= self.max_concurrency + self.max_queue:
+            raise Overloaded("Too many messages at once, please try again later!")
+
+        future = asyncio.get_running_loop().create_future()
+        # Retrieve the exception, even if no identical request waits for it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        self._per_user[user_id] += 1
+        self._pending += 1
+        try:
+            async with self._semaphore:
+                result = await generate()
+            future.set_result(result)
+            return result, False
+        except BaseException as error:
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+            raise
+        finally:
+            self._pending -= 1
+            self._per_user[user_id] -= 1
+            if self._per_user[user_id] == 0:
+                del self._per_user[user_id]
+            del self._inflight[key]
@@ -1,9 +1,12 @@
 """Checks for the discord bot."""
 
-from typing import Dict, List
+import enum
+from typing import Awaitable, Callable, Collection, Dict, List, Tuple
 
 from discord.ext import commands
 
+from discord_bot.permission import PermissionIndex
+
 
 async def check_author_voice_channel(ctx: commands.Context):
     """Raises an error if the author is not in a voice channel."""
@@ -53,11 +56,10 @@ async def check_author_admin(ctx: commands.Context):
 
 async def check_author_id_blacklisted(
     ctx: commands.Context,
-    users: Dict[str, List[int]],
+    users: Dict[str, Collection[int]],
 ):
     """Raises an error if the author is blacklisted."""
-    blacklisted = all(user_id != ctx.author.id for user_id in users[ctx.command.name])
-    if not blacklisted:
+    if ctx.author.id in users[ctx.command.name]:
         # Case: Author is blacklisted
         await ctx.send("❌ You are blacklisted from using this command!")
         raise commands.CommandError("The author is blacklisted!")
@@ -65,18 +67,20 @@ async def check_author_id_blacklisted(
 
 async def check_author_role_blacklisted(
     ctx: commands.Context,
-    roles: Dict[str, List[int]],
+    roles: Dict[str, Collection[int]],
+    index: PermissionIndex | None = None,
 ):
-    """Raises an error if the (highest) author role is blacklisted."""
-    __ROLES__ = {
-        role.id: (priority, role)
-        for priority, role in enumerate(reversed(ctx.guild.roles))
-    }
-    blacklisted = all(
-        __ROLES__[role_id][0] > __ROLES__[ctx.author.roles[-1].id][0]
-        for role_id in roles[ctx.command.name]
-    )
-    if not blacklisted:
+    """
+    Raises an error if the (highest) author role is blacklisted.
+
+    With an index, the cached ranks of the roles are used instead of the given roles.
+    """
+    if index is None:
+        # Case: Build a temporary index of the given roles
+        index = PermissionIndex(
+            users={}, roles=roles, text_channels={}, voice_channels={}
+        )
+    if index.role_blacklisted(ctx.guild, ctx.command.name, ctx.author.roles[-1].id):
         # Case: Role of Author is blacklisted
         await ctx.send("❌ You do not have the required role to use this command!")
         raise commands.CommandError("The role of the author is blacklisted!")
@@ -84,14 +88,10 @@ async def check_author_role_blacklisted(
 
 async def check_text_channel_blacklisted(
     ctx: commands.Context,
-    text_channels: Dict[str, List[int]],
+    text_channels: Dict[str, Collection[int]],
 ):
     """Raises an error if the text channel is blacklisted."""
-    blacklisted = all(
-        text_channel_id != ctx.channel.id
-        for text_channel_id in text_channels[ctx.command.name]
-    )
-    if not blacklisted:
+    if ctx.channel.id in text_channels[ctx.command.name]:
         # Case: Command is not executed in the required text channel
         await ctx.send("❌ Please use this command in a non-blacklisted text channel!")
         raise commands.CommandError("The text channel of the command is blacklisted!")
@@ -99,14 +99,11 @@ async def check_text_channel_blacklisted(
 
 async def check_voice_channel_blacklisted(
     ctx: commands.Context,
-    voice_channels: Dict[str, List[int]],
+    voice_channels: Dict[str, Collection[int]],
 ):
     """Raises an error if the voice channel is blacklisted."""
-    blacklisted = all(
-        voice_channel_id != ctx.author.voice.channel.id
-        for voice_channel_id in voice_channels[ctx.command.name]
-    )
-    if not blacklisted:
+    voice = ctx.author.voice
+    if voice is not None and voice.channel.id in voice_channels[ctx.command.name]:
         # Case: Command is not executed in the required text channel
         await ctx.send("❌ Please use this command in a non-blacklisted voice channel!")
         raise commands.CommandError("The voice channel of the command is blacklisted!")
@@ -120,6 +117,22 @@ async def check_valid_n(ctx: commands.Context, n: int):
         raise commands.CommandError("n is not higher than or equal to 0!")
 
 
+async def check_valid_page(ctx: commands.Context, page: int):
+    """Raises an error if the page is not higher than or equal to 1."""
+    if page < 1:
+        # Case: page is not higher than or equal to 1
+        await ctx.send("❌ Please provide a page higher than or equal to 1!")
+        raise commands.CommandError("page is not higher than or equal to 1!")
+
+
+async def check_valid_position(ctx: commands.Context, position: int, size: int):
+    """Raises an error if the position is not in between of 1 and the playlist size."""
+    if position < 1 or position > size:
+        # Case: No audio source at the position
+        await ctx.send(f"❌ Please provide a position between 1 and {size}!")
+        raise commands.CommandError("position is not in between of 1 and size!")
+
+
 async def check_valid_url(ctx: commands.Context, url: str):
     """Raises an error if the URL is not a valid YouTube URL."""
     if url.startswith("https://") or url.startswith("http://"):
@@ -218,3 +231,123 @@ async def check_less_equal_author(ctx: commands.Context, role_ids: List[int]):
         # Case: Author role is higher than the given roles
         await ctx.send("❌ Your role is lower than the given roles!")
         raise commands.CommandError("Author role is lower than the given roles!")
+
+
+class Requirement(enum.IntEnum):
+    """
+    Represents a requirement of a command before it gets performed.
+
+    The requirements are evaluated in the order of their values, so that cheap
+    requirements are checked first and each requirement can rely on the previous ones.
+    """
+
+    AUTHOR_NOT_BLACKLISTED = 0
+    TEXT_CHANNEL_NOT_BLACKLISTED = 1
+    VOICE_CHANNEL_NOT_BLACKLISTED = 2
+    ROLE_NOT_BLACKLISTED = 3
+    AUTHOR_IN_VOICE_CHANNEL = 4
+    BOT_IN_VOICE_CHANNEL = 5
+    SAME_VOICE_CHANNEL = 6
+    BOT_STREAMING = 7
+
+
+# The check of each requirement
+CHECKS: Dict[
+    Requirement, Callable[[commands.Context, PermissionIndex], Awaitable[None]]
+] = {
+    Requirement.AUTHOR_NOT_BLACKLISTED: (
+        lambda ctx, index: check_author_id_blacklisted(ctx, index.users)
+    ),
+    Requirement.TEXT_CHANNEL_NOT_BLACKLISTED: (
+        lambda ctx, index: check_text_channel_blacklisted(ctx, index.text_channels)
+    ),
+    Requirement.VOICE_CHANNEL_NOT_BLACKLISTED: (
+        lambda ctx, index: check_voice_channel_blacklisted(ctx, index.voice_channels)
+    ),
+    Requirement.ROLE_NOT_BLACKLISTED: (
+        lambda ctx, index: check_author_role_blacklisted(ctx, index.roles, index)
+    ),
+    Requirement.AUTHOR_IN_VOICE_CHANNEL: (
+        lambda ctx, index: check_author_voice_channel(ctx)
+    ),
+    Requirement.BOT_IN_VOICE_CHANNEL: (lambda ctx, index: check_bot_voice_channel(ctx)),
+    Requirement.SAME_VOICE_CHANNEL: (lambda ctx, index: check_same_voice_channel(ctx)),
+    Requirement.BOT_STREAMING: (lambda ctx, index: check_bot_streaming(ctx)),
+}
+
+# Requirements of every command
+NOT_BLACKLISTED = (
+    Requirement.AUTHOR_NOT_BLACKLISTED,
+    Requirement.TEXT_CHANNEL_NOT_BLACKLISTED,
+    Requirement.VOICE_CHANNEL_NOT_BLACKLISTED,
+    Requirement.ROLE_NOT_BLACKLISTED,
+)
+
+# Requirements of commands that control the bot in the voice channel
+IN_VOICE_CHANNEL = NOT_BLACKLISTED + (
+    Requirement.AUTHOR_IN_VOICE_CHANNEL,
+    Requirement.BOT_IN_VOICE_CHANNEL,
+    Requirement.SAME_VOICE_CHANNEL,
+)
+
+# Requirements of commands that control the currently played song
+STREAMING = IN_VOICE_CHANNEL + (Requirement.BOT_STREAMING,)
+
+# The requirements of each command
+REQUIREMENTS: Dict[str, Tuple[Requirement, ...]] = {
+    "add": IN_VOICE_CHANNEL,
+    "addlist": IN_VOICE_CHANNEL,
+    "blacklist": NOT_BLACKLISTED,
+    "chat": NOT_BLACKLISTED,
+    "dedupe": IN_VOICE_CHANNEL,
+    "help": NOT_BLACKLISTED,
+    "id": NOT_BLACKLISTED,
+    "join": NOT_BLACKLISTED + (Requirement.AUTHOR_IN_VOICE_CHANNEL,),
+    "leave": IN_VOICE_CHANNEL,
+    "move": IN_VOICE_CHANNEL,
+    "pause": STREAMING,
+    "play": IN_VOICE_CHANNEL,
+    "remove": IN_VOICE_CHANNEL,
+    "reset": IN_VOICE_CHANNEL,
+    "role": NOT_BLACKLISTED,
+    "show": IN_VOICE_CHANNEL,
+    "skip": STREAMING,
+    "stats": STREAMING,
+    "text_channel": NOT_BLACKLISTED,
+    "timeout": NOT_BLACKLISTED,
+    "user": NOT_BLACKLISTED,
+    "voice_channel": NOT_BLACKLISTED,
+    "volume": NOT_BLACKLISTED,
+}
+
+assert all(
+    list(requirements) == sorted(requirements) for requirements in REQUIREMENTS.values()
+), "The requirements of each command need to be sorted!"
+
+
+async def authorize(ctx: commands.Context, index: PermissionIndex) -> bool:
+    """
+    Checks the requirements of the invoked command one after another.
+
+    The checks do not wait for anything, unless they fail. So the requirements are
+    evaluated without creating any tasks and only the first failed requirement
+    replies to the author. Commands without an entry in REQUIREMENTS are rejected.
+
+    Args:
+        ctx (commands.Context):
+            The discord context
+
+        index (PermissionIndex):
+            The precomputed index of the blacklists
+
+    Returns:
+        bool:
+            True if all requirements are fulfilled
+    """
+    requirements = REQUIREMENTS.get(ctx.command.name)
+    if requirements is None:
+        # Case: Command was added without requirements - fail closed
+        raise commands.CheckFailure(f"Command {ctx.command.name} has no requirements!")
+    for requirement in requirements:
+        await CHECKS[requirement](ctx, index)
+    return True
@@ -1,16 +1,39 @@
 """Chat commands for the Discord bot."""
 
-import asyncio
-from typing import AsyncIterator
+import logging
+import time
+from typing import AsyncIterator, List
 
+import discord
 from discord.ext import commands
-from ollama import AsyncClient, ChatResponse
+from ollama import AsyncClient
 
-from discord_bot.checks import (
-    check_author_id_blacklisted,
-    check_author_role_blacklisted,
-    check_text_channel_blacklisted,
-    check_voice_channel_blacklisted,
+from discord_bot.chat import (
+    ChatScheduler,
+    ConversationMemory,
+    Overloaded,
+    ResponseCache,
+    Turn,
+    normalize,
+)
+from discord_bot.util import truncate
+from discord_bot.util.metrics import CHAT_SECONDS
+
+logger = logging.getLogger("discord")
+
+# Maximum number of characters of a response
+MAX_RESPONSE_LENGTH = 1997
+
+# System prompt of the chat model
+SYSTEM_PROMPT = (
+    "Answer every question using one short sentence, no longer than 20 characters. "
+    "Do not use lists."
+)
+
+# System prompt to summarize the older turns of a conversation
+SUMMARY_PROMPT = (
+    "Extend the given summary of a conversation with the given turns. Answer with the "
+    "new summary only, using at most three sentences."
 )
 
 
@@ -25,6 +48,46 @@ class Chat(commands.Cog):
         host (str):
             The host of the Ollama chat model
 
+        model (str):
+            The name of the Ollama chat model
+
+        edit_interval (float):
+            The minimum time in seconds between two edits of a streamed response
+
+        memory_turns (int):
+            The maximum number of turns remembered per channel
+
+        memory_tokens (int):
+            The maximum number of (estimated) tokens of the history sent to the model
+
+        memory_ttl (float):
+            The time in seconds after an idle conversation is forgotten
+
+        memory_channels (int):
+            The maximum number of channels with a remembered conversation
+
+        summarize (bool):
+            Whether forgotten turns are summarized by the chat model
+
+        max_concurrency (int):
+            The maximum number of responses that are generated at once
+
+        max_per_user (int):
+            The maximum number of queued or generated responses of each user
+
+        max_queue (int):
+            The maximum number of messages that wait for a response
+
+        cache (bool):
+            Whether responses to messages without a conversation are cached and
+            reused for equal messages (even inside of a conversation)
+
+        cache_size (int):
+            The maximum number of cached responses
+
+        cache_ttl (float):
+            The time in seconds after a cached response expires
+
         kwargs:
             Additional keyword arguments
     """
@@ -34,58 +97,160 @@ class Chat(commands.Cog):
         bot: commands.Bot,
         host: str = "http://localhost:11434",
         model: str = "gemma3:1b",
+        edit_interval: float = 1.0,
+        memory_turns: int = 20,
+        memory_tokens: int = 1024,
+        memory_ttl: float = 3600,
+        memory_channels: int = 1000,
+        summarize: bool = False,
+        max_concurrency: int = 2,
+        max_per_user: int = 1,
+        max_queue: int = 8,
+        cache: bool = False,
+        cache_size: int = 256,
+        cache_ttl: float = 600,
         **kwargs,
     ):
+        if edit_interval < 0:
+            raise ValueError("edit_interval needs to be higher than or equal to 0!")
+
         self.bot = bot
         self.host = host
         self.model = model
+        self.edit_interval = edit_interval
+        self.memory = ConversationMemory(
+            max_turns=memory_turns,
+            max_tokens=memory_tokens,
+            ttl=memory_ttl,
+            max_channels=memory_channels,
+            summarize=self._summarize if summarize else None,
+        )
+        self.scheduler = ChatScheduler(
+            max_concurrency=max_concurrency,
+            max_per_user=max_per_user,
+            max_queue=max_queue,
+        )
+        self.cache = ResponseCache(cache_size, cache_ttl) if cache else None
         self.kwargs = kwargs
+        self.client: AsyncClient | None = None
+
+    async def cog_load(self):
+        """Opens the connection pool to the Ollama host."""
+        # The client keeps its connections alive for the following requests
+        self.client = AsyncClient(host=self.host)
 
-    async def _before_chat(self, ctx: commands.Context):
-        """Checks for the chat command before performing it."""
-        manager = self.bot.get_cog("Manager")
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, manager.users),
-            check_author_role_blacklisted(ctx, manager.roles),
-            check_text_channel_blacklisted(ctx, manager.text_channels),
-            check_voice_channel_blacklisted(ctx, manager.voice_channels),
+    async def cog_unload(self):
+        """Closes the connection pool to the Ollama host."""
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+
+    async def _summarize(self, summary: str, turns: List[Turn]) -> str:
+        """Folds the forgotten turns of a conversation into its summary."""
+        conversation = "\n".join(f"{turn.role}: {turn.content}" for turn in turns)
+        response = await self.client.chat(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SUMMARY_PROMPT},
+                {
+                    "role": "user",
+                    "content": f"Summary:\n{summary}\n\nTurns:\n{conversation}",
+                },
+            ],
+            stream=False,
         )
+        return response["message"]["content"]
 
-    async def _chat_response(self, message: str) -> AsyncIterator[ChatResponse]:
+    async def _chat_response(self, message: str, channel_id: int) -> AsyncIterator[str]:
         """
-        Send a message to the Ollama chat model and return the response.
+        Send a message to the Ollama chat model and stream the response.
+
+        The recent conversation of the channel is sent along with the message.
 
         Args:
             message (str):
                 The message to send to the chat model
 
-        Returns:
+            channel_id (int):
+                The ID of the Discord channel of the conversation
+
+        Yields:
             str:
-                The response from the chat model
+                The next part of the response from the chat model
         """
-        client = AsyncClient(host="http://localhost:11434")
-        response = await client.chat(
+        start = time.perf_counter()
+        stream = await self.client.chat(
             model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "Answer every question using one short sentence, no longer "
-                        "than 20 characters. Do not use lists."
-                    ),
-                },
-                {"role": "user", "content": message},
-            ],
-            stream=False,
+            messages=self.memory.messages(channel_id, SYSTEM_PROMPT, message),
+            stream=True,
         )
-        return response["message"]["content"]
+        async for part in stream:
+            yield part["message"]["content"]
+        CHAT_SECONDS.observe(time.perf_counter() - start)
+
+    async def _stream_reply(self, ctx: commands.Context, message: str) -> str:
+        """
+        Streams the response of the chat model into a single Discord message.
+
+        The message is edited at most every edit_interval seconds.
+
+        Args:
+            ctx (commands.Context):
+                The discord context
+
+            message (str):
+                The message to send to the chat model
+
+        Returns:
+            str:
+                The complete response of the chat model (empty if it did not respond)
+        """
+        stateless = not self.memory.has_history(ctx.channel.id)
+        response = ""
+        shown = ""
+        reply: discord.Message | None = None
+        last_edit = time.monotonic()
+        async for part in self._chat_response(message, ctx.channel.id):
+            response += part
+            if not response.strip():
+                continue
+
+            if reply is None:
+                # Case: First token arrived
+                shown = truncate(response, MAX_RESPONSE_LENGTH)
+                reply = await ctx.send(shown)
+                last_edit = time.monotonic()
+            elif time.monotonic() - last_edit >= self.edit_interval:
+                # Case: Show the progress of the response
+                shown = truncate(response, MAX_RESPONSE_LENGTH)
+                await reply.edit(content=shown)
+                last_edit = time.monotonic()
+
+        if reply is None:
+            # Case: Chat model did not respond
+            await ctx.send("⚠️ The chat model did not respond!")
+            return ""
+        if shown != truncate(response, MAX_RESPONSE_LENGTH):
+            # Case: Show the complete response
+            await reply.edit(content=truncate(response, MAX_RESPONSE_LENGTH))
+        if self.cache is not None and stateless:
+            # Case: Response does not depend on a conversation
+            self.cache.put(self.model, SYSTEM_PROMPT, message, response)
+        await self.memory.append(ctx.channel.id, message, response)
+        return response
 
     @commands.command(aliases=["Chat"])
     async def chat(self, ctx: commands.Context, *message):
         """
         Chats with the bot.
 
-        It sends a message to an Ollama model and returns the response.
+        It sends a message to an Ollama model and streams the response into a single
+        Discord message. Only a limited number of messages are answered at once and
+        further messages are rejected. Identical messages in the same channel, which
+        arrive while the first one is answered, share its response. If the cache is
+        enabled, messages that were answered before without a conversation are answered
+        from the cache without calling the chat model. Cached answers are not added
+        to the conversation, so that repeated messages keep hitting the cache.
 
         Args:
             ctx (commands.Context):
@@ -94,8 +259,25 @@ class Chat(commands.Cog):
             message (str):
                 The message to send to the chat model
         """
+        message = " ".join(message)
+        if self.cache is not None:
+            response = self.cache.get(self.model, SYSTEM_PROMPT, message)
+            logger.debug("Chat cache hit rate: %.2f", self.cache.hit_rate)
+            if response is not None:
+                # Case: Answer from the cache (without extending the conversation)
+                return await ctx.send(truncate(response, MAX_RESPONSE_LENGTH))
+
         async with ctx.typing():
-            message = " ".join(message)
-            await self._before_chat(ctx)
-            response = await self._chat_response(message)
-            await ctx.send(content=response)
+            key = (ctx.channel.id, normalize(message))
+
+            try:
+                response, shared = await self.scheduler.run(
+                    key, ctx.author.id, lambda: self._stream_reply(ctx, message)
+                )
+            except Overloaded as error:
+                # Case: Too many messages at once
+                return await ctx.send(f"⚠️ {error}")
+
+            if shared and response:
+                # Case: Response was generated for an identical message
+                await ctx.reply(truncate(response, MAX_RESPONSE_LENGTH))
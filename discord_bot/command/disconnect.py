@@ -2,16 +2,12 @@
 
 import asyncio
 import logging
+from typing import Dict
 
-from discord.ext import commands, tasks
+import discord
+from discord.ext import commands
 
-from discord_bot.checks import (
-    check_author_id_blacklisted,
-    check_author_role_blacklisted,
-    check_text_channel_blacklisted,
-    check_valid_timeout,
-    check_voice_channel_blacklisted,
-)
+from discord_bot.checks import check_valid_timeout
 
 logger = logging.getLogger("discord")
 
@@ -20,6 +16,11 @@ class Disconnect(commands.Cog):
     """
     This class represents the background task to handle the timeout of the music bot.
 
+    The timeout is counted for each Discord Server separately. It starts when the bot
+    stops playing (or pauses) or when every member left its voice channel, and it is
+    cancelled as soon as the bot plays again for at least one member. Timers are
+    driven by playback and voice state events, so nothing runs while the bot is idle.
+
     Attributes:
         bot (commands.Bot):
             The discord client to handle the commands
@@ -43,48 +44,97 @@ class Disconnect(commands.Cog):
         self.kwargs = kwargs
         self.bot = bot
         self.end_timeout = timeout
-        self.curr_timeout = 0
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+
+    async def cog_unload(self):
+        """Cancels the timers of all Discord Servers."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+
+    @staticmethod
+    def _idle(voice_client: discord.VoiceClient) -> bool:
+        """Returns whether the bot is idle in its voice channel."""
+        if not voice_client.is_playing():
+            # Case: Bot stopped or paused playing
+            return True
+        # Case: Bot plays, but every member left the voice channel
+        return not any(not member.bot for member in voice_client.channel.members)
+
+    def refresh(self, guild: discord.Guild):
+        """
+        Starts or cancels the timeout of a Discord Server, after its state changed.
 
-        # Start the background task
-        self.disconnect.start()
+        A running timeout is kept while the bot stays idle, so that further events do
+        not prolong it.
 
-    @tasks.loop(seconds=60)
-    async def disconnect(self):
-        """Background Task to handle the timeout."""
+        Args:
+            guild (discord.Guild):
+                The Discord Server
+        """
+        voice_client = guild.voice_client
         if (
-            (self.end_timeout == 0)
-            or (len(self.bot.voice_clients) == 0)
-            or (self.bot.voice_clients[0].is_playing())
+            self.end_timeout == 0
+            or voice_client is None
+            or not voice_client.is_connected()
+            or not self._idle(voice_client)
         ):
-            # Case: Reset the timeout
-            self.curr_timeout = 0
+            # Case: Timeout is disabled, bot is not connected or bot is active
+            timer = self._timers.pop(guild.id, None)
+            if timer is not None:
+                timer.cancel()
             return
 
-        # Case: Bot is currently pausing or connected to a voice channel
-        self.curr_timeout += 60
+        if guild.id not in self._timers:
+            # Case: Bot became idle - start the timeout
+            self._timers[guild.id] = self.bot.loop.call_later(
+                self.end_timeout,
+                lambda: self.bot.loop.create_task(self._expire(guild)),
+            )
+
+    async def _expire(self, guild: discord.Guild):
+        """Leaves the voice channel and resets the playlist of an idle server."""
+        self._timers.pop(guild.id, None)
+        voice_client = guild.voice_client
+        sessions = self.bot.get_cog("Music").sessions
+        if voice_client is None or not voice_client.is_connected():
+            # Case: Bot is not connected to a voice channel of the server
+            sessions.evict(guild.id)
+            return
+        if not self._idle(voice_client):
+            # Case: Bot became active without an event
+            return
 
-        if self.curr_timeout >= self.end_timeout:
-            # Case: timeout has reached
+        # Clear the playlist and evict the playback state
+        session = sessions.evict(guild.id)
+        if session is not None:
+            await session.playlist.clear()
+            session.should_leave = True
 
-            # Clear the playlist
-            await self.bot.get_cog("Music").playlist.clear()
+        # Disconnect the bot from the voice channel
+        await voice_client.disconnect(force=False)
 
-            # Reset the disconnect time
-            self.curr_timeout = 0
+    @commands.Cog.listener()
+    async def on_playback_update(self, guild: discord.Guild):
+        """Updates the timeout after the bot started, paused or stopped playing."""
+        self.refresh(guild)
 
-            # Disconnect the bot from the voice channel
-            await self.bot.voice_clients[0].disconnect(force=False)
+    @commands.Cog.listener()
+    async def on_voice_state_update(
+        self,
+        member: discord.Member,
+        before: discord.VoiceState,
+        after: discord.VoiceState,
+    ):
+        """Updates the timeout after a member joined or left a voice channel."""
+        if member.id == self.bot.user.id and after.channel is None:
+            # Case: Bot was disconnected from the voice channel
+            self.bot.get_cog("Music").sessions.evict(member.guild.id)
+        self.refresh(member.guild)
 
     async def _before_timeout(self, ctx: commands.Context, timeout: int):
         """Checks for the timeout command before performing it."""
-        manager = self.bot.get_cog("Manager")
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, manager.users),
-            check_author_role_blacklisted(ctx, manager.roles),
-            check_text_channel_blacklisted(ctx, manager.text_channels),
-            check_voice_channel_blacklisted(ctx, manager.voice_channels),
-            check_valid_timeout(ctx, timeout),
-        )
+        await check_valid_timeout(ctx, timeout)
 
     @commands.command(aliases=["Timeout"])
     async def timeout(self, ctx: commands.Context, timeout: int):
@@ -104,7 +154,11 @@ class Disconnect(commands.Cog):
             if self.end_timeout != timeout:
                 # Case: New timeout is not the same as before
                 self.end_timeout = timeout
-                self.curr_timeout = 0
+                for timer in self._timers.values():
+                    timer.cancel()
+                self._timers.clear()
+                for voice_client in self.bot.voice_clients:
+                    self.refresh(voice_client.guild)
                 return await ctx.send(f"✅ Changed timeout to {self.end_timeout}!")
             # Case: New timeout is the same as before
             return await ctx.send(f"⚠️ Already using timeout of {self.end_timeout}!")
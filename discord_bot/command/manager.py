@@ -2,23 +2,22 @@
 
 import asyncio
 import logging
-from typing import Dict, List
+from typing import Any, Callable, Dict, Iterable, List
 
 import discord
 from discord.ext import commands
 
 from discord_bot.checks import (
-    check_author_id_blacklisted,
-    check_author_role_blacklisted,
+    authorize,
     check_less_equal_author,
-    check_text_channel_blacklisted,
     check_valid_author_ids,
     check_valid_author_roles,
     check_valid_command,
     check_valid_text_channels,
     check_valid_voice_channels,
-    check_voice_channel_blacklisted,
 )
+from discord_bot.permission import PermissionIndex
+from discord_bot.util import ConfigStore, paginate, send_pages
 
 logger = logging.getLogger("discord")
 
@@ -40,6 +39,13 @@ class Manager(commands.Cog):
         voice_channels (Dict[str, List[int]]):
             The dictionary of blacklisted voice channels for each command
 
+        index (PermissionIndex):
+            The precomputed index of the blacklists
+
+        store (ConfigStore | None):
+            The configuration file, where edited blacklists are written back to
+            (None keeps the edits in memory only)
+
         kwargs:
             Additional keyword arguments
     """
@@ -51,6 +57,7 @@ class Manager(commands.Cog):
         roles: Dict[str, List[int]],
         text_channels: Dict[str, List[int]],
         voice_channels: Dict[str, List[int]],
+        store: ConfigStore | None = None,
         **kwargs,
     ):
         if users.keys() != roles.keys():
@@ -69,6 +76,13 @@ class Manager(commands.Cog):
         self.roles = roles
         self.text_channels = text_channels
         self.voice_channels = voice_channels
+        self.index = PermissionIndex(
+            users=users,
+            roles=roles,
+            text_channels=text_channels,
+            voice_channels=voice_channels,
+        )
+        self.store = store
         self.kwargs = kwargs
 
         self._users_lock = asyncio.Lock()
@@ -76,21 +90,69 @@ class Manager(commands.Cog):
         self._text_channels_lock = asyncio.Lock()
         self._voice_channels_lock = asyncio.Lock()
 
-    async def _before_help(self, ctx: commands.Context):
-        """Checks for the help command before performing it."""
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, self.users),
-            check_author_role_blacklisted(ctx, self.roles),
-            check_text_channel_blacklisted(ctx, self.text_channels),
-            check_voice_channel_blacklisted(ctx, self.voice_channels),
-        )
+    async def cog_load(self):
+        """Starts applying external edits of the configuration file."""
+        if self.store is not None:
+            self.store.watch(self._reload)
+
+    async def cog_unload(self):
+        """Writes the pending edits of the blacklists."""
+        if self.store is not None:
+            await self.store.close()
+
+    def _changed(self, blacklist: str):
+        """Rebuilds the index of an edited blacklist and schedules saving it."""
+        self.index.refresh(blacklist)
+        if self.store is not None:
+            self.store.set("manager", blacklist, getattr(self, blacklist))
+
+    def _reload(self, config: Dict[str, Any]):
+        """Applies the blacklists of an externally edited configuration file."""
+        manager = config.get("manager")
+        if not isinstance(manager, dict):
+            raise ValueError("The manager section needs to be a mapping!")
+
+        blacklists = {
+            name: manager.get(name)
+            for name in ("users", "roles", "text_channels", "voice_channels")
+        }
+        for name, blacklist in blacklists.items():
+            if not isinstance(blacklist, dict) or not all(
+                isinstance(ids, list) for ids in blacklist.values()
+            ):
+                raise ValueError(f"The {name} need to map the commands to lists!")
+            if blacklist.keys() != self.users.keys():
+                raise ValueError(f"The commands of {name} need to stay the same!")
+
+        for name, blacklist in blacklists.items():
+            # Edit in place, so that the index keeps its references
+            getattr(self, name).update(blacklist)
+            self.index.refresh(name)
+        logger.info("Reloaded the blacklists from the configuration file.")
+
+    async def bot_check(self, ctx: commands.Context) -> bool:
+        """Checks the requirements of every command before performing it."""
+        return await authorize(ctx, self.index)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        """Invalidates the cached ranks, after a role was created."""
+        self.index.invalidate(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Invalidates the cached ranks, after a role was deleted."""
+        self.index.invalidate(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        """Invalidates the cached ranks, after a role was updated (e.g. moved)."""
+        self.index.invalidate(after.guild.id)
 
     @commands.command(aliases=["Help"])
     async def help(self, ctx: commands.Context):
         """Sends the help message for the bot."""
         async with ctx.typing():
-            await self._before_help(ctx)
-
             embed = discord.Embed(title="List of commands:", color=discord.Color.blue())
 
             embed.add_field(
@@ -98,6 +160,11 @@ class Manager(commands.Cog):
                 value="Adds a YouTube audio source to the playlist.",
                 inline=False,
             )
+            embed.add_field(
+                name=f"{self.bot.command_prefix}addlist <url>",
+                value="Adds all songs of a YouTube playlist to the playlist.",
+                inline=False,
+            )
             embed.add_field(
                 name=f"{self.bot.command_prefix}blacklist",
                 value="Shows the blacklists for each command.",
@@ -108,6 +175,11 @@ class Manager(commands.Cog):
                 value="Chats with the bot.",
                 inline=False,
             )
+            embed.add_field(
+                name=f"{self.bot.command_prefix}dedupe",
+                value="Removes duplicated audio sources from the playlist.",
+                inline=False,
+            )
             embed.add_field(
                 name=f"{self.bot.command_prefix}help",
                 value="Displays a list of available commands.",
@@ -128,6 +200,11 @@ class Manager(commands.Cog):
                 value="Disconnects the bot from the voice channel.",
                 inline=False,
             )
+            embed.add_field(
+                name=f"{self.bot.command_prefix}move <pos> <new_pos>",
+                value="Moves an audio source to a new position in the playlist.",
+                inline=False,
+            )
             embed.add_field(
                 name=f"{self.bot.command_prefix}pause",
                 value="Pauses the currently playing audio source.",
@@ -138,6 +215,11 @@ class Manager(commands.Cog):
                 value="Starts playing the audio source from the playlist.",
                 inline=False,
             )
+            embed.add_field(
+                name=f"{self.bot.command_prefix}remove <pos>",
+                value="Removes an audio source from the playlist.",
+                inline=False,
+            )
             embed.add_field(
                 name=f"{self.bot.command_prefix}reset",
                 value="Stops the currently played audio source and clears the "
@@ -150,8 +232,8 @@ class Manager(commands.Cog):
                 inline=False,
             )
             embed.add_field(
-                name=f"{self.bot.command_prefix}show <n>",
-                value="Lists the first `n` audio sources in the playlist.",
+                name=f"{self.bot.command_prefix}show <n> <page>",
+                value="Lists `n` audio sources of a page in the playlist.",
                 inline=False,
             )
             embed.add_field(
@@ -159,6 +241,11 @@ class Manager(commands.Cog):
                 value="Skips the currently playing audio source.",
                 inline=False,
             )
+            embed.add_field(
+                name=f"{self.bot.command_prefix}stats",
+                value="Shows the frame timing of the currently playing audio source.",
+                inline=False,
+            )
             embed.add_field(
                 name=f"{self.bot.command_prefix}text_channel <cmd or all> "
                 + "<id1> ... <idN>",
@@ -189,15 +276,6 @@ class Manager(commands.Cog):
 
             await ctx.send(embed=embed)
 
-    async def _before_id(self, ctx: commands.Context):
-        """Checks for the id command before performing it."""
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, self.users),
-            check_author_role_blacklisted(ctx, self.roles),
-            check_text_channel_blacklisted(ctx, self.text_channels),
-            check_voice_channel_blacklisted(ctx, self.voice_channels),
-        )
-
     @commands.command(aliases=["Id"])
     async def id(self, ctx: commands.Context):
         """
@@ -214,46 +292,26 @@ class Manager(commands.Cog):
                 The context of the command
         """
 
-        def message(header: str, items: List) -> str:
-            """Returns the message to be sent."""
-            wrapper = {item.id: item for item in items}
-            max_length = len(str(max(wrapper, key=lambda x: len(str(x))))) + 3
-            messages = [
-                f"•{id}: ".ljust(max_length) + f"{wrapper[id].name}" for id in wrapper
-            ]
-            output = "\n".join(messages)
-            return f"{header}\n```\n{output}\n```"
+        def lines(items: Iterable) -> List[str]:
+            """Returns the lines of a section."""
+            items = list(items)
+            max_length = max((len(str(item.id)) for item in items), default=0) + 3
+            return [f"•{item.id}: ".ljust(max_length) + item.name for item in items]
 
         async with ctx.typing():
-            await self._before_id(ctx)
-
+            sections = []
             if ctx.author.voice:
-                user_message = message(
-                    "**User ID to Name:**", ctx.author.voice.channel.members
+                sections.append(
+                    ("**User ID to Name:**", lines(ctx.author.voice.channel.members))
                 )
-                await ctx.send(user_message)
-
-            role_message = message("**Role ID to Name:**", reversed(ctx.guild.roles))
-            await ctx.send(role_message)
-
-            tc_message = message(
-                "***Text Channel ID to Name:***", ctx.guild.text_channels
+            sections.append(("**Role ID to Name:**", lines(reversed(ctx.guild.roles))))
+            sections.append(
+                ("***Text Channel ID to Name:***", lines(ctx.guild.text_channels))
             )
-            await ctx.send(tc_message)
-
-            vc_message = message(
-                "***Voice Channel ID to Name:***", ctx.guild.voice_channels
+            sections.append(
+                ("***Voice Channel ID to Name:***", lines(ctx.guild.voice_channels))
             )
-            await ctx.send(vc_message)
-
-    async def _before_blacklist(self, ctx: commands.Context):
-        """Checks for the blacklist command before performing it."""
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, self.users),
-            check_author_role_blacklisted(ctx, self.roles),
-            check_text_channel_blacklisted(ctx, self.text_channels),
-            check_voice_channel_blacklisted(ctx, self.voice_channels),
-        )
+            await send_pages(ctx, paginate(sections))
 
     @commands.command(aliases=["Blacklist"])
     async def blacklist(self, ctx: commands.Context):
@@ -271,62 +329,40 @@ class Manager(commands.Cog):
                 The context of the command.
         """
 
-        def message(header: str, items: List, blacklist: Dict[str, List[int]]) -> str:
-            """Returns the message to be sent."""
-            wrapper = {item.id: item for item in items}
+        def lines(
+            blacklist: Dict[str, List[int]], lookup: Callable[[int], Any]
+        ) -> List[str]:
+            """Returns the lines of a section, looking up each blacklisted ID."""
             max_length = (
-                len(self.bot.command_prefix)
-                + len(max(blacklist, key=lambda x: len(x)))
-                + 3
+                len(self.bot.command_prefix) + max(map(len, blacklist), default=0) + 3
             )
-            messages = []
-            for cmd in blacklist:
+            result = []
+            for cmd, ids in blacklist.items():
+                names = [item.name for item in map(lookup, ids) if item is not None]
                 line = f"•{self.bot.command_prefix}{cmd}: ".ljust(max_length)
-                items = [
-                    wrapper[item].name for item in blacklist[cmd] if item in wrapper
-                ]
-                if items:
-                    line += " ".join(items)
-                else:
-                    line += "---"
-                messages.append(line)
-            output = "\n".join(messages)
-            return f"{header}\n```\n{output}\n```"
+                result.append(line + (" ".join(names) if names else "---"))
+            return result
 
         async with ctx.typing():
-            await self._before_blacklist(ctx)
-            user_message = message(
-                "**Blacklisted Users:**", ctx.guild.members, self.users
-            )
-            role_message = message(
-                "**Blacklisted Roles:**", reversed(ctx.guild.roles), self.roles
-            )
-            tc_message = message(
-                "**Blacklisted Text Channels:**",
-                ctx.guild.text_channels,
-                self.text_channels,
-            )
-            vc_message = message(
-                "**Blacklisted Voice Channels:**",
-                ctx.guild.voice_channels,
-                self.voice_channels,
-            )
-
-            await ctx.send(user_message)
-            await ctx.send(role_message)
-            await ctx.send(tc_message)
-            await ctx.send(vc_message)
+            guild = ctx.guild
+            sections = [
+                ("**Blacklisted Users:**", lines(self.users, guild.get_member)),
+                ("**Blacklisted Roles:**", lines(self.roles, guild.get_role)),
+                (
+                    "**Blacklisted Text Channels:**",
+                    lines(self.text_channels, guild.get_channel),
+                ),
+                (
+                    "**Blacklisted Voice Channels:**",
+                    lines(self.voice_channels, guild.get_channel),
+                ),
+            ]
+            await send_pages(ctx, paginate(sections))
 
     async def _before_user(self, ctx: commands.Context, command: str, users: List[int]):
         """Checks for the user command before performing it."""
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, self.users),
-            check_author_role_blacklisted(ctx, self.roles),
-            check_text_channel_blacklisted(ctx, self.text_channels),
-            check_voice_channel_blacklisted(ctx, self.voice_channels),
-            check_valid_command(ctx, command, list(self.users.keys())),
-            check_valid_author_ids(ctx, users),
-        )
+        await check_valid_command(ctx, command, list(self.users.keys()))
+        await check_valid_author_ids(ctx, users)
 
     @commands.command(aliases=["User"])
     async def user(self, ctx: commands.Context, command: str, *users):
@@ -352,6 +388,7 @@ class Manager(commands.Cog):
                     # Case: All commands should be changed
                     for cmd in self.users:
                         self.users[cmd] = users
+                    self._changed("users")
                     return await ctx.send(
                         "✅ Changed blacklisted users for all commands!"
                     )
@@ -360,21 +397,16 @@ class Manager(commands.Cog):
                     if self.users[command] != users:
                         # Case: Blacklisted users are changed
                         self.users[command] = users
+                        self._changed("users")
                         return await ctx.send("✅ Changed blacklisted users!")
                     # Case: Already using blacklisted users
                     return await ctx.send("⚠️ Already using blacklisted users!")
 
     async def _before_role(self, ctx: commands.Context, command: str, roles: List[int]):
         """Checks for the role command before performing it."""
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, self.users),
-            check_author_role_blacklisted(ctx, self.roles),
-            check_text_channel_blacklisted(ctx, self.text_channels),
-            check_voice_channel_blacklisted(ctx, self.voice_channels),
-            check_valid_command(ctx, command, list(self.roles.keys())),
-            check_valid_author_roles(ctx, roles),
-            check_less_equal_author(ctx, roles),
-        )
+        await check_valid_command(ctx, command, list(self.roles.keys()))
+        await check_valid_author_roles(ctx, roles)
+        await check_less_equal_author(ctx, roles)
 
     @commands.command(aliases=["Role"])
     async def role(self, ctx: commands.Context, command: str, *roles):
@@ -400,14 +432,16 @@ class Manager(commands.Cog):
                     # Case: All commands should be changed
                     for cmd in self.roles:
                         self.roles[cmd] = roles
-                        return await ctx.send(
-                            "✅ Changed blacklisted roles for all commands!"
-                        )
+                    self._changed("roles")
+                    return await ctx.send(
+                        "✅ Changed blacklisted roles for all commands!"
+                    )
                 else:
                     # Case: Specific command should be changed
                     if self.roles[command] != roles:
                         # Case: Blacklisted roles are changed
                         self.roles[command] = roles
+                        self._changed("roles")
                         return await ctx.send("✅ Changed blacklisted roles!")
                     # Case: Already using blacklisted roles
                     return await ctx.send("⚠️ Already using blacklisted roles!")
@@ -416,14 +450,8 @@ class Manager(commands.Cog):
         self, ctx: commands.Context, command: str, text_channels: List[int]
     ):
         """Checks for the text_channel command before performing it."""
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, self.users),
-            check_author_role_blacklisted(ctx, self.roles),
-            check_text_channel_blacklisted(ctx, self.text_channels),
-            check_voice_channel_blacklisted(ctx, self.voice_channels),
-            check_valid_command(ctx, command, list(self.text_channels.keys())),
-            check_valid_text_channels(ctx, text_channels),
-        )
+        await check_valid_command(ctx, command, list(self.text_channels.keys()))
+        await check_valid_text_channels(ctx, text_channels)
 
     @commands.command(aliases=["Text_channel"])
     async def text_channel(self, ctx: commands.Context, command: str, *text_channels):
@@ -449,14 +477,16 @@ class Manager(commands.Cog):
                     # Case: All commands should be changed
                     for cmd in self.text_channels:
                         self.text_channels[cmd] = text_channels
-                        return await ctx.send(
-                            "✅ Changed blacklisted text channels for all commands!"
-                        )
+                    self._changed("text_channels")
+                    return await ctx.send(
+                        "✅ Changed blacklisted text channels for all commands!"
+                    )
                 else:
                     # Case: Specific command should be changed
                     if self.text_channels[command] != text_channels:
                         # Case: Blacklisted text channels are changed
                         self.text_channels[command] = text_channels
+                        self._changed("text_channels")
                         return await ctx.send("✅ Changed blacklisted text channels!")
                     # Case: Already using blacklisted text channels
                     return await ctx.send("⚠️ Already using blacklisted text channels!")
@@ -465,14 +495,8 @@ class Manager(commands.Cog):
         self, ctx: commands.Context, command: str, voice_channels: List[int]
     ):
         """Checks for the voice_channel command before performing it."""
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, self.users),
-            check_author_role_blacklisted(ctx, self.roles),
-            check_text_channel_blacklisted(ctx, self.text_channels),
-            check_voice_channel_blacklisted(ctx, self.voice_channels),
-            check_valid_command(ctx, command, list(self.voice_channels.keys())),
-            check_valid_voice_channels(ctx, voice_channels),
-        )
+        await check_valid_command(ctx, command, list(self.voice_channels.keys()))
+        await check_valid_voice_channels(ctx, voice_channels)
 
     @commands.command(aliases=["Voice_channel"])
     async def voice_channel(self, ctx: commands.Context, command: str, *voice_channels):
@@ -498,14 +522,16 @@ class Manager(commands.Cog):
                     # Case: All commands should be changed
                     for cmd in self.voice_channels:
                         self.voice_channels[cmd] = voice_channels
-                        return await ctx.send(
-                            "✅ Changed blacklisted voice channels for all commands!"
-                        )
+                    self._changed("voice_channels")
+                    return await ctx.send(
+                        "✅ Changed blacklisted voice channels for all commands!"
+                    )
                 else:
                     # Case: Specific command should be changed
                     if self.voice_channels[command] != voice_channels:
                         # Case: Blacklisted voice channels are changed
                         self.voice_channels[command] = voice_channels
+                        self._changed("voice_channels")
                         return await ctx.send("✅ Changed blacklisted voice channels!")
                     # Case: Already using blacklisted voice channels
                     return await ctx.send(
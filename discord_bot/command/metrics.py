@@ -0,0 +1,153 @@
+"""Metrics endpoint for the Discord bot."""
+
+import logging
+import time
+from typing import Dict, Iterable, Tuple
+
+from aiohttp import web
+from discord.ext import commands
+
+from discord_bot.util.metrics import (
+    COMMAND_ERRORS,
+    COMMAND_SECONDS,
+    COMMANDS,
+    EXTRACT_QUEUED,
+    EXTRACT_RUNNING,
+    FFMPEG_PROCESSES,
+    PLAYLIST_SIZE,
+    render,
+)
+
+logger = logging.getLogger("discord")
+
+
+class Metrics(commands.Cog):
+    """
+    This class represents the local HTTP endpoint of the metrics of the bot.
+
+    The metrics are exposed in the text format of Prometheus on /metrics.
+
+    Attributes:
+        bot (commands.Bot):
+            The discord client to handle the commands
+
+        host (str):
+            The host of the HTTP endpoint
+
+        port (int):
+            The port of the HTTP endpoint
+
+        kwargs:
+            Additional keyword arguments
+    """
+
+    def __init__(
+        self,
+        bot: commands.Bot,
+        host: str = "127.0.0.1",
+        port: int = 9100,
+        **kwargs,
+    ):
+        if port < 0 or port > 65535:
+            raise ValueError("port needs to be in between of 0 and 65535!")
+
+        self.bot = bot
+        self.host = host
+        self.port = port
+        self.kwargs = kwargs
+        self._started: Dict[int, float] = {}
+        self._runner: web.AppRunner | None = None
+
+    async def cog_load(self):
+        """Starts the HTTP endpoint and the collection of the gauges."""
+        PLAYLIST_SIZE.collect = self._playlist_sizes
+        FFMPEG_PROCESSES.collect = self._ffmpeg_processes
+        EXTRACT_QUEUED.collect = self._extract_queued
+        EXTRACT_RUNNING.collect = self._extract_running
+
+        app = web.Application()
+        app.router.add_get("/metrics", self._metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info("Serving metrics on http://%s:%d/metrics", self.host, self.port)
+
+    async def cog_unload(self):
+        """Stops the HTTP endpoint."""
+        PLAYLIST_SIZE.collect = None
+        FFMPEG_PROCESSES.collect = None
+        EXTRACT_QUEUED.collect = None
+        EXTRACT_RUNNING.collect = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _metrics(self, request: web.Request) -> web.Response:
+        """Returns all metrics."""
+        return web.Response(text=render(), content_type="text/plain", charset="utf-8")
+
+    def _playlist_sizes(self) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        """Collects the number of songs in the playlist of each Discord Server."""
+        music = self.bot.get_cog("Music")
+        if music is not None:
+            for session in music.sessions:
+                yield (str(session.guild_id),), len(session.playlist)
+
+    def _ffmpeg_processes(self) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        """Collects the number of ffmpeg processes (playing or warmed up)."""
+        playing = sum(
+            1
+            for voice_client in self.bot.voice_clients
+            if getattr(voice_client, "source", None) is not None
+        )
+        music = self.bot.get_cog("Music")
+        warm = (
+            sum(1 for session in music.sessions if session.prefetcher.warm)
+            if music is not None
+            else 0
+        )
+        yield (), playing + warm
+
+    def _extract_queued(self) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        """Collects the number of queued extractions of each Discord Server."""
+        music = self.bot.get_cog("Music")
+        if music is not None:
+            queued = music.extractor.stats()["queued_per_guild"]
+            for guild_id, count in queued.items():
+                yield (str(guild_id),), count
+
+    def _extract_running(self) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        """Collects the number of running extractions."""
+        music = self.bot.get_cog("Music")
+        yield (), music.extractor.stats()["running"] if music is not None else 0
+
+    @commands.Cog.listener()
+    async def on_command(self, ctx: commands.Context):
+        """Counts the invoked command and starts measuring its latency."""
+        COMMANDS.inc(ctx.command.name)
+        self._started[ctx.message.id] = time.perf_counter()
+
+    @commands.Cog.listener()
+    async def on_command_completion(self, ctx: commands.Context):
+        """Observes the latency of the completed command."""
+        start = self._started.pop(ctx.message.id, None)
+        if start is not None:
+            COMMAND_SECONDS.observe(time.perf_counter() - start, ctx.command.name)
+
+    @commands.Cog.listener()
+    async def on_command_error(
+        self, ctx: commands.Context, error: commands.CommandError
+    ):
+        """Counts the failed command and logs it like the default error handler."""
+        self._started.pop(ctx.message.id, None)
+        command = ctx.command.name if ctx.command is not None else "unknown"
+        COMMAND_ERRORS.inc(command, type(error).__name__)
+
+        # discord.py skips its default error handler, once this listener exists
+        if ctx.command is not None and ctx.command.has_error_handler():
+            # Case: Command handles its own errors
+            return
+        if ctx.cog is not None and ctx.cog.has_error_handler():
+            # Case: Cog handles the errors of its commands
+            return
+        logger.error("Ignoring exception in command %s", ctx.command, exc_info=error)
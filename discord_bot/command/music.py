@@ -1,31 +1,44 @@
 """Music commands for the Discord bot."""
 
 import asyncio
+import functools
 import logging
+import math
+import time
+from typing import Any, Dict
 
 import discord
 import yt_dlp
 from discord.ext import commands
 
-from discord_bot.audio import AudioSource, Playlist
+from discord_bot.audio import (
+    AudioSource,
+    Extractor,
+    MetadataCache,
+    Playlist,
+    StreamResolver,
+)
 from discord_bot.checks import (
-    check_author_id_blacklisted,
-    check_author_role_blacklisted,
-    check_author_voice_channel,
-    check_bot_streaming,
-    check_bot_voice_channel,
-    check_same_voice_channel,
-    check_text_channel_blacklisted,
     check_valid_n,
+    check_valid_page,
+    check_valid_position,
     check_valid_url,
     check_valid_volume,
-    check_voice_channel_blacklisted,
 )
-from discord_bot.transformer import YTDLVolumeTransformer
+from discord_bot.session import GuildSession, SessionJournal, SessionRegistry
+from discord_bot.transformer import (
+    FrameStats,
+    Prefetcher,
+    YTDLOpusTransformer,
+    YTDLVolumeTransformer,
+)
 from discord_bot.util import remove_emojis, truncate
 
 logger = logging.getLogger("discord")
 
+# Time in seconds between two progress updates of the addlist command
+PROGRESS_INTERVAL = 2
+
 # Options for youtube-dl
 ydl_options = {
     "format": "bestaudio/best",
@@ -35,8 +48,8 @@ ydl_options = {
     "skip_download": True,
     "quiet": True,
     "default_search": "ytsearch",
+    "extract_flat": "in_playlist",
 }
-ydl = yt_dlp.YoutubeDL(ydl_options)
 
 
 class Music(commands.Cog):
@@ -47,8 +60,56 @@ class Music(commands.Cog):
         bot (commands.Bot):
             The discord client to handle the commands
 
-        volume (int):
-            The starting volume with a value in between of 0 and 100
+        default_volume (int):
+            The starting volume of each Discord Server with a value in between of 0
+            and 100 (only 100 lets Opus streams be copied without re-encoding them)
+
+        cache_path (str):
+            The path to the file-backed cache of the YouTube metadata
+
+        cache_ttl (int):
+            The time in seconds after a cached YouTube metadata expires
+
+        cache_size (int):
+            The maximum number of cached YouTube metadata
+
+        stream_margin (int):
+            The time in seconds before the expiry, where a stream URL gets refreshed
+
+        prefetch_depth (int):
+            The number of next audio sources to prefetch while playing
+
+        extract_workers (int):
+            The number of workers to extract information with yt-dlp
+
+        extract_mode (str):
+            The type of the extraction workers, either "thread" or "process"
+
+        extract_timeout (float):
+            The time in seconds after a running extraction is cancelled
+
+        extract_queue_timeout (float):
+            The time in seconds after a queued extraction, that did not start yet, is
+            cancelled
+
+        playlist_size (int | None):
+            The maximum number of audio sources in the playlist of each Discord
+            Server (None for no limit)
+
+        opus (bool):
+            Whether ffmpeg produces the Opus packets itself, instead of passing the
+            raw PCM to discord.py for re-encoding
+
+        frame_stats (bool):
+            Whether the timing of the audio frames is measured (see the stats
+            command)
+
+        journal_path (str | None):
+            The path to the journal of the playlists and volumes, so that they survive
+            a restart (None disables the journal)
+
+        journal_compact (int):
+            The number of journaled changes after the journal is compacted
 
         kwargs:
             Additional keyword arguments
@@ -57,31 +118,116 @@ class Music(commands.Cog):
     def __init__(
         self,
         bot: commands.Bot,
-        volume: int = 50,
+        volume: int = 100,
+        cache_path: str = "cache.db",
+        cache_ttl: int = 86400,
+        cache_size: int = 1000,
+        stream_margin: int = 600,
+        prefetch_depth: int = 1,
+        extract_workers: int = 4,
+        extract_mode: str = "thread",
+        extract_timeout: float = 30,
+        extract_queue_timeout: float = 300,
+        playlist_size: int | None = None,
+        opus: bool = True,
+        frame_stats: bool = False,
+        journal_path: str | None = None,
+        journal_compact: int = 1000,
         **kwargs,
     ):
         if volume < 0 or volume > 100:
             raise ValueError("volume needs to be in between of 0 and 100!")
+        if prefetch_depth < 0:
+            raise ValueError("prefetch_depth needs to be higher than or equal to 0!")
+        if playlist_size is not None and playlist_size <= 0:
+            raise ValueError("playlist_size needs to be higher than 0!")
 
         self.bot = bot
-        self.curr_volume = volume
-        self.playlist = Playlist()
-        self.should_leave = False
+        self.default_volume = volume
+        self.prefetch_depth = prefetch_depth
+        self.playlist_size = playlist_size
+        self.transformer = YTDLOpusTransformer if opus else YTDLVolumeTransformer
+        self.frame_stats = frame_stats
+        self.cache = MetadataCache(path=cache_path, ttl=cache_ttl, max_size=cache_size)
+        self.extractor = Extractor(
+            options=ydl_options,
+            workers=extract_workers,
+            mode=extract_mode,
+            timeout=extract_timeout,
+            queue_timeout=extract_queue_timeout,
+        )
+        self.resolver = StreamResolver(extract=self._extract, margin=stream_margin)
+        self.journal = (
+            SessionJournal(path=journal_path, compact_every=journal_compact)
+            if journal_path is not None
+            else None
+        )
+        self.sessions = SessionRegistry(
+            factory=self._create_session,
+            on_evict=(
+                functools.partial(self.journal.record, operation="evict")
+                if self.journal is not None
+                else None
+            ),
+        )
         self.kwargs = kwargs
 
+    async def cog_load(self):
+        """Restores the playlists and volumes from the journal."""
+        if self.journal is not None:
+            restored = await self.journal.restore(self.sessions)
+            logger.info("Restored %d songs from the journal.", restored)
+
+    async def cog_unload(self):
+        """Stops all sessions, the extraction workers and closes the cache."""
+        if self.journal is not None:
+            await self.journal.close()
+        self.sessions.clear()
+        self.extractor.close()
+        self.cache.close()
+
+    def _create_session(self, guild_id: int) -> GuildSession:
+        """Creates the playback state of a Discord Server."""
+        guild = self.bot.get_guild(guild_id)
+        return GuildSession(
+            guild_id=guild_id,
+            playlist=Playlist(
+                max_size=self.playlist_size,
+                journal=(
+                    functools.partial(self.journal.record, guild_id)
+                    if self.journal is not None
+                    else None
+                ),
+            ),
+            prefetcher=Prefetcher(
+                resolver=self.resolver,
+                depth=self.prefetch_depth,
+                transformer=self.transformer,
+            ),
+            volume=self.default_volume,
+            voice_client=guild.voice_client if guild is not None else None,
+        )
+
+    async def _extract(
+        self, url_or_search: str, guild_id: int | None = None
+    ) -> Dict[str, Any]:
+        """Extracts the information of a YouTube video without blocking the bot."""
+        return await self.extractor.extract(url_or_search, guild_id=guild_id)
+
+    def _reschedule_prefetch(self, ctx: commands.Context, session: GuildSession):
+        """Updates the prefetch, after the next audio sources may have changed."""
+        if ctx.voice_client.is_playing() or ctx.voice_client.is_paused():
+            # Case: Next audio source is played after the current one
+            session.prefetcher.schedule(session.playlist, session.volume)
+
+    def _author_priority(self, ctx: commands.Context) -> int:
+        """Returns the lowest priority (lpriority) of the author's roles."""
+        ranks = self.bot.get_cog("Manager").index.ranks(ctx.guild)
+        return min(ranks[role.id] for role in ctx.author.roles)
+
     async def _before_add(self, ctx: commands.Context, url_or_search: str):
         """Checks for the add command before performing it."""
-        manager = self.bot.get_cog("Manager")
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, manager.users),
-            check_author_role_blacklisted(ctx, manager.roles),
-            check_text_channel_blacklisted(ctx, manager.text_channels),
-            check_voice_channel_blacklisted(ctx, manager.voice_channels),
-            check_author_voice_channel(ctx),
-            check_bot_voice_channel(ctx),
-            check_same_voice_channel(ctx),
-            check_valid_url(ctx, url_or_search),
-        )
+        await check_valid_url(ctx, url_or_search)
 
     @commands.command(aliases=["Add"])
     async def add(self, ctx: commands.Context, *url_or_search):
@@ -99,59 +245,155 @@ class Music(commands.Cog):
             url_or_search = " ".join(url_or_search)
             await self._before_add(ctx, url_or_search)
 
-            # Get the lowest priority (lpriority) of the author's roles
-            __ROLES__ = {
-                role.id: (priority, role)
-                for priority, role in enumerate(reversed(ctx.guild.roles))
-            }
-            __AUTHOR_ROLES__ = {
-                role.id: __ROLES__[role.id] for role in ctx.author.roles
-            }
-            lpriority = min(
-                [__AUTHOR_ROLES__[role_id][0] for role_id in __AUTHOR_ROLES__]
-            )
-
-            # Extract the title of the YouTube video
-            loop = asyncio.get_event_loop()
-            data = await loop.run_in_executor(
-                None, lambda: ydl.extract_info(url_or_search)
-            )
-
-            if "entries" in data:
-                # Case: Searched for a video
-                data = data["entries"][0]
-
-            # Remove emojis from the title
-            data["title"] = remove_emojis(data["title"])
-            data["title"] = truncate(data["title"], 100)
-
-            # Create the audio source
+            lpriority = self._author_priority(ctx)
+
+            # Get the metadata of the YouTube video
+            stream_url = None
+            codec = None
+            data = self.cache.get(url_or_search)
+            if data is None:
+                # Case: Metadata is not cached - extract it from YouTube
+                info = await self._extract(url_or_search, guild_id=ctx.guild.id)
+
+                if "entries" in info:
+                    # Case: Searched for a video - only the flat metadata is known
+                    info = info["entries"][0]
+                    yt_url = info["url"]
+                else:
+                    # Case: Extracted the video - reuse its stream URL
+                    yt_url = info["original_url"]
+                    stream_url = info["url"]
+                    codec = info.get("acodec")
+
+                # Remove emojis from the title
+                data = {
+                    "title": truncate(remove_emojis(info["title"]), 100),
+                    "yt_url": yt_url,
+                }
+                self.cache.put(url_or_search, **data)
+
+            # Create the audio source (stream URL is resolved before playing it)
             audio_source = AudioSource(
                 title=data["title"],
                 user=ctx.author.name,
-                stream_url=data["url"],
-                yt_url=data["original_url"],
+                yt_url=data["yt_url"],
                 priority=lpriority,
+                stream_url=stream_url,
+                codec=codec,
             )
 
             # Add the audio file to the playlist
-            await self.playlist.add(audio_source)
+            session = self.sessions.get(ctx.guild.id)
+            try:
+                await session.playlist.add(audio_source)
+            except ValueError:
+                # Case: Playlist has reached its maximum size
+                return await ctx.send(
+                    f"⚠️ Could not add [{audio_source.title}]({audio_source.yt_url}), "
+                    "because the playlist has reached its maximum size!"
+                )
+
+            self._reschedule_prefetch(ctx, session)
 
             await ctx.send(
                 f"✅ Added [{audio_source.title}]({audio_source.yt_url}) to the "
                 "playlist!"
             )
 
-    async def _before_join(self, ctx: commands.Context):
-        """Checks for the leave command before performing it."""
-        manager = self.bot.get_cog("Manager")
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, manager.users),
-            check_author_role_blacklisted(ctx, manager.roles),
-            check_text_channel_blacklisted(ctx, manager.text_channels),
-            check_voice_channel_blacklisted(ctx, manager.voice_channels),
-            check_author_voice_channel(ctx),
-        )
+    async def _before_addlist(self, ctx: commands.Context, url: str):
+        """Checks for the addlist command before performing it."""
+        await check_valid_url(ctx, url)
+
+    @commands.command(aliases=["Addlist"])
+    async def addlist(self, ctx: commands.Context, url: str):
+        """
+        Adds all audio sources of a YouTube playlist to the playlist.
+
+        The entries of the YouTube playlist are added as they stream in. Their
+        stream URLs are resolved before playing them.
+
+        Args:
+            ctx (commands.Context):
+                The discord context
+
+            url (str):
+                The URL of the YouTube playlist
+        """
+        async with ctx.typing():
+            await self._before_addlist(ctx, url)
+
+            lpriority = self._author_priority(ctx)
+            session = self.sessions.get(ctx.guild.id)
+            message = await ctx.send(f"⏳ Adding songs from {url} to the playlist...")
+
+            added = 0
+            full = False
+            failed = False
+            last_edit = time.monotonic()
+            try:
+                async for entry in self.extractor.iterate(url, guild_id=ctx.guild.id):
+                    audio_source = AudioSource(
+                        title=truncate(remove_emojis(entry.get("title") or ""), 100),
+                        user=ctx.author.name,
+                        yt_url=entry["url"],
+                        priority=lpriority,
+                    )
+                    try:
+                        await session.playlist.add(audio_source)
+                    except ValueError:
+                        # Case: Playlist has reached its maximum size
+                        full = True
+                        break
+                    added += 1
+
+                    if time.monotonic() - last_edit >= PROGRESS_INTERVAL:
+                        # Case: Report the progress
+                        last_edit = time.monotonic()
+                        await message.edit(
+                            content=f"⏳ Added {added} songs from {url} to the "
+                            "playlist..."
+                        )
+            except yt_dlp.utils.YoutubeDLError:
+                # Case: Extraction failed or timed out
+                failed = True
+
+            if added > 0:
+                self._reschedule_prefetch(ctx, session)
+
+            if failed:
+                # Case: Not all songs could be extracted
+                return await message.edit(
+                    content=f"❌ Could not extract all songs from {url}, added {added} "
+                    "songs to the playlist!"
+                )
+            if full:
+                # Case: Not all songs could be added
+                return await message.edit(
+                    content=f"⚠️ Added {added} songs from {url} to the playlist, "
+                    "before it has reached its maximum size!"
+                )
+            return await message.edit(
+                content=f"✅ Added {added} songs from {url} to the playlist!"
+            )
+
+    @commands.command(aliases=["Dedupe"])
+    async def dedupe(self, ctx: commands.Context):
+        """
+        Removes the duplicated audio sources from the playlist.
+
+        Args:
+            ctx (commands.Context):
+                The discord context
+        """
+        async with ctx.typing():
+            session = self.sessions.get(ctx.guild.id)
+            removed = await session.playlist.dedupe()
+            if removed == 0:
+                # Case: Playlist does not contain any duplicates
+                return await ctx.send("⚠️ The playlist does not contain duplicates!")
+
+            self._reschedule_prefetch(ctx, session)
+            return await ctx.send(f"✅ Removed {removed} duplicates from the playlist!")
 
     @commands.command(aliases=["Join"])
     async def join(self, ctx: commands.Context):
@@ -163,12 +405,12 @@ class Music(commands.Cog):
                 The discord context
         """
         async with ctx.typing():
-            await self._before_join(ctx)
-
             author_channel = ctx.author.voice.channel
             if ctx.voice_client is None:
                 # Case: Bot is not in a voice channel
-                await author_channel.connect()
+                session = self.sessions.get(ctx.guild.id)
+                session.voice_client = await author_channel.connect()
+                self.bot.dispatch("playback_update", ctx.guild)
                 return await ctx.send(f"✅ Moved to {author_channel}!")
             else:
                 # Case: Bot is in a voice channel
@@ -181,25 +423,14 @@ class Music(commands.Cog):
                 if ctx.voice_client.is_playing():
                     # Case: Bot is currently playing - pause the music
                     ctx.voice_client.pause()
+                    self._reset_frame_stats(ctx.voice_client)
 
                 await ctx.voice_client.move_to(author_channel)
+                self.bot.dispatch("playback_update", ctx.guild)
                 return await ctx.send(
                     f"✅ Moved from {bot_channel} to {author_channel}!"
                 )
 
-    async def _before_leave(self, ctx: commands.Context):
-        """Checks for the leave command before performing it."""
-        manager = self.bot.get_cog("Manager")
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, manager.users),
-            check_author_role_blacklisted(ctx, manager.roles),
-            check_text_channel_blacklisted(ctx, manager.text_channels),
-            check_voice_channel_blacklisted(ctx, manager.voice_channels),
-            check_author_voice_channel(ctx),
-            check_bot_voice_channel(ctx),
-            check_same_voice_channel(ctx),
-        )
-
     @commands.command(aliases=["Leave"])
     async def leave(self, ctx: commands.Context):
         """
@@ -210,38 +441,56 @@ class Music(commands.Cog):
                 The discord context
         """
         async with ctx.typing():
-            await self._before_leave(ctx)
-
             # Safe the current voice channel
             voice_channel = ctx.voice_client.channel
 
-            # Clear the playlist
-            await self.playlist.clear()
-
-            # Reset the disconnect time
-            self.bot.get_cog("Disconnect").curr_timeout = 0
-
-            # Set the flag to leave the voice channel
-            self.should_leave = True
+            # Remove the playback state of the discord server
+            session = self.sessions.evict(ctx.guild.id)
+            if session is not None:
+                # Case: Set the flag to leave the voice channel
+                await session.playlist.clear()
+                session.should_leave = True
 
             # Disconnect the bot from the voice channel
             await ctx.voice_client.disconnect(force=False)
 
             return await ctx.send(f"✅ Left {voice_channel}!")
 
-    async def _before_pause(self, ctx: commands.Context):
-        """Checks for the pause command before performing it."""
-        manager = self.bot.get_cog("Manager")
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, manager.users),
-            check_author_role_blacklisted(ctx, manager.roles),
-            check_text_channel_blacklisted(ctx, manager.text_channels),
-            check_voice_channel_blacklisted(ctx, manager.voice_channels),
-            check_author_voice_channel(ctx),
-            check_bot_voice_channel(ctx),
-            check_same_voice_channel(ctx),
-            check_bot_streaming(ctx),
-        )
+    async def _before_move(
+        self, ctx: commands.Context, position: int, new_position: int
+    ):
+        """Checks for the move command before performing it."""
+        session = self.sessions.find(ctx.guild.id)
+        size = await session.playlist.size() if session is not None else 0
+        await check_valid_position(ctx, position, size)
+        await check_valid_position(ctx, new_position, size)
+
+    @commands.command(aliases=["Move"])
+    async def move(self, ctx: commands.Context, position: int, new_position: int):
+        """
+        Moves an audio source in the playlist to a new position.
+
+        Args:
+            ctx (commands.Context):
+                The discord context
+
+            position (int):
+                The current position of the audio source (as shown by show)
+
+            new_position (int):
+                The new position of the audio source
+        """
+        async with ctx.typing():
+            await self._before_move(ctx, position, new_position)
+
+            session = self.sessions.get(ctx.guild.id)
+            audio_source = await session.playlist.move(position, new_position)
+            self._reschedule_prefetch(ctx, session)
+
+            await ctx.send(
+                f"✅ Moved [{audio_source.title}]({audio_source.yt_url}) to position "
+                f"{new_position}!"
+            )
 
     @commands.command(aliases=["Pause"])
     async def pause(self, ctx: commands.Context):
@@ -253,11 +502,11 @@ class Music(commands.Cog):
                 The discord context
         """
         async with ctx.typing():
-            await self._before_pause(ctx)
-
             if ctx.voice_client.is_playing():
                 # Case: Bot plays an audio source
                 ctx.voice_client.pause()
+                self._reset_frame_stats(ctx.voice_client)
+                self.bot.dispatch("playback_update", ctx.guild)
                 title = ctx.voice_client.source.title
                 yt_url = ctx.voice_client.source.yt_url
                 return await ctx.send(f"✅ Paused [{title}]({yt_url})!")
@@ -268,30 +517,57 @@ class Music(commands.Cog):
                 yt_url = ctx.voice_client.source.yt_url
                 return await ctx.send(f"⚠️ Already paused [{title}]({yt_url})!")
 
-    async def _play_next(self, ctx: commands.Context):
+    async def _create_player(
+        self, session: GuildSession, audio_source: AudioSource
+    ) -> YTDLVolumeTransformer | YTDLOpusTransformer:
+        """Returns the (prefetched) audio stream of the audio source."""
+        player = session.prefetcher.take(audio_source)
+        if player is not None:
+            # Case: Audio stream is already warmed up
+            new_player = player.with_volume(session.volume)
+            if new_player is not player:
+                # Case: Warmed up ffmpeg process uses another volume
+                player.cleanup()
+            player = new_player
+        else:
+            # Case: Audio stream was not prefetched
+            await self.resolver.resolve(audio_source)
+            player = await self.transformer.from_audio_source(
+                audio_source=audio_source,
+                volume=session.volume,
+            )
+
+        if self.frame_stats:
+            # Case: Measure the timing of the frames of the audio stream
+            player.stats = FrameStats()
+        return player
+
+    async def _play_next(self, ctx: commands.Context, session: GuildSession):
         """Plays the next song in the playlist."""
-        if self.should_leave:
+        if session.should_leave:
             # Case: Bot should leave the voice channel
-            self.should_leave = False
+            session.should_leave = False
             return
 
-        if await self.playlist.empty():
+        if await session.playlist.empty():
+            # Case: Bot stopped playing
+            self.bot.dispatch("playback_update", ctx.guild)
             return await ctx.send("⚠️ The playlist no longer contains any songs!")
 
         # Play the next song
-        audio_source = await self.playlist.pop()
+        audio_source = await session.playlist.pop()
         try:
-            player = await YTDLVolumeTransformer.from_audio_source(
-                audio_source=audio_source,
-                volume=self.curr_volume,
-            )
+            player = await self._create_player(session, audio_source)
             ctx.voice_client.play(
                 player,
                 after=lambda _: asyncio.run_coroutine_threadsafe(
-                    coro=self._play_next(ctx),
+                    coro=self._play_next(ctx, session),
                     loop=self.bot.loop,
                 ),
             )
+            session.voice_client = ctx.voice_client
+            self.bot.dispatch("playback_update", ctx.guild)
+            session.prefetcher.schedule(session.playlist, session.volume)
             title = player.title
             yt_url = player.yt_url
             await ctx.send(f"✅ Next playing [{title}]({yt_url})!")
@@ -302,20 +578,7 @@ class Music(commands.Cog):
                 f"❌ Video [{title}]({yt_url}) is unavailable, trying to play next from"
                 " the playlist!"
             )
-            return await self._play_next(ctx)
-
-    async def _before_play(self, ctx: commands.Context):
-        """Checks for the play command before performing it."""
-        manager = self.bot.get_cog("Manager")
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, manager.users),
-            check_author_role_blacklisted(ctx, manager.roles),
-            check_text_channel_blacklisted(ctx, manager.text_channels),
-            check_voice_channel_blacklisted(ctx, manager.voice_channels),
-            check_author_voice_channel(ctx),
-            check_bot_voice_channel(ctx),
-            check_same_voice_channel(ctx),
-        )
+            return await self._play_next(ctx, session)
 
     @commands.command(aliases=["Play"])
     async def play(self, ctx: commands.Context):
@@ -327,8 +590,6 @@ class Music(commands.Cog):
                 The discord context
         """
         async with ctx.typing():
-            await self._before_play(ctx)
-
             if ctx.voice_client.is_playing():
                 # Case: Bot already plays music
                 title = ctx.voice_client.source.title
@@ -337,31 +598,34 @@ class Music(commands.Cog):
 
             if ctx.voice_client.is_paused():
                 # Case: Bot is paused
+                self._reset_frame_stats(ctx.voice_client)
                 ctx.voice_client.resume()
+                self.bot.dispatch("playback_update", ctx.guild)
                 title = ctx.voice_client.source.title
                 yt_url = ctx.voice_client.source.yt_url
                 return await ctx.send(f"✅ Resuming [{title}]({yt_url})!")
 
-            if await self.playlist.empty():
+            session = self.sessions.get(ctx.guild.id)
+            if await session.playlist.empty():
                 # Case: There is no music in the playlist
                 return await ctx.send(
                     "❌ Please add a song to the playlist, before using this command!"
                 )
 
             # Start playing the next song from the playlist
-            audio_source = await self.playlist.pop()
+            audio_source = await session.playlist.pop()
             try:
-                player = await YTDLVolumeTransformer.from_audio_source(
-                    audio_source=audio_source,
-                    volume=self.curr_volume,
-                )
+                player = await self._create_player(session, audio_source)
                 ctx.voice_client.play(
                     player,
                     after=lambda _: asyncio.run_coroutine_threadsafe(
-                        coro=self._play_next(ctx),
+                        coro=self._play_next(ctx, session),
                         loop=self.bot.loop,
                     ),
                 )
+                session.voice_client = ctx.voice_client
+                self.bot.dispatch("playback_update", ctx.guild)
+                session.prefetcher.schedule(session.playlist, session.volume)
                 title = player.title
                 yt_url = player.yt_url
                 await ctx.send(f"✅ Playing [{title}]({yt_url})!")
@@ -374,18 +638,35 @@ class Music(commands.Cog):
                 )
                 return await self.play(ctx)
 
-    async def _before_reset(self, ctx: commands.Context):
-        """Checks for the reset command before performing it."""
-        manager = self.bot.get_cog("Manager")
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, manager.users),
-            check_author_role_blacklisted(ctx, manager.roles),
-            check_text_channel_blacklisted(ctx, manager.text_channels),
-            check_voice_channel_blacklisted(ctx, manager.voice_channels),
-            check_author_voice_channel(ctx),
-            check_bot_voice_channel(ctx),
-            check_same_voice_channel(ctx),
-        )
+    async def _before_remove(self, ctx: commands.Context, position: int):
+        """Checks for the remove command before performing it."""
+        session = self.sessions.find(ctx.guild.id)
+        size = await session.playlist.size() if session is not None else 0
+        await check_valid_position(ctx, position, size)
+
+    @commands.command(aliases=["Remove"])
+    async def remove(self, ctx: commands.Context, position: int):
+        """
+        Removes an audio source from the playlist.
+
+        Args:
+            ctx (commands.Context):
+                The discord context
+
+            position (int):
+                The position of the audio source (as shown by show)
+        """
+        async with ctx.typing():
+            await self._before_remove(ctx, position)
+
+            session = self.sessions.get(ctx.guild.id)
+            audio_source = await session.playlist.remove(position)
+            self._reschedule_prefetch(ctx, session)
+
+            await ctx.send(
+                f"✅ Removed [{audio_source.title}]({audio_source.yt_url}) from the "
+                "playlist!"
+            )
 
     @commands.command(aliases=["Reset"])
     async def reset(self, ctx: commands.Context):
@@ -397,36 +678,25 @@ class Music(commands.Cog):
                 The discord context
         """
         async with ctx.typing():
-            await self._before_reset(ctx)
-
             # Clear the playlist
-            await self.playlist.clear()
-
-            # Reset the disconnect time
-            self.bot.get_cog("Disconnect").curr_timeout = 0
+            session = self.sessions.get(ctx.guild.id)
+            await session.playlist.clear()
+            session.prefetcher.cancel()
 
             if ctx.voice_client.is_playing() or ctx.voice_client.is_paused():
                 # Case: Bot plays/pause a song
                 ctx.voice_client.stop()
+            self.bot.dispatch("playback_update", ctx.guild)
 
             await ctx.send("✅ Reset playlist!")
 
-    async def _before_show(self, ctx: commands.Context, n: int):
+    async def _before_show(self, ctx: commands.Context, n: int, page: int):
         """Checks for the show command before performing it."""
-        manager = self.bot.get_cog("Manager")
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, manager.users),
-            check_author_role_blacklisted(ctx, manager.roles),
-            check_text_channel_blacklisted(ctx, manager.text_channels),
-            check_voice_channel_blacklisted(ctx, manager.voice_channels),
-            check_author_voice_channel(ctx),
-            check_bot_voice_channel(ctx),
-            check_same_voice_channel(ctx),
-            check_valid_n(ctx, n),
-        )
+        await check_valid_n(ctx, n)
+        await check_valid_page(ctx, page)
 
     @commands.command(aliases=["Show"])
-    async def show(self, ctx: commands.Context, n: int = 5):
+    async def show(self, ctx: commands.Context, n: int = 5, page: int = 1):
         """
         Shows the audio sources from the playlist.
 
@@ -435,12 +705,21 @@ class Music(commands.Cog):
                 The discord context
 
             n (int):
-                The number of audio sources to show
+                The number of audio sources to show per page
+
+            page (int):
+                The page of the playlist to show
         """
         async with ctx.typing():
-            await self._before_show(ctx, n)
-
-            embed = discord.Embed(title="🎶 Playlist 🎶", color=discord.Color.blue())
+            await self._before_show(ctx, n, page)
+
+            session = self.sessions.get(ctx.guild.id)
+            size = await session.playlist.size()
+            pages = max(1, math.ceil(size / n)) if n > 0 else 1
+            embed = discord.Embed(
+                title=f"🎶 Playlist 🎶 (Page {page}/{pages})",
+                color=discord.Color.blue(),
+            )
 
             if ctx.voice_client.is_playing() or ctx.voice_client.is_paused():
                 # Case: Bot plays/pause a song
@@ -453,10 +732,9 @@ class Music(commands.Cog):
                     inline=False,
                 )
 
-            async for i, audio_source in self.playlist.iterate():
-                if i >= n:
-                    # Case: Number of audio sources to show is reached
-                    break
+            offset = (page - 1) * n
+            audio_sources = await session.playlist.peek(n, offset=offset)
+            for i, audio_source in enumerate(audio_sources, offset):
                 user = audio_source.user
                 title = audio_source.title
                 yt_url = audio_source.yt_url
@@ -468,20 +746,6 @@ class Music(commands.Cog):
 
             await ctx.send(embed=embed)
 
-    async def _before_skip(self, ctx: commands.Context):
-        """Checks for the skip command before performing it."""
-        manager = self.bot.get_cog("Manager")
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, manager.users),
-            check_author_role_blacklisted(ctx, manager.roles),
-            check_text_channel_blacklisted(ctx, manager.text_channels),
-            check_voice_channel_blacklisted(ctx, manager.voice_channels),
-            check_author_voice_channel(ctx),
-            check_bot_voice_channel(ctx),
-            check_same_voice_channel(ctx),
-            check_bot_streaming(ctx),
-        )
-
     @commands.command(aliases=["Skip"])
     async def skip(self, ctx: commands.Context):
         """
@@ -492,21 +756,72 @@ class Music(commands.Cog):
                 The discord context
         """
         async with ctx.typing():
-            await self._before_skip(ctx)
-
             # Calls the after function (_play_next) of the couroutine
             ctx.voice_client.stop()
 
+    @commands.command(aliases=["Stats"])
+    async def stats(self, ctx: commands.Context):
+        """
+        Shows the timing of the audio frames of the currently played audio source.
+
+        Args:
+            ctx (commands.Context):
+                The discord context
+        """
+        async with ctx.typing():
+            source = ctx.voice_client.source
+            stats = getattr(source, "stats", None)
+            if stats is None:
+                # Case: Frames are not measured
+                return await ctx.send(
+                    "❌ Please enable frame_stats in the config, before using this "
+                    "command!"
+                )
+
+            def interval(q: float) -> str:
+                bound, above = stats.percentile(q)
+                return f"{'>' if above else '≤'} {bound * 1000:.0f} ms"
+
+            embed = discord.Embed(
+                title=f"📊 Frame timing of {source.title}",
+                url=source.yt_url,
+                color=discord.Color.blue(),
+            )
+            embed.add_field(name="Frames", value=str(stats.frames))
+            embed.add_field(name="Late frames", value=str(stats.late))
+            embed.add_field(name="Buffer underruns", value=str(stats.underruns))
+            embed.add_field(name="p50 interval", value=interval(50))
+            embed.add_field(name="p99 interval", value=interval(99))
+            embed.add_field(name="CPU time", value=f"{stats.cpu_time * 1000:.0f} ms")
+            await ctx.send(embed=embed)
+
+    def _reset_frame_stats(self, voice_client: discord.VoiceClient):
+        """Restarts the frame timing, after the audio stream paused or changed."""
+        stats = getattr(voice_client.source, "stats", None)
+        if stats is not None:
+            stats.reset()
+
+    def _change_volume(self, voice_client: discord.VoiceClient, volume: int):
+        """Changes the volume of the audio stream that is currently played."""
+        source = voice_client.source
+        player = source.with_volume(volume)
+        if player is source:
+            # Case: Volume is applied to the same audio stream
+            return
+
+        # Case: Audio stream was restarted with the new volume
+        paused = voice_client.is_paused()
+        voice_client.source = player
+        self._reset_frame_stats(voice_client)
+        if paused:
+            # Case: Swapping the audio stream resumes the player
+            voice_client.pause()
+        # The player thread may still read the old audio stream once
+        self.bot.loop.call_later(1, source.cleanup)
+
     async def _before_volume(self, ctx: commands.Context, volume: int):
         """Checks for the volume command before performing it."""
-        manager = self.bot.get_cog("Manager")
-        await asyncio.gather(
-            check_author_id_blacklisted(ctx, manager.users),
-            check_author_role_blacklisted(ctx, manager.roles),
-            check_text_channel_blacklisted(ctx, manager.text_channels),
-            check_voice_channel_blacklisted(ctx, manager.voice_channels),
-            check_valid_volume(ctx, volume),
-        )
+        await check_valid_volume(ctx, volume)
 
     @commands.command(aliases=["Volume"])
     async def volume(self, ctx: commands.Context, volume: int):
@@ -523,14 +838,17 @@ class Music(commands.Cog):
         async with ctx.typing():
             await self._before_volume(ctx, volume)
 
-            if self.curr_volume != volume:
+            session = self.sessions.get(ctx.guild.id)
+            if session.volume != volume:
                 # Case: New volume is not the same as before
-                self.curr_volume = volume
+                session.volume = volume
+                if self.journal is not None:
+                    self.journal.record(ctx.guild.id, "volume", volume)
                 if ctx.voice_client and (
                     ctx.voice_client.is_playing() or ctx.voice_client.is_paused()
                 ):
                     # Case: Bot plays/pause a song
-                    ctx.voice_client.source.volume = self.curr_volume / 100
-                return await ctx.send(f"✅ Changed volume to {self.curr_volume}!")
+                    self._change_volume(ctx.voice_client, session.volume)
+                return await ctx.send(f"✅ Changed volume to {session.volume}!")
             # Case: New volume is the same as before
-            return await ctx.send(f"⚠️ Already using volume of {self.curr_volume}!")
+            return await ctx.send(f"⚠️ Already using volume of {session.volume}!")
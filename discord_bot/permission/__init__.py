@@ -0,0 +1,6 @@
+from discord_bot.permission.index import PermissionIndex
+
+
+__all__ = ["PermissionIndex"]
+
+assert __all__ == sorted(__all__), f"__all__ needs to be sorted into {sorted(__all__)}!"
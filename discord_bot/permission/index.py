@@ -0,0 +1,152 @@
+import sys
+from typing import Dict, FrozenSet, List
+
+import discord
+
+# Rank of a command without blacklisted roles (lower than every role)
+UNRANKED = sys.maxsize
+
+
+class PermissionIndex:
+    """
+    Represents a precomputed index of the blacklists for each command.
+
+    The blacklisted IDs are stored as frozensets per command, so that each check is a
+    single lookup. The ranks of the roles are cached per Discord Server together with
+    the rank of the highest blacklisted role per command, so that the role check
+    does not need to scan the roles of the Discord Server.
+
+    The frozensets need to be refreshed after the blacklists were edited and the
+    ranks need to be invalidated after the roles of a Discord Server have changed.
+
+    Attributes:
+        users (Dict[str, FrozenSet[int]]):
+            The blacklisted users for each command
+
+        roles (Dict[str, FrozenSet[int]]):
+            The blacklisted roles for each command
+
+        text_channels (Dict[str, FrozenSet[int]]):
+            The blacklisted text channels for each command
+
+        voice_channels (Dict[str, FrozenSet[int]]):
+            The blacklisted voice channels for each command
+    """
+
+    def __init__(
+        self,
+        users: Dict[str, List[int]],
+        roles: Dict[str, List[int]],
+        text_channels: Dict[str, List[int]],
+        voice_channels: Dict[str, List[int]],
+    ):
+        self._blacklists = {
+            "users": users,
+            "roles": roles,
+            "text_channels": text_channels,
+            "voice_channels": voice_channels,
+        }
+        self.users: Dict[str, FrozenSet[int]] = {}
+        self.roles: Dict[str, FrozenSet[int]] = {}
+        self.text_channels: Dict[str, FrozenSet[int]] = {}
+        self.voice_channels: Dict[str, FrozenSet[int]] = {}
+
+        # Rank of each role and of the highest blacklisted role per command
+        self._ranks: Dict[int, Dict[int, int]] = {}
+        self._thresholds: Dict[int, Dict[str, int]] = {}
+
+        for blacklist in self._blacklists:
+            self.refresh(blacklist)
+
+    def refresh(self, blacklist: str):
+        """
+        Rebuilds the index of a blacklist after it was edited.
+
+        Args:
+            blacklist (str):
+                The edited blacklist, either "users", "roles", "text_channels" or
+                "voice_channels"
+        """
+        if blacklist not in self._blacklists:
+            raise ValueError(f"blacklist needs to be one of {list(self._blacklists)}!")
+
+        index = {
+            cmd: frozenset(ids) for cmd, ids in self._blacklists[blacklist].items()
+        }
+        setattr(self, blacklist, index)
+        if blacklist == "roles":
+            # Case: Highest blacklisted roles need to be recomputed
+            self._thresholds.clear()
+
+    def invalidate(self, guild_id: int):
+        """Drops the cached ranks of the roles of a Discord Server."""
+        self._ranks.pop(guild_id, None)
+        self._thresholds.pop(guild_id, None)
+
+    def ranks(self, guild: discord.Guild) -> Dict[int, int]:
+        """
+        Returns the (cached) ranks of the roles of a Discord Server.
+
+        Args:
+            guild (discord.Guild):
+                The Discord Server
+
+        Returns:
+            Dict[int, int]:
+                The rank of each role, where lower values represents higher roles
+        """
+        ranks = self._ranks.get(guild.id)
+        if ranks is None:
+            # Case: Roles of the Discord Server are not cached (anymore)
+            ranks = {role.id: rank for rank, role in enumerate(reversed(guild.roles))}
+            self._ranks[guild.id] = ranks
+        return ranks
+
+    def user_blacklisted(self, command: str, user_id: int) -> bool:
+        """Checks whether the user is blacklisted for the command."""
+        return user_id in self.users[command]
+
+    def role_blacklisted(
+        self, guild: discord.Guild, command: str, role_id: int
+    ) -> bool:
+        """
+        Checks whether the role is blacklisted for the command.
+
+        A role is blacklisted, if it is lower than or equal to the highest
+        blacklisted role of the command.
+
+        Args:
+            guild (discord.Guild):
+                The Discord Server of the role
+
+            command (str):
+                The name of the command
+
+            role_id (int):
+                The ID of the (highest) role of the author
+
+        Returns:
+            bool:
+                True if the role is blacklisted
+        """
+        ranks = self.ranks(guild)
+        thresholds = self._thresholds.get(guild.id)
+        if thresholds is None:
+            # Case: Highest blacklisted roles are not cached (anymore)
+            thresholds = {
+                cmd: min(
+                    (ranks[role] for role in roles if role in ranks), default=UNRANKED
+                )
+                for cmd, roles in self.roles.items()
+            }
+            self._thresholds[guild.id] = thresholds
+        rank = ranks.get(role_id)
+        return rank is not None and rank >= thresholds[command]
+
+    def text_channel_blacklisted(self, command: str, text_channel_id: int) -> bool:
+        """Checks whether the text channel is blacklisted for the command."""
+        return text_channel_id in self.text_channels[command]
+
+    def voice_channel_blacklisted(self, command: str, voice_channel_id: int) -> bool:
+        """Checks whether the voice channel is blacklisted for the command."""
+        return voice_channel_id in self.voice_channels[command]
@@ -0,0 +1,7 @@
+from discord_bot.session.journal import SessionJournal
+from discord_bot.session.registry import GuildSession, SessionRegistry
+
+
+__all__ = ["GuildSession", "SessionJournal", "SessionRegistry"]
+
+assert __all__ == sorted(__all__), f"__all__ needs to be sorted into {sorted(__all__)}!"
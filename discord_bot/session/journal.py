@@ -0,0 +1,233 @@
+import asyncio
+import json
+import logging
+import os
+from typing import IO, Any, Dict, Tuple
+
+from discord_bot.audio import AudioSource
+from discord_bot.session.registry import GuildSession, SessionRegistry
+
+logger = logging.getLogger("discord")
+
+
+def _encode(audio_source: AudioSource) -> Dict[str, Any]:
+    """Returns the persistent fields of an audio source (without the stream)."""
+    return {
+        "title": audio_source.title,
+        "user": audio_source.user,
+        "yt_url": audio_source.yt_url,
+        "priority": audio_source.priority,
+    }
+
+
+class SessionJournal:
+    """
+    Represents the durable playback states (playlist and volume) of all sessions.
+
+    Every mutation is appended as a single JSON line to the journal file. After
+    compact_every mutations, the journal file is rotated (path + ".old") and the
+    current states are written into the snapshot file (path + ".snapshot") by an
+    executor, so that the event loop does not wait for the disk. The rotated journal
+    file is removed, once the snapshot is durable. On startup, the snapshot is loaded
+    and the remaining mutations are replayed on top of it.
+
+    Audio streams are not persisted, so that they are resolved lazily before playing,
+    instead of extracting every audio source again on startup.
+
+    Attributes:
+        path (str):
+            The path of the journal file
+
+        compact_every (int):
+            The number of journaled mutations after the states are compacted
+    """
+
+    def __init__(self, path: str, compact_every: int = 1000):
+        if compact_every <= 0:
+            raise ValueError("compact_every needs to be higher than 0!")
+
+        self.path = path
+        self.snapshot_path = f"{path}.snapshot"
+        self.old_path = f"{path}.old"
+        self.compact_every = compact_every
+        self._sessions: SessionRegistry | None = None
+        self._file: IO[str] | None = None
+        self._compaction: asyncio.Future | None = None
+        self._records = 0
+        self._restoring = False
+
+    def record(self, guild_id: int, operation: str, *args):
+        """
+        Appends a mutation of a session to the journal.
+
+        Args:
+            guild_id (int):
+                The ID of the Discord Server
+
+            operation (str):
+                The name of the mutation (e.g. "add", "pop", "volume" or "evict")
+
+            args:
+                The arguments of the mutation
+        """
+        if self._restoring or self._file is None:
+            # Case: Mutation is replayed or the journal is closed
+            return
+
+        args = [_encode(arg) if isinstance(arg, AudioSource) else arg for arg in args]
+        self._file.write(json.dumps([guild_id, operation, *args]) + "\n")
+        self._file.flush()
+        self._records += 1
+        if self._records >= self.compact_every:
+            # Case: Keep the replay on startup short
+            self.compact()
+
+    async def restore(self, sessions: SessionRegistry) -> int:
+        """
+        Rebuilds the sessions from the snapshot and the journal.
+
+        Args:
+            sessions (SessionRegistry):
+                The registry whose sessions are journaled from now on
+
+        Returns:
+            int:
+                The number of restored audio sources
+        """
+        self._sessions = sessions
+        self._restoring = True
+        try:
+            if os.path.exists(self.snapshot_path):
+                with open(self.snapshot_path, "r", encoding="utf-8") as file:
+                    snapshot = json.load(file)
+                for guild_id, state in snapshot.items():
+                    session = sessions.get(int(guild_id))
+                    session.volume = state["volume"]
+                    for data in state["playlist"]:
+                        await self._replay(session, "add", data)
+
+            # The rotated journal exists, if the bot stopped during a compaction
+            for path in (self.old_path, self.path):
+                if not os.path.exists(path):
+                    continue
+                with open(path, "r", encoding="utf-8") as file:
+                    for line in file:
+                        try:
+                            guild_id, operation, *args = json.loads(line)
+                        except ValueError:
+                            # Case: Last line was not completely written
+                            logger.warning("Skipped corrupted journal entry!")
+                            continue
+                        if operation == "evict":
+                            # Case: Session was discarded (e.g. the bot was kicked)
+                            sessions.evict(guild_id)
+                            continue
+                        await self._replay(sessions.get(guild_id), operation, *args)
+        finally:
+            self._restoring = False
+
+        # Start with an empty journal
+        await self._checkpoint()
+        self._file = open(self.path, "w", encoding="utf-8")
+        restored = 0
+        for session in sessions:
+            restored += await session.playlist.size()
+        return restored
+
+    async def _replay(self, session: GuildSession, operation: str, *args):
+        """Applies a journaled mutation to a session."""
+        try:
+            if operation == "volume":
+                session.volume = args[0]
+            elif operation == "add":
+                await session.playlist.add(AudioSource(**args[0]))
+            elif operation == "pop":
+                await session.playlist.pop()
+            elif operation == "remove":
+                await session.playlist.remove(*args)
+            elif operation == "move":
+                await session.playlist.move(*args)
+            elif operation == "dedupe":
+                await session.playlist.dedupe()
+            elif operation == "clear":
+                await session.playlist.clear()
+        except (IndexError, ValueError):
+            # Case: Mutation does not fit (e.g. the playlist size was lowered)
+            logger.warning("Could not replay %s of %s!", operation, session.guild_id)
+
+    def compact(self):
+        """
+        Rotates the journal and writes the current states into the snapshot.
+
+        The snapshot is written in the background. Mutations in the meantime are
+        appended to the new journal file, so that they survive a crash during the
+        write.
+        """
+        if self._sessions is None or self._file is None:
+            # Case: Journal is not restored or already closed
+            return
+        if self._compaction is not None:
+            # Case: Last compaction is still running
+            return
+
+        snapshot = self._snapshot()
+        self._file.close()
+        os.replace(self.path, self.old_path)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._records = 0
+        self._compaction = asyncio.get_running_loop().run_in_executor(
+            None, self._write, snapshot, (self.old_path,)
+        )
+        self._compaction.add_done_callback(self._compacted)
+
+    def _compacted(self, future: asyncio.Future):
+        """Logs the failure of a compaction."""
+        self._compaction = None
+        if not future.cancelled() and future.exception() is not None:
+            # Case: Rotated journal is kept and replayed on startup
+            logger.error("Could not compact the journal!", exc_info=future.exception())
+
+    async def _checkpoint(self):
+        """Writes the current states into the snapshot and removes the journal."""
+        if self._compaction is not None:
+            # Failures of the last compaction are logged by _compacted()
+            await asyncio.wait([self._compaction])
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write, self._snapshot(), (self.old_path, self.path)
+        )
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Returns the current states of all sessions."""
+        return {
+            str(session.guild_id): {
+                "volume": session.volume,
+                "playlist": [_encode(item) for item in session.playlist.snapshot()],
+            }
+            for session in self._sessions
+        }
+
+    def _write(self, snapshot: Dict[str, Any], journal_paths: Tuple[str, ...]):
+        """Writes the snapshot durably and removes the included journal files."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Replace the snapshot atomically, before the journal gets removed
+        temp_path = f"{self.snapshot_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(snapshot, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+        for path in journal_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    async def close(self):
+        """Compacts the states and closes the journal file."""
+        if self._sessions is not None:
+            await self._checkpoint()
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator
+
+import discord
+
+from discord_bot.audio import Playlist
+from discord_bot.transformer import Prefetcher
+
+
+@dataclass
+class GuildSession:
+    """
+    Represents the playback state of the bot in a single Discord Server.
+
+    Attributes:
+        guild_id (int):
+            The ID of the Discord Server
+
+        playlist (Playlist):
+            The playlist of the Discord Server
+
+        prefetcher (Prefetcher):
+            The prefetcher of the next audio sources in the playlist
+
+        volume (int):
+            The volume with a value in between of 0 and 100
+
+        should_leave (bool):
+            Whether the bot should leave the voice channel after the current song
+
+        voice_client (discord.VoiceClient | None):
+            The voice client of the bot in the Discord Server
+    """
+
+    guild_id: int
+    playlist: Playlist
+    prefetcher: Prefetcher
+    volume: int
+    should_leave: bool = False
+    voice_client: discord.VoiceClient | None = None
+
+
+class SessionRegistry:
+    """
+    Represents the registry of the playback states of all active Discord Servers.
+
+    Sessions are created lazily on first use and evicted when the Discord Server goes
+    idle, so that the memory grows with the number of active Discord Servers.
+
+    Attributes:
+        factory (Callable[[int], GuildSession]):
+            The function to create a new session given the ID of the Discord Server
+
+        on_evict (Callable[[int], None] | None):
+            The function to call with the ID of the Discord Server, whose session was
+            evicted (e.g. to journal the eviction)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[int], GuildSession],
+        on_evict: Callable[[int], None] | None = None,
+    ):
+        self.factory = factory
+        self.on_evict = on_evict
+        self._sessions: Dict[int, GuildSession] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __iter__(self) -> Iterator[GuildSession]:
+        # Copy the sessions, so that they can be evicted while iterating
+        return iter(list(self._sessions.values()))
+
+    def get(self, guild_id: int) -> GuildSession:
+        """Returns the session of the Discord Server and creates it if necessary."""
+        session = self._sessions.get(guild_id)
+        if session is None:
+            # Case: Discord Server has no active session
+            session = self.factory(guild_id)
+            self._sessions[guild_id] = session
+        return session
+
+    def find(self, guild_id: int) -> GuildSession | None:
+        """Returns the session of the Discord Server without creating it."""
+        return self._sessions.get(guild_id)
+
+    def evict(self, guild_id: int) -> GuildSession | None:
+        """Removes the session of the Discord Server and stops its prefetching."""
+        session = self._sessions.pop(guild_id, None)
+        if session is not None:
+            session.prefetcher.cancel()
+            if self.on_evict is not None:
+                self.on_evict(guild_id)
+        return session
+
+    def clear(self):
+        """Removes the sessions of all Discord Servers."""
+        for session in self:
+            self.evict(session.guild_id)
@@ -1,6 +1,14 @@
+from discord_bot.transformer.opus_transformer import YTDLOpusTransformer
+from discord_bot.transformer.prefetcher import Prefetcher
+from discord_bot.transformer.stats import FrameStats
 from discord_bot.transformer.ytdl_transformer import YTDLVolumeTransformer
 
 
-__all__ = ["YTDLVolumeTransformer"]
+__all__ = [
+    "FrameStats",
+    "Prefetcher",
+    "YTDLOpusTransformer",
+    "YTDLVolumeTransformer",
+]
 
 assert __all__ == sorted(__all__), f"__all__ needs to be sorted into {sorted(__all__)}!"
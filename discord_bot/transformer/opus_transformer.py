@@ -0,0 +1,170 @@
+import discord
+
+from discord_bot.audio import AudioSource
+from discord_bot.transformer.stats import FrameStats
+from discord_bot.transformer.ytdl_transformer import ffmpeg_options
+
+# Duration in seconds of each Opus packet
+PACKET_DURATION = discord.opus.Encoder.FRAME_LENGTH / 1000
+
+# Codecs that can be passed through without re-encoding them
+OPUS_CODECS = {"opus", "libopus"}
+
+
+class YTDLOpusTransformer(discord.FFmpegOpusAudio):
+    """
+    Represents an Opus audio stream of a YouTube video that can be played by a
+    discord bot.
+
+    If the YouTube video is already Opus encoded and the volume is at 100, ffmpeg only
+    copies the Opus packets. Otherwise, ffmpeg applies the volume and encodes the
+    audio stream to Opus itself, so that discord.py never touches the raw PCM.
+
+    Attributes:
+        title (str):
+            The title of the YouTube video
+
+        user (str):
+            The user who requested the audio stream
+
+        yt_url (str):
+            The URL of the YouTube video
+
+        audio_url (str):
+            The URL of the audio stream
+
+        priority (int):
+            The priority of the audio source
+
+        codec (str | None):
+            The audio codec of the audio stream
+
+        volume (float):
+            The volume of the audio stream with a value in between of 0.0 and 1.0
+
+        offset (float):
+            The time in seconds where the audio stream starts
+
+        stats (FrameStats | None):
+            The timing of the read frames (None disables measuring it)
+    """
+
+    stats: FrameStats | None = None
+
+    def __init__(
+        self,
+        *,
+        title: str,
+        user: str,
+        yt_url: str,
+        audio_url: str,
+        priority: int,
+        codec: str | None,
+        volume: int,
+        offset: float = 0.0,
+    ):
+        before_options = ffmpeg_options["before_options"]
+        options = ffmpeg_options["options"]
+        if offset > 0:
+            # Case: Continue the audio stream at the given offset
+            before_options += f" -ss {offset:.3f}"
+        if volume != 100:
+            # Case: Apply the volume while encoding the audio stream
+            options += f" -filter:a volume={volume / 100:.2f}"
+
+        super().__init__(
+            audio_url,
+            codec=codec if volume == 100 and codec in OPUS_CODECS else None,
+            before_options=before_options,
+            options=options,
+        )
+        self.title = title
+        self.user = user
+        self.yt_url = yt_url
+        self.audio_url = audio_url
+        self.priority = priority
+        self.codec = codec
+        self.offset = offset
+        self._volume = volume
+        self._packets = 0
+
+    @property
+    def volume(self) -> float:
+        """Returns the volume as a floating point percentage (e.g. 1.0 for 100%)."""
+        return self._volume / 100
+
+    @property
+    def elapsed(self) -> float:
+        """Returns the time in seconds that was played of the audio stream."""
+        return self.offset + self._packets * PACKET_DURATION
+
+    def read(self) -> bytes:
+        if self.stats is None:
+            data = super().read()
+        else:
+            data = self.stats.measure(super().read)
+        if data:
+            self._packets += 1
+        return data
+
+    def with_volume(self, volume: int) -> "YTDLOpusTransformer":
+        """
+        Returns the audio stream with another volume.
+
+        The volume is part of the ffmpeg process, so that a new ffmpeg process is
+        started at the current position of the audio stream.
+
+        Args:
+            volume (int):
+                The new volume of the audio stream
+
+        Returns:
+            YTDLOpusTransformer:
+                The audio stream with the new volume
+        """
+        if volume == self._volume:
+            # Case: Volume has not changed
+            return self
+        player = YTDLOpusTransformer(
+            title=self.title,
+            user=self.user,
+            yt_url=self.yt_url,
+            audio_url=self.audio_url,
+            priority=self.priority,
+            codec=self.codec,
+            volume=volume,
+            offset=self.elapsed,
+        )
+        # Keep measuring the frames of the same audio stream
+        player.stats = self.stats
+        return player
+
+    @classmethod
+    async def from_audio_source(
+        cls,
+        audio_source: AudioSource,
+        volume: int,
+    ) -> "YTDLOpusTransformer":
+        """
+        Construct a YTDLOpusTransformer given the audio source.
+
+        Args:
+            audio_source (AudioSource):
+                The audio source to stream
+
+            volume (int):
+                The volume of the audio source
+
+        Returns:
+            YTDLOpusTransformer:
+                The audio stream of the YouTube video
+        """
+        return cls(
+            title=audio_source.title,
+            user=audio_source.user,
+            yt_url=audio_source.yt_url,
+            audio_url=audio_source.stream_url,
+            priority=audio_source.priority,
+            codec=audio_source.codec,
+            volume=volume,
+        )
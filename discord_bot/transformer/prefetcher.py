@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from typing import Tuple, Type
+
+import yt_dlp
+
+from discord_bot.audio import AudioSource, Playlist, StreamResolver
+from discord_bot.transformer.opus_transformer import YTDLOpusTransformer
+from discord_bot.transformer.ytdl_transformer import YTDLVolumeTransformer
+
+logger = logging.getLogger("discord")
+
+
+class Prefetcher:
+    """
+    Prefetches the next audio sources of a playlist while the current one is played.
+
+    The stream URLs of the next depth audio sources are resolved and the ffmpeg
+    process of the next audio source is started ahead of time, so that the next
+    audio source starts playing without a gap.
+
+    Attributes:
+        resolver (StreamResolver):
+            The resolver of the stream URLs
+
+        depth (int):
+            The number of next audio sources to resolve (0 disables prefetching)
+
+        transformer (Type[YTDLVolumeTransformer | YTDLOpusTransformer]):
+            The type of the prefetched audio stream
+    """
+
+    def __init__(
+        self,
+        resolver: StreamResolver,
+        depth: int = 1,
+        transformer: Type[
+            YTDLVolumeTransformer | YTDLOpusTransformer
+        ] = YTDLVolumeTransformer,
+    ):
+        if depth < 0:
+            raise ValueError("depth needs to be higher than or equal to 0!")
+
+        self.resolver = resolver
+        self.depth = depth
+        self.transformer = transformer
+        self._task: asyncio.Task | None = None
+        self._warm: (
+            Tuple[AudioSource, YTDLVolumeTransformer | YTDLOpusTransformer] | None
+        ) = None
+
+    @property
+    def warm(self) -> bool:
+        """Returns whether an audio stream is warmed up."""
+        return self._warm is not None
+
+    def schedule(self, playlist: Playlist, volume: int):
+        """
+        (Re-)starts prefetching the next audio sources of the playlist.
+
+        Args:
+            playlist (Playlist):
+                The playlist to prefetch from
+
+            volume (int):
+                The volume of the prefetched audio stream
+        """
+        if self._task is not None:
+            self._task.cancel()
+        if self.depth > 0:
+            self._task = asyncio.create_task(self._prefetch(playlist, volume))
+
+    async def _prefetch(self, playlist: Playlist, volume: int):
+        """Resolves the next audio sources and warms up the ffmpeg process."""
+        audio_sources = await playlist.peek(self.depth)
+        for audio_source in audio_sources:
+            try:
+                await self.resolver.resolve(audio_source)
+            except yt_dlp.utils.YoutubeDLError:
+                # Case: Video is unavailable - it gets reported when it is played
+                logger.warning("Could not prefetch %s!", audio_source.yt_url)
+
+        if self._warm is not None:
+            if audio_sources and self._warm[0] is audio_sources[0]:
+                # Case: Next audio source is already warmed up
+                return
+            # Case: Next audio source has changed
+            self._discard()
+
+        if audio_sources and not self.resolver.expired(audio_sources[0]):
+            self._warm = (
+                audio_sources[0],
+                await self.transformer.from_audio_source(
+                    audio_source=audio_sources[0],
+                    volume=volume,
+                ),
+            )
+
+    def take(
+        self, audio_source: AudioSource
+    ) -> YTDLVolumeTransformer | YTDLOpusTransformer | None:
+        """
+        Returns the prefetched audio stream of the audio source.
+
+        Args:
+            audio_source (AudioSource):
+                The audio source that gets played next
+
+        Returns:
+            YTDLVolumeTransformer | YTDLOpusTransformer | None:
+                The warmed up audio stream or None if it was not prefetched
+        """
+        if self._warm is not None and self._warm[0] is audio_source:
+            # Case: Audio source was prefetched
+            player = self._warm[1]
+            self._warm = None
+            return player
+        self.cancel()
+        return None
+
+    def cancel(self):
+        """Stops prefetching and discards the warmed up audio stream."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._discard()
+
+    def _discard(self):
+        """Terminates the ffmpeg process of the warmed up audio stream."""
+        if self._warm is not None:
+            self._warm[1].cleanup()
+            self._warm = None
@@ -0,0 +1,124 @@
+import bisect
+import time
+from typing import Callable, Tuple
+
+from discord_bot.util.metrics import (
+    FRAME_INTERVAL_SECONDS,
+    LATE_FRAMES,
+    STREAM_CPU_SECONDS,
+    UNDERRUNS,
+)
+
+# Time in seconds of a single audio frame, that discord.py reads every 20 ms
+FRAME_DURATION = 0.02
+
+# Time in seconds between two reads, after a frame counts as late
+LATE_THRESHOLD = 2 * FRAME_DURATION
+
+# Upper bounds of the buckets of the time between two reads in seconds
+INTERVAL_BUCKETS = FRAME_INTERVAL_SECONDS.buckets
+
+
+class FrameStats:
+    """
+    Represents the timing of the frames read from a single audio stream.
+
+    The time between two reads is counted into fixed buckets, so that the memory
+    does not grow with the length of the audio stream. A read that blocks for longer
+    than a frame is counted as buffer underrun (ffmpeg did not deliver in time) and
+    a gap of more than LATE_THRESHOLD between two reads is counted as late frame
+    (the player thread was stalled). Pausing or swapping the audio stream needs to
+    reset the measurement, so that the gap is not counted as late frame.
+
+    Attributes:
+        frames (int):
+            The number of read frames
+
+        late (int):
+            The number of frames, that were read too late
+
+        underruns (int):
+            The number of reads, that blocked for longer than a frame
+
+        cpu_time (float):
+            The CPU time in seconds of the player thread spent reading the frames
+
+        intervals (List[int]):
+            The counts of the time between two reads in each bucket (the last bucket
+            counts everything above INTERVAL_BUCKETS)
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.late = 0
+        self.underruns = 0
+        self.cpu_time = 0.0
+        self.intervals = [0] * (len(INTERVAL_BUCKETS) + 1)
+        self._last: float | None = None
+
+    def measure(self, read: Callable[[], bytes]) -> bytes:
+        """
+        Reads the next frame and records its timing.
+
+        Args:
+            read (Callable[[], bytes]):
+                The function to read the next frame
+
+        Returns:
+            bytes:
+                The read frame
+        """
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        data = read()
+        end = time.perf_counter()
+        cpu_time = time.thread_time() - cpu_start
+
+        self.frames += 1
+        self.cpu_time += cpu_time
+        STREAM_CPU_SECONDS.inc(value=cpu_time)
+        if end - start > FRAME_DURATION:
+            # Case: Read blocked until ffmpeg delivered the frame
+            self.underruns += 1
+            UNDERRUNS.inc()
+        if self._last is not None:
+            interval = start - self._last
+            self.intervals[bisect.bisect_left(INTERVAL_BUCKETS, interval)] += 1
+            FRAME_INTERVAL_SECONDS.observe(interval)
+            if interval > LATE_THRESHOLD:
+                # Case: Player thread did not read the frame in time
+                self.late += 1
+                LATE_FRAMES.inc()
+        self._last = start
+        return data
+
+    def reset(self):
+        """Restarts measuring the time between two reads (e.g. after a pause)."""
+        self._last = None
+
+    def percentile(self, q: float) -> Tuple[float, bool]:
+        """
+        Returns the upper bound of the bucket, that contains the q-th percentile.
+
+        Args:
+            q (float):
+                The percentile in between of 0 and 100
+
+        Returns:
+            Tuple[float, bool]:
+                The upper bound in seconds and whether it is above all buckets
+        """
+        if q < 0 or q > 100:
+            raise ValueError("q needs to be in between of 0 and 100!")
+
+        total = sum(self.intervals)
+        if total == 0:
+            # Case: Less than two frames were read
+            return 0.0, False
+
+        cumulative = 0
+        for i, count in enumerate(self.intervals[:-1]):
+            cumulative += count
+            if cumulative >= total * q / 100:
+                return INTERVAL_BUCKETS[i], False
+        return INTERVAL_BUCKETS[-1], True
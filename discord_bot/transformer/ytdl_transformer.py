@@ -1,6 +1,7 @@
 import discord
 
 from discord_bot.audio import AudioSource
+from discord_bot.transformer.stats import FrameStats
 
 # Options for ffmpeg
 ffmpeg_options = {
@@ -34,8 +35,13 @@ class YTDLVolumeTransformer(discord.PCMVolumeTransformer):
 
         volume (int):
             The volume of the audio source
+
+        stats (FrameStats | None):
+            The timing of the read frames (None disables measuring it)
     """
 
+    stats: FrameStats | None = None
+
     def __init__(
         self,
         source: discord.AudioSource,
@@ -54,6 +60,26 @@ class YTDLVolumeTransformer(discord.PCMVolumeTransformer):
         self.audio_url = audio_url
         self.priority = priority
 
+    def read(self) -> bytes:
+        if self.stats is None:
+            return super().read()
+        return self.stats.measure(super().read)
+
+    def with_volume(self, volume: int) -> "YTDLVolumeTransformer":
+        """
+        Returns the audio stream with another volume.
+
+        Args:
+            volume (int):
+                The new volume of the audio stream
+
+        Returns:
+            YTDLVolumeTransformer:
+                The same audio stream with the new volume
+        """
+        self.volume = volume / 100
+        return self
+
     @classmethod
     async def from_audio_source(
         cls,
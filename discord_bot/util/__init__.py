@@ -1,7 +1,15 @@
+from .config import ConfigStore
+from .pages import PageView, paginate, send_pages
 from .strings import remove_emojis, truncate
+from .watchdog import LoopWatchdog
 
 __all__ = [
+    "ConfigStore",
+    "LoopWatchdog",
+    "PageView",
+    "paginate",
     "remove_emojis",
+    "send_pages",
     "truncate",
 ]
 
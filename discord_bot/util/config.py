@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import os
+import tempfile
+from typing import Any, Callable, Dict
+
+import yaml
+
+logger = logging.getLogger("discord")
+
+# Use the C implementation of libyaml, if PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_BaseDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+class Dumper(_BaseDumper):
+    """Writes shared objects (e.g. blacklists of all commands) without aliases."""
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+    def represent_list(self, data: list) -> yaml.Node:
+        # Keep lists of IDs in a single line, e.g. "play: [1, 2]"
+        return self.represent_sequence("tag:yaml.org,2002:seq", data, flow_style=True)
+
+
+Dumper.add_representer(list, Dumper.represent_list)
+
+
+class ConfigStore:
+    """
+    Represents the configuration file of the bot.
+
+    Changes to the loaded configuration are written back after delay seconds, so
+    that several changes in a row are coalesced into a single write. The file is
+    replaced atomically (temporary file + rename), so that it is never left half
+    written. External edits of the file are detected by polling its modification
+    time every poll_interval seconds.
+
+    Attributes:
+        path (str):
+            The path of the configuration file
+
+        delay (float):
+            The time in seconds to wait for further changes before writing
+
+        poll_interval (float):
+            The time in seconds between two checks for external edits
+
+        data (Dict[str, Any]):
+            The loaded configuration
+    """
+
+    def __init__(self, path: str, delay: float = 1.0, poll_interval: float = 5.0):
+        if delay < 0:
+            raise ValueError("delay needs to be higher than or equal to 0!")
+        if poll_interval <= 0:
+            raise ValueError("poll_interval needs to be higher than 0!")
+
+        self.path = path
+        self.delay = delay
+        self.poll_interval = poll_interval
+        self.data: Dict[str, Any] = {}
+        self._mtime: int | None = None
+        self._flush: asyncio.TimerHandle | None = None
+        self._watcher: asyncio.Task | None = None
+
+    def load(self) -> Dict[str, Any]:
+        """Reads the configuration file."""
+        with open(self.path, "r", encoding="utf-8") as file:
+            self.data = yaml.load(file, Loader=Loader)
+        self._mtime = os.stat(self.path).st_mtime_ns
+        return self.data
+
+    def set(self, section: str, key: str, value: Any):
+        """
+        Changes a value of the configuration and schedules writing it.
+
+        Args:
+            section (str):
+                The top-level section of the configuration (e.g. "manager")
+
+            key (str):
+                The key inside of the section (e.g. "users")
+
+            value (Any):
+                The new value
+        """
+        self.data.setdefault(section, {})[key] = value
+        if self._flush is None:
+            # Case: First change since the last write
+            loop = asyncio.get_running_loop()
+            self._flush = loop.call_later(
+                self.delay, lambda: loop.create_task(self.flush())
+            )
+
+    async def flush(self):
+        """Writes the pending changes of the configuration."""
+        if self._flush is not None:
+            self._flush.cancel()
+            self._flush = None
+
+        # Serialize on the event loop, so that no change happens in between
+        content = yaml.dump(
+            self.data, Dumper=Dumper, sort_keys=False, default_flow_style=False
+        )
+        await asyncio.to_thread(self._write, content)
+
+    def _write(self, content: str):
+        """Replaces the configuration file with the given content."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(content)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+        except OSError:
+            # Case: File cannot be replaced (e.g. it is a bind mount of a container)
+            logger.warning("Could not replace %s, writing it in place!", self.path)
+            with open(self.path, "w", encoding="utf-8") as file:
+                file.write(content)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self._mtime = os.stat(self.path).st_mtime_ns
+
+    def watch(self, callback: Callable[[Dict[str, Any]], None]):
+        """
+        Starts checking the configuration file for external edits.
+
+        Args:
+            callback (Callable[[Dict[str, Any]], None]):
+                The function to apply the reloaded configuration
+        """
+        if self._watcher is None:
+            self._watcher = asyncio.get_running_loop().create_task(
+                self._watch(callback)
+            )
+
+    async def _watch(self, callback: Callable[[Dict[str, Any]], None]):
+        """Reloads the configuration, whenever the file was edited externally."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except OSError:
+                # Case: File is replaced right now
+                continue
+            if mtime == self._mtime or self._flush is not None:
+                # Case: File is unchanged or own changes are pending
+                continue
+
+            self._mtime = mtime
+            try:
+                with open(self.path, "r", encoding="utf-8") as file:
+                    data = yaml.load(file, Loader=Loader)
+                if not isinstance(data, dict):
+                    # Case: File is empty or only partially written
+                    raise ValueError("configuration needs to be a mapping!")
+                callback(data)
+            except Exception as error:
+                # Case: File is invalid - keep the current configuration and watching
+                logger.warning("Could not reload %s: %s", self.path, error)
+                continue
+            self.data = data
+
+    async def close(self):
+        """Stops watching the configuration file and writes pending changes."""
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+        if self._flush is not None:
+            await self.flush()
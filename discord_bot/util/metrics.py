@@ -0,0 +1,285 @@
+import bisect
+import functools
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Default upper bounds of the histogram buckets in seconds
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    """Formats the labels of a sample, e.g. {command="play"}."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{value}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Counter:
+    """
+    Represents a monotonically increasing value for each combination of labels.
+
+    Attributes:
+        name (str):
+            The name of the metric
+
+        description (str):
+            The description of the metric
+
+        labels (Tuple[str, ...]):
+            The names of the labels
+    """
+
+    def __init__(self, name: str, description: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, value: float = 1):
+        """Increases the value of the given labels."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + value
+
+    def render(self) -> Iterable[str]:
+        """Yields the lines of the text exposition format."""
+        with self._lock:
+            values = list(self._values.items())
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in values:
+            yield f"{self.name}{_labels(self.labels, labels)} {value}"
+
+
+class Histogram:
+    """
+    Represents the distribution of observed values for each combination of labels.
+
+    Each observation only increments a bucket, so that observing stays cheap enough
+    for the hot paths. Observations are guarded by a lock, because the player
+    threads observe the frame timing.
+
+    Attributes:
+        name (str):
+            The name of the metric
+
+        description (str):
+            The description of the metric
+
+        labels (Tuple[str, ...]):
+            The names of the labels
+
+        buckets (Tuple[float, ...]):
+            The sorted upper bounds of the buckets
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = BUCKETS,
+    ):
+        if list(buckets) != sorted(buckets):
+            raise ValueError("buckets need to be sorted!")
+
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.buckets = buckets
+        # Counts per bucket (the last one is +Inf) and the sum of the observations
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str):
+        """Adds an observation of the given labels."""
+        bucket = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                # Case: First observation of the labels
+                entry = ([0] * (len(self.buckets) + 1), [0.0])
+                self._values[labels] = entry
+            entry[0][bucket] += 1
+            entry[1][0] += value
+
+    def time(self, *labels: str) -> Callable:
+        """Returns a decorator, which observes the duration of a coroutine."""
+
+        def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> T:
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.observe(time.perf_counter() - start, *labels)
+
+            return wrapper
+
+        return decorator
+
+    def render(self) -> Iterable[str]:
+        """Yields the lines of the text exposition format."""
+        with self._lock:
+            values = [
+                (labels, list(counts), total[0])
+                for labels, (counts, total) in self._values.items()
+            ]
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, counts, total in values:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                bucket = _labels((*self.labels, "le"), (*labels, str(bound)))
+                yield f"{self.name}_bucket{bucket} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labels, labels)} {total}"
+            yield f"{self.name}_count{_labels(self.labels, labels)} {cumulative}"
+
+
+class Gauge:
+    """
+    Represents values, which are collected from the bot at scrape time.
+
+    Attributes:
+        name (str):
+            The name of the metric
+
+        description (str):
+            The description of the metric
+
+        labels (Tuple[str, ...]):
+            The names of the labels
+
+        collect (Callable[[], Iterable[Tuple[Tuple[str, ...], float]]] | None):
+            The function to collect the (labels, value) pairs
+    """
+
+    def __init__(self, name: str, description: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.collect: Callable[[], Iterable[Tuple[Tuple[str, ...], float]]] | None = (
+            None
+        )
+
+    def render(self) -> Iterable[str]:
+        """Yields the lines of the text exposition format."""
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} gauge"
+        if self.collect is not None:
+            for labels, value in self.collect():
+                yield f"{self.name}{_labels(self.labels, labels)} {value}"
+
+
+COMMANDS = Counter(
+    "discord_bot_commands_total", "Number of invoked commands", ("command",)
+)
+COMMAND_ERRORS = Counter(
+    "discord_bot_command_errors_total",
+    "Number of failed commands",
+    ("command", "error"),
+)
+COMMAND_SECONDS = Histogram(
+    "discord_bot_command_seconds", "Latency of completed commands", ("command",)
+)
+EXTRACT_SECONDS = Histogram(
+    "discord_bot_extract_seconds", "Latency of the extractions with yt-dlp"
+)
+PLAYLIST_SECONDS = Histogram(
+    "discord_bot_playlist_seconds",
+    "Latency of the playlist operations",
+    ("operation",),
+    buckets=(1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1),
+)
+CHAT_SECONDS = Histogram(
+    "discord_bot_chat_seconds", "Latency of the complete responses of the chat model"
+)
+CHAT_CACHE_HITS = Counter(
+    "discord_bot_chat_cache_hits_total",
+    "Number of chat messages answered from the response cache",
+)
+CHAT_CACHE_MISSES = Counter(
+    "discord_bot_chat_cache_misses_total",
+    "Number of chat messages not found in the response cache",
+)
+METADATA_CACHE_HITS = Counter(
+    "discord_bot_metadata_cache_hits_total",
+    "Number of songs resolved from the metadata cache",
+)
+METADATA_CACHE_MISSES = Counter(
+    "discord_bot_metadata_cache_misses_total",
+    "Number of songs not found in the metadata cache",
+)
+EXTRACT_QUEUED = Gauge(
+    "discord_bot_extract_queued",
+    "Number of extractions waiting for a worker",
+    ("guild",),
+)
+EXTRACT_RUNNING = Gauge(
+    "discord_bot_extract_running", "Number of extractions running on a worker"
+)
+PLAYLIST_SIZE = Gauge(
+    "discord_bot_playlist_size", "Number of songs in the playlist", ("guild",)
+)
+FFMPEG_PROCESSES = Gauge(
+    "discord_bot_ffmpeg_processes", "Number of playing or warmed up ffmpeg processes"
+)
+FRAME_INTERVAL_SECONDS = Histogram(
+    "discord_bot_frame_interval_seconds",
+    "Time between two read audio frames (only with frame_stats enabled)",
+    buckets=(0.005, 0.01, 0.015, 0.02, 0.025, 0.03, 0.04, 0.06, 0.1, 0.25),
+)
+LATE_FRAMES = Counter(
+    "discord_bot_late_frames_total", "Number of audio frames, that were read too late"
+)
+UNDERRUNS = Counter(
+    "discord_bot_underruns_total", "Number of reads, that waited for ffmpeg"
+)
+STREAM_CPU_SECONDS = Counter(
+    "discord_bot_stream_cpu_seconds_total",
+    "CPU time of the player threads spent reading audio frames",
+)
+LOOP_LAG_SECONDS = Histogram(
+    "discord_bot_loop_lag_seconds",
+    "Delay of the event loop (only with the watchdog enabled)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+LOOP_STALLS = Counter(
+    "discord_bot_loop_stalls_total",
+    "Number of times the event loop was blocked for longer than the threshold",
+)
+
+# All metrics in the order they are exposed
+METRICS = (
+    COMMANDS,
+    COMMAND_ERRORS,
+    COMMAND_SECONDS,
+    EXTRACT_SECONDS,
+    PLAYLIST_SECONDS,
+    CHAT_SECONDS,
+    CHAT_CACHE_HITS,
+    CHAT_CACHE_MISSES,
+    METADATA_CACHE_HITS,
+    METADATA_CACHE_MISSES,
+    EXTRACT_QUEUED,
+    EXTRACT_RUNNING,
+    PLAYLIST_SIZE,
+    FFMPEG_PROCESSES,
+    FRAME_INTERVAL_SECONDS,
+    LATE_FRAMES,
+    UNDERRUNS,
+    STREAM_CPU_SECONDS,
+    LOOP_LAG_SECONDS,
+    LOOP_STALLS,
+)
+
+
+def render() -> str:
+    """Returns all metrics in the text exposition format of Prometheus."""
+    return "\n".join(line for metric in METRICS for line in metric.render()) + "\n"
@@ -0,0 +1,163 @@
+import textwrap
+from typing import List, Sequence, Tuple
+
+import discord
+from discord.ext import commands
+
+# Maximum number of characters of a Discord message
+MESSAGE_LIMIT = 2000
+
+
+def _block(header: str, lines: Sequence[str]) -> str:
+    """Returns the header followed by the lines as code block."""
+    output = "\n".join(lines)
+    return f"{header}\n```\n{output}\n```"
+
+
+def paginate(
+    sections: Sequence[Tuple[str, Sequence[str]]],
+    limit: int = MESSAGE_LIMIT,
+) -> List[str]:
+    """
+    Packs sections of lines into the fewest possible pages.
+
+    Each section is rendered as its header followed by its lines in a code block.
+    Sections are packed together as long as they fit into a page. Sections that do
+    not fit into a single page are split into multiple code blocks and lines that do
+    not fit into a single code block are wrapped.
+
+    Args:
+        sections (Sequence[Tuple[str, Sequence[str]]]):
+            The header and the lines of each section
+
+        limit (int):
+            The maximum number of characters of a page
+
+    Returns:
+        List[str]:
+            The content of each page
+    """
+    pages: List[str] = []
+    page = ""
+
+    def append(block: str):
+        nonlocal page
+        if page and len(page) + 1 + len(block) > limit:
+            # Case: Block does not fit into the current page
+            pages.append(page)
+            page = ""
+        page = f"{page}\n{block}" if page else block
+
+    for header, lines in sections:
+        # Maximum number of characters of a line in a (continued) code block
+        width = limit - len(_block(f"{header} (continued)", []))
+        if width <= 0:
+            raise ValueError("limit needs to be higher than the size of the headers!")
+
+        lines = [
+            wrapped
+            for line in lines
+            for wrapped in (textwrap.wrap(line, width) if len(line) > width else [line])
+        ]
+        title = header
+        chunk: List[str] = []
+        size = len(_block(title, chunk))
+        for line in lines:
+            if chunk and size + 1 + len(line) > limit:
+                # Case: Line does not fit into the current code block
+                append(_block(title, chunk))
+                title = f"{header} (continued)"
+                chunk = []
+                size = len(_block(title, chunk))
+            size += len(line) + (1 if chunk else 0)
+            chunk.append(line)
+        append(_block(title, chunk or ["---"]))
+
+    if page:
+        pages.append(page)
+    return pages
+
+
+class PageView(discord.ui.View):
+    """
+    Represents the buttons to browse through the pages of a message.
+
+    Attributes:
+        pages (List[str]):
+            The content of each page
+
+        author_id (int):
+            The ID of the user who is allowed to browse the pages
+
+        current (int):
+            The index of the shown page
+    """
+
+    def __init__(self, pages: List[str], author_id: int, timeout: float = 180):
+        if not pages:
+            raise ValueError("pages needs to contain at least one page!")
+
+        super().__init__(timeout=timeout)
+        self.pages = pages
+        self.author_id = author_id
+        self.current = 0
+        self.message: discord.Message | None = None
+        self._update()
+
+    def _update(self):
+        """Updates the state of the buttons to the shown page."""
+        self.previous.disabled = self.current == 0
+        self.next.disabled = self.current == len(self.pages) - 1
+        self.counter.label = f"{self.current + 1}/{len(self.pages)}"
+
+    async def _show(self, interaction: discord.Interaction, current: int):
+        """Shows another page of the message."""
+        self.current = current
+        self._update()
+        await interaction.response.edit_message(content=self.pages[current], view=self)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author_id
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def previous(self, interaction: discord.Interaction, _: discord.ui.Button):
+        await self._show(interaction, self.current - 1)
+
+    @discord.ui.button(label="1/1", style=discord.ButtonStyle.secondary, disabled=True)
+    async def counter(self, interaction: discord.Interaction, _: discord.ui.Button):
+        pass
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next(self, interaction: discord.Interaction, _: discord.ui.Button):
+        await self._show(interaction, self.current + 1)
+
+    async def on_timeout(self):
+        if self.message is not None:
+            # Case: Remove the buttons of the message
+            await self.message.edit(view=None)
+
+
+async def send_pages(ctx: commands.Context, pages: List[str]) -> discord.Message:
+    """
+    Sends the pages as a single message.
+
+    Multiple pages can be browsed with the buttons of a PageView.
+
+    Args:
+        ctx (commands.Context):
+            The discord context
+
+        pages (List[str]):
+            The content of each page
+
+    Returns:
+        discord.Message:
+            The sent message
+    """
+    if len(pages) == 1:
+        # Case: Content fits into a single message
+        return await ctx.send(pages[0])
+
+    view = PageView(pages, author_id=ctx.author.id)
+    view.message = await ctx.send(pages[0], view=view)
+    return view.message
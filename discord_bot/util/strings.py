@@ -1,10 +1,36 @@
 import re
 
+# Characters, that start an emoji
+_EMOJI = (
+    "\U0001f600-\U0001f64f"  # emoticons
+    "\U0001f300-\U0001f5ff"  # symbols & pictographs (incl. skin tones)
+    "\U0001f680-\U0001f6ff"  # transport & map symbols
+    "\U0001f1e0-\U0001f1ff"  # flags (iOS)
+    "\U00002700-\U000027bf"  # Dingbats
+    "\U0001f900-\U0001f9ff"  # Supplemental Symbols and Pictographs
+    "\U00002600-\U000026ff"  # Misc symbols
+    "\U0001fa70-\U0001faff"  # Extended symbols
+    "\U000025a0-\U000025ff"  # Geometric shapes
+)
+
+# Characters, that only continue an emoji sequence
+_MODIFIERS = (
+    "\u200d"  # zero width joiner
+    "\ufe0e\ufe0f"  # variation selectors
+    "\u20e3"  # combining enclosing keycap
+    "\U000e0020-\U000e007f"  # tags (subdivision flags)
+)
+
+# Emoji sequences and stray selectors (e.g. of keycaps, which start with a digit)
+_EMOJIS = re.compile(f"[{_EMOJI}][{_EMOJI}{_MODIFIERS}]*|[\ufe0e\ufe0f\u20e3]")
+
 
 def remove_emojis(s: str) -> str:
     """
     Remove emojis from a string.
 
+    Spaces left behind by the removed emojis are collapsed into single spaces.
+
     Args:
         s (str):
             The string to remove emojis from
@@ -13,27 +39,13 @@ def remove_emojis(s: str) -> str:
         str:
             The string without emojis
     """
-    pattern = re.compile(
-        pattern="["
-        "\U0001f600-\U0001f64f"  # emoticons
-        "\U0001f300-\U0001f5ff"  # symbols & pictographs
-        "\U0001f680-\U0001f6ff"  # transport & map symbols
-        "\U0001f1e0-\U0001f1ff"  # flags (iOS)
-        "\U00002700-\U000027bf"  # Dingbats
-        "\U0001f900-\U0001f9ff"  # Supplemental Symbols and Pictographs
-        "\U00002600-\U000026ff"  # Misc symbols
-        "\U0001fa70-\U0001faff"  # Extended symbols
-        "\U000025a0-\U000025ff"  # Geometric shapes
-        "]+",
-        flags=re.UNICODE,
-    )
-    words = s.split(" ")
-    new_words = []
-    for word in words:
-        new_word = pattern.sub(r"", word)
-        if new_word:
-            new_words.append(new_word)
-    return " ".join(new_words)
+    if not s.isascii():
+        # Case: String can contain emojis
+        s = _EMOJIS.sub("", s)
+    if "  " in s or s.startswith(" ") or s.endswith(" "):
+        # Case: Collapse the spaces around the removed emojis
+        return " ".join(word for word in s.split(" ") if word)
+    return s
 
 
 def truncate(s: str, length: int) -> str:
@@ -0,0 +1,170 @@
+import asyncio
+import collections
+import logging
+import sys
+import threading
+import time
+import traceback
+from types import FrameType
+
+from discord_bot.util.metrics import LOOP_LAG_SECONDS, LOOP_STALLS
+
+logger = logging.getLogger("discord")
+
+# Name of the package, whose frames are reported as offenders
+PACKAGE = "discord_bot"
+
+
+class LoopWatchdog:
+    """
+    Represents the detector of blocking work on the event loop.
+
+    A heartbeat coroutine measures how late the event loop wakes it up (event loop
+    lag). A sampling thread checks the heartbeat and, while it is stalled for longer
+    than threshold seconds, samples the stack of the event loop thread. The sampled
+    functions and commands are counted and reported at most every log_interval
+    seconds, so that a stalling bot does not flood its log.
+
+    Attributes:
+        threshold (float):
+            The time in seconds without a heartbeat, after the event loop counts as
+            stalled
+
+        interval (float):
+            The time in seconds between two heartbeats and two samples
+
+        log_interval (float):
+            The minimum time in seconds between two reports
+
+        stalls (int):
+            The number of stalls since the last report
+
+        offenders (collections.Counter):
+            The number of samples of each (command, function) since the last report
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.25,
+        interval: float = 0.05,
+        log_interval: float = 60.0,
+    ):
+        if threshold <= 0:
+            raise ValueError("threshold needs to be higher than 0!")
+        if interval <= 0 or interval >= threshold:
+            raise ValueError("interval needs to be in between of 0 and threshold!")
+        if log_interval < 0:
+            raise ValueError("log_interval needs to be higher than or equal to 0!")
+
+        self.threshold = threshold
+        self.interval = interval
+        self.log_interval = log_interval
+        self.stalls = 0
+        self.offenders: collections.Counter = collections.Counter()
+        self._beat = time.monotonic()
+        self._longest = 0.0
+        self._longest_stack = ""
+        self._stack = ""
+        self._last_log = 0.0
+        self._loop_thread: int | None = None
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Starts the heartbeat on the running event loop and the sampling thread."""
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._thread = threading.Thread(
+            target=self._sample, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self):
+        """Stops the heartbeat and the sampling thread."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join)
+            self._thread = None
+
+    async def _heartbeat(self):
+        """Measures the lag of the event loop."""
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self._beat = time.monotonic()
+            LOOP_LAG_SECONDS.observe(max(0.0, self._beat - start - self.interval))
+
+    def _sample(self):
+        """Samples the stack of the event loop thread, while it is stalled."""
+        stall_start: float | None = None
+        while not self._stopped.wait(self.interval):
+            beat = self._beat
+            now = time.monotonic()
+            if now - beat > self.threshold:
+                # Case: Event loop is stalled - sample the blocking stack
+                frame = sys._current_frames().get(self._loop_thread)
+                if frame is not None:
+                    self.offenders[self._describe(frame)] += 1
+                if stall_start is None:
+                    stall_start = beat
+                    self._stack = "".join(traceback.format_stack(frame))
+            elif stall_start is not None:
+                # Case: Event loop has recovered from the stall
+                self._stalled(beat - stall_start)
+                stall_start = None
+
+    def _stalled(self, duration: float):
+        """Records a stall and reports the stalls, if the last report is old."""
+        self.stalls += 1
+        LOOP_STALLS.inc()
+        if duration > self._longest:
+            self._longest = duration
+            self._longest_stack = self._stack
+
+        now = time.monotonic()
+        if now - self._last_log < self.log_interval:
+            # Case: Rate-limit the report
+            return
+
+        offenders = ", ".join(
+            f"{name} ({samples}x)" for name, samples in self.offenders.most_common(3)
+        )
+        logger.warning(
+            "Event loop stalled %d times, longest for %.0f ms. Top offenders: %s\n%s",
+            self.stalls,
+            self._longest * 1000,
+            offenders or "unknown",
+            self._longest_stack,
+        )
+        self.stalls = 0
+        self.offenders.clear()
+        self._longest = 0.0
+        self._longest_stack = ""
+        self._last_log = now
+
+    @staticmethod
+    def _describe(frame: FrameType) -> str:
+        """Returns the innermost function of the bot and its command of a stack."""
+        function = None
+        command = None
+        while frame is not None:
+            code = frame.f_code
+            if function is None and PACKAGE in code.co_filename:
+                # Case: Innermost function of the bot (not of a library)
+                name = getattr(code, "co_qualname", code.co_name)
+                function = f"{name}:{frame.f_lineno}"
+            ctx = frame.f_locals.get("ctx")
+            if command is None and getattr(ctx, "command", None) is not None:
+                # Case: Function runs inside of a command
+                command = ctx.command.name
+            frame = frame.f_back
+
+        if function is None:
+            return "unknown"
+        return f"!{command} {function}" if command else function
@@ -5,26 +5,40 @@ import logging
 import os
 
 import discord
-import yaml
 from discord.ext import commands
 
-from discord_bot.command import Chat, Disconnect, Manager, Music
+from discord_bot.command import Chat, Disconnect, Manager, Metrics, Music
+from discord_bot.util import ConfigStore, LoopWatchdog
 
 
-async def main(client: commands.Bot, **kwargs):
+async def main(client: commands.Bot, store: ConfigStore, **kwargs):
     """Starting point of the bot."""
+    watchdog = None
+    if "WATCHDOG_THRESHOLD" in os.environ:
+        # Case: Report blocking work on the event loop
+        watchdog = LoopWatchdog(threshold=float(os.environ["WATCHDOG_THRESHOLD"]))
+        watchdog.start()
+
     async with client:
         await client.add_cog(
             Chat(
                 client,
                 host=os.environ["OLLAMA_HOST"],
                 model=os.environ["OLLAMA_MODEL"],
+                **kwargs["chat"],
             )
         )
         await client.add_cog(Music(client, **kwargs["music"]))
-        await client.add_cog(Manager(client, **kwargs["manager"]))
+        await client.add_cog(Manager(client, store=store, **kwargs["manager"]))
         await client.add_cog(Disconnect(client, **kwargs["disconnect"]))
-        await client.start(token=os.environ["TOKEN"])
+        if "METRICS_PORT" in os.environ:
+            # Case: Expose the metrics on a local HTTP endpoint
+            await client.add_cog(Metrics(client, port=int(os.environ["METRICS_PORT"])))
+        try:
+            await client.start(token=os.environ["TOKEN"])
+        finally:
+            if watchdog is not None:
+                await watchdog.stop()
 
 
 if __name__ == "__main__":
@@ -42,8 +56,8 @@ if __name__ == "__main__":
     )
 
     # Create the configuration
-    with open("config.yaml", "r", encoding="utf-8") as file:
-        config = yaml.load(file, Loader=yaml.FullLoader)
+    store = ConfigStore("config.yaml")
+    config = store.load()
 
     # Run the bot on the server
-    asyncio.run(main(bot, **config))
+    asyncio.run(main(bot, store, **config))
@@ -0,0 +1,107 @@
+"""Tests for discord_bot/audio/cache.py."""
+
+import time
+
+import pytest
+
+from discord_bot.audio.cache import MetadataCache, normalize
+from discord_bot.util.metrics import METADATA_CACHE_HITS, METADATA_CACHE_MISSES
+
+
+def test_normalize_with_youtube_urls():
+    """Tests normalize() function with different URLs of the same video."""
+    urls = [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42&si=abc",
+        "https://youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+    ]
+
+    assert {normalize(url) for url in urls} == {"youtube:dQw4w9WgXcQ"}
+
+
+def test_normalize_with_search_terms():
+    """Tests normalize() function with different spellings of the same search."""
+    searches = ["Never gonna give you up", "  never   GONNA give you up "]
+
+    assert {normalize(search) for search in searches} == {
+        "search:never gonna give you up"
+    }
+
+
+def test_metadata_cache_with_invalid_arguments(tmp_path):
+    """Tests MetadataCache class with invalid arguments."""
+    with pytest.raises(ValueError):
+        MetadataCache(path=str(tmp_path / "cache.db"), ttl=0)
+    with pytest.raises(ValueError):
+        MetadataCache(path=str(tmp_path / "cache.db"), max_size=0)
+
+
+def test_metadata_cache_get_and_put(tmp_path):
+    """Tests MetadataCache.get() and MetadataCache.put() methods."""
+    cache = MetadataCache(path=str(tmp_path / "cache.db"))
+    hits = METADATA_CACHE_HITS._values.get((), 0)
+    misses = METADATA_CACHE_MISSES._values.get((), 0)
+
+    assert cache.get("never gonna give you up") is None
+    cache.put(
+        "never gonna give you up",
+        title="Rick Astley - Never Gonna Give You Up",
+        yt_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    )
+
+    # Both the search term and the URL of the video are cached
+    data = cache.get("Never Gonna Give You Up")
+    assert data["title"] == "Rick Astley - Never Gonna Give You Up"
+    assert cache.get("https://youtu.be/dQw4w9WgXcQ") == data
+    assert cache.stats() == {"hits": 2, "misses": 1}
+    assert METADATA_CACHE_HITS._values[()] == hits + 2
+    assert METADATA_CACHE_MISSES._values[()] == misses + 1
+    cache.close()
+
+
+def test_metadata_cache_with_persistence(tmp_path):
+    """Tests that MetadataCache class keeps its entries after reopening."""
+    path = str(tmp_path / "cache.db")
+    cache = MetadataCache(path=path)
+    cache.put("query", title="Title", yt_url="https://youtu.be/a")
+    cache.close()
+
+    cache = MetadataCache(path=path)
+    assert cache.get("query") is not None
+    cache.close()
+
+
+def test_metadata_cache_with_ttl(tmp_path, monkeypatch):
+    """Tests that MetadataCache class expires entries after ttl seconds."""
+    cache = MetadataCache(path=str(tmp_path / "cache.db"), ttl=10)
+    cache.put("query", title="Title", yt_url="https://youtu.be/a")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert cache.get("query") is None
+    cache.close()
+
+
+def test_metadata_cache_with_lru_eviction(tmp_path, monkeypatch):
+    """Tests that MetadataCache class evicts the least recently used entries."""
+    cache = MetadataCache(path=str(tmp_path / "cache.db"), max_size=2)
+    now = time.time()
+    urls = ["https://youtu.be/a", "https://youtu.be/b", "https://youtu.be/c"]
+
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache.put(urls[0], title="a", yt_url=urls[0])
+    monkeypatch.setattr(time, "time", lambda: now + 1)
+    cache.put(urls[1], title="b", yt_url=urls[1])
+
+    # Access "a", so that "b" becomes the least recently used entry
+    monkeypatch.setattr(time, "time", lambda: now + 2)
+    assert cache.get(urls[0]) is not None
+    monkeypatch.setattr(time, "time", lambda: now + 3)
+    cache.put(urls[2], title="c", yt_url=urls[2])
+
+    assert cache.get(urls[0]) is not None
+    assert cache.get(urls[1]) is None
+    assert cache.get(urls[2]) is not None
+    cache.close()
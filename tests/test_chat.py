@@ -0,0 +1,83 @@
+"""Tests for discord_bot/command/chat.py."""
+
+import pytest
+
+from discord_bot.command import Chat
+
+
+class ClientMock:
+    """Mock class for ollama.AsyncClient."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def chat(self, **kwargs):
+        self.calls += 1
+
+        async def stream():
+            yield {"message": {"content": "A bot."}}
+
+        return stream()
+
+
+class MessageMock:
+    """Mock class for discord.Message."""
+
+    async def edit(self, content: str):
+        pass
+
+
+class TypingMock:
+    """Mock class for ctx.typing()."""
+
+    async def __aenter__(self):
+        pass
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class ChannelMock:
+    """Mock class for ctx.channel."""
+
+    id = 248897274002931722
+
+
+class AuthorMock:
+    """Mock class for ctx.author."""
+
+    id = 248897274002931722
+
+
+class ContextMock:
+    """Mock class for commands.Context."""
+
+    channel = ChannelMock()
+    author = AuthorMock()
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content: str) -> MessageMock:
+        self.sent.append(content)
+        return MessageMock()
+
+    def typing(self) -> TypingMock:
+        return TypingMock()
+
+
+@pytest.mark.asyncio
+async def test_chat_cache():
+    """Tests that the chat command answers repeated messages from the cache."""
+    cog = Chat(bot=None, cache=True)
+    cog.client = ClientMock()
+    ctx = ContextMock()
+
+    for _ in range(3):
+        await cog.chat.callback(cog, ctx, "Who", "are", "you?")
+
+    assert ctx.sent == ["A bot."] * 3
+    assert cog.client.calls == 1
+    assert (cog.cache.hits, cog.cache.misses) == (2, 1)
+    # Only the generated answer extends the conversation, not the cached ones
+    assert len(cog.memory.messages(ChannelMock.id, "", "Hi")) == 4
@@ -7,6 +7,8 @@ import pytest
 from discord.ext import commands
 
 from discord_bot.checks import (
+    REQUIREMENTS,
+    authorize,
     check_author_admin,
     check_author_id_blacklisted,
     check_author_role_blacklisted,
@@ -18,6 +20,8 @@ from discord_bot.checks import (
     check_text_channel_blacklisted,
     check_valid_command,
     check_valid_n,
+    check_valid_page,
+    check_valid_position,
     check_valid_author_roles,
     check_valid_text_channels,
     check_valid_timeout,
@@ -26,6 +30,8 @@ from discord_bot.checks import (
     check_valid_volume,
     check_voice_channel_blacklisted,
 )
+from discord_bot.command import Chat, Disconnect, Manager, Music
+from discord_bot.permission import PermissionIndex
 
 
 @dataclass
@@ -107,6 +113,7 @@ class GuildMock:
     roles: List[RoleMock]
     text_channels: List[TextChannelMock]
     voice_channels: List[VoiceChannelMock]
+    id: int = 248897274002931722
 
 
 @dataclass
@@ -389,6 +396,46 @@ async def test_check_valid_n_with_valid_n():
     await check_valid_n(ctx, n)
 
 
+@pytest.mark.asyncio
+async def test_check_valid_page_with_invalid_page():
+    """Tests check_valid_page() function with invalid page."""
+    ctx = __CTX__
+    page = 0
+
+    with pytest.raises(commands.CommandError):
+        await check_valid_page(ctx, page)
+
+
+@pytest.mark.asyncio
+async def test_check_valid_page_with_valid_page():
+    """Tests check_valid_page() function with valid page."""
+    ctx = __CTX__
+    page = 1
+
+    await check_valid_page(ctx, page)
+
+
+@pytest.mark.asyncio
+async def test_check_valid_position_with_invalid_position():
+    """Tests check_valid_position() function with invalid position."""
+    ctx = __CTX__
+    position = 6
+    size = 5
+
+    with pytest.raises(commands.CommandError):
+        await check_valid_position(ctx, position, size)
+
+
+@pytest.mark.asyncio
+async def test_check_valid_position_with_valid_position():
+    """Tests check_valid_position() function with valid position."""
+    ctx = __CTX__
+    position = 5
+    size = 5
+
+    await check_valid_position(ctx, position, size)
+
+
 @pytest.mark.asyncio
 async def test_check_valid_url_with_invalid_url():
     """Tests check_valid_url() function with invalid url."""
@@ -546,3 +593,65 @@ async def test_check_less_equal_author_with_valid_ctx():
     role_ids = [542084251038908436, 248898634924425216]
 
     await check_less_equal_author(ctx, role_ids)
+
+
+@pytest.mark.asyncio
+async def test_authorize_with_invalid_ctx():
+    """Tests that authorize() function replies only for the first failed check."""
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    ctx = replace(__CTX__, author=replace(__CTX__.author, voice=None))
+    ctx.send = send
+    index = PermissionIndex(
+        users={"play": [123898634924425216]},
+        roles={"play": []},
+        text_channels={"play": [725622500846993530]},
+        voice_channels={"play": []},
+    )
+
+    with pytest.raises(commands.CommandError):
+        await authorize(ctx, index)
+    assert messages == ["❌ You are blacklisted from using this command!"]
+
+
+@pytest.mark.asyncio
+async def test_authorize_with_valid_ctx():
+    """Tests authorize() function with valid ctx."""
+    ctx = __CTX__
+    index = PermissionIndex(
+        users={"play": []},
+        roles={"play": [686645319718404100]},
+        text_channels={"play": []},
+        voice_channels={"play": []},
+    )
+
+    assert await authorize(ctx, index)
+
+
+@pytest.mark.asyncio
+async def test_authorize_with_unknown_command():
+    """Tests that authorize() function rejects commands without requirements."""
+    ctx = replace(__CTX__, command=CommandMock(name="unknown"))
+    index = PermissionIndex(users={}, roles={}, text_channels={}, voice_channels={})
+
+    with pytest.raises(commands.CheckFailure):
+        await authorize(ctx, index)
+
+
+def test_requirements_of_all_commands():
+    """Tests that every command of the cogs has its requirements."""
+    music = Music(None, cache_path=":memory:")
+    cogs = [
+        music,
+        Manager(None, users={}, roles={}, text_channels={}, voice_channels={}),
+        Chat(None),
+        Disconnect(None),
+    ]
+    names = {command.name for cog in cogs for command in cog.get_commands()}
+    music.extractor.close()
+    music.cache.close()
+
+    assert names <= REQUIREMENTS.keys(), names - REQUIREMENTS.keys()
@@ -0,0 +1,108 @@
+"""Tests for discord_bot/util/config.py."""
+
+import asyncio
+import os
+
+import pytest
+import yaml
+
+from discord_bot.util import ConfigStore
+
+CONFIG = """\
+music:
+  volume: 50
+manager:
+  users:
+    play: []
+    skip: []
+"""
+
+
+@pytest.mark.asyncio
+async def test_config_store_coalesces_writes(tmp_path):
+    """Tests that ConfigStore.set() method writes several changes at once."""
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG)
+    store = ConfigStore(str(path), delay=0.05)
+    store.load()
+
+    writes = 0
+    write = store._write
+
+    def count(content: str):
+        nonlocal writes
+        writes += 1
+        write(content)
+
+    store._write = count
+    blacklist = [248897274002931722]
+    store.set("manager", "users", {"play": blacklist, "skip": blacklist})
+    store.set("music", "volume", 80)
+    await asyncio.sleep(0.1)
+
+    assert writes == 1
+    config = yaml.safe_load(path.read_text())
+    assert config["manager"]["users"]["skip"] == [248897274002931722]
+    assert config["music"]["volume"] == 80
+    assert "&id" not in path.read_text()
+    assert [name for name in os.listdir(tmp_path)] == ["config.yaml"]
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_config_store_watch(tmp_path):
+    """Tests that ConfigStore.watch() method applies external edits."""
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG)
+    store = ConfigStore(str(path), poll_interval=0.01)
+    store.load()
+    reloaded = []
+
+    def callback(config):
+        if config["music"]["volume"] > 100:
+            raise ValueError("volume needs to be in between of 0 and 100!")
+        reloaded.append(config)
+
+    store.watch(callback)
+    path.write_text(CONFIG.replace("volume: 50", "volume: 200"))
+    os.utime(path, ns=(1, 1))
+    await asyncio.sleep(0.05)
+
+    # Invalid edits are not applied
+    assert store.data["music"]["volume"] == 50
+
+    path.write_text(CONFIG.replace("volume: 50", "volume: 70"))
+    os.utime(path, ns=(2, 2))
+    await asyncio.sleep(0.05)
+
+    assert [config["music"]["volume"] for config in reloaded] == [70]
+    assert store.data["music"]["volume"] == 70
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_config_store_watch_empty(tmp_path):
+    """Tests that ConfigStore.watch() method survives an empty configuration file."""
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG)
+    store = ConfigStore(str(path), poll_interval=0.01)
+    store.load()
+    reloaded = []
+
+    def callback(config):
+        reloaded.append(config["music"]["volume"])
+
+    store.watch(callback)
+    path.write_text("")
+    os.utime(path, ns=(1, 1))
+    await asyncio.sleep(0.05)
+
+    assert not store._watcher.done()
+    assert store.data["music"]["volume"] == 50
+
+    path.write_text(CONFIG.replace("volume: 50", "volume: 70"))
+    os.utime(path, ns=(2, 2))
+    await asyncio.sleep(0.05)
+
+    assert reloaded == [70]
+    await store.close()
@@ -0,0 +1,142 @@
+"""Tests for discord_bot/command/disconnect.py."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+from discord_bot.audio import Playlist, StreamResolver
+from discord_bot.command import Disconnect
+from discord_bot.session import GuildSession, SessionRegistry
+from discord_bot.transformer import Prefetcher
+
+
+async def extract(url):
+    """Mock extract function."""
+    return {"url": url}
+
+
+@dataclass
+class MemberMock:
+    """Mock class for discord.Member."""
+
+    bot: bool = False
+
+
+@dataclass
+class ChannelMock:
+    """Mock class for discord.VoiceChannel."""
+
+    members: List[MemberMock] = field(default_factory=lambda: [MemberMock()])
+
+
+@dataclass
+class VoiceClientMock:
+    """Mock class for discord.VoiceClient."""
+
+    channel: ChannelMock = field(default_factory=ChannelMock)
+    playing: bool = False
+    connected: bool = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def is_playing(self) -> bool:
+        return self.playing
+
+    async def disconnect(self, force: bool):
+        self.connected = False
+
+
+@dataclass
+class GuildMock:
+    """Mock class for discord.Guild."""
+
+    voice_client: VoiceClientMock | None = field(default_factory=VoiceClientMock)
+    id: int = 248897274002931722
+
+
+class MusicMock:
+    """Mock class for discord_bot.command.Music."""
+
+    def __init__(self):
+        self.sessions = SessionRegistry(
+            factory=lambda guild_id: GuildSession(
+                guild_id=guild_id,
+                playlist=Playlist(),
+                prefetcher=Prefetcher(resolver=StreamResolver(extract=extract)),
+                volume=50,
+            )
+        )
+
+
+class BotMock:
+    """Mock class for commands.Bot."""
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.music = MusicMock()
+
+    def get_cog(self, name: str) -> MusicMock:
+        return self.music
+
+
+@pytest.mark.asyncio
+async def test_disconnect_with_idle_bot():
+    """Tests that Disconnect leaves the voice channel after the timeout."""
+    bot = BotMock()
+    disconnect = Disconnect(bot, timeout=0.05)
+    guild = GuildMock()
+    bot.music.sessions.get(guild.id)
+
+    disconnect.refresh(guild)
+    await asyncio.sleep(0.1)
+
+    assert not guild.voice_client.connected
+    assert len(bot.music.sessions) == 0
+
+
+@pytest.mark.asyncio
+async def test_disconnect_with_activity():
+    """Tests that Disconnect cancels the timeout when the bot plays again."""
+    bot = BotMock()
+    disconnect = Disconnect(bot, timeout=0.05)
+    guild = GuildMock()
+
+    disconnect.refresh(guild)
+    guild.voice_client.playing = True
+    disconnect.refresh(guild)
+    await asyncio.sleep(0.1)
+
+    assert guild.voice_client.connected
+
+
+@pytest.mark.asyncio
+async def test_disconnect_with_empty_channel():
+    """Tests that Disconnect counts playing to an empty voice channel as idle."""
+    bot = BotMock()
+    disconnect = Disconnect(bot, timeout=0.05)
+    guild = GuildMock(
+        voice_client=VoiceClientMock(
+            channel=ChannelMock(members=[MemberMock(bot=True)]), playing=True
+        )
+    )
+
+    disconnect.refresh(guild)
+    await asyncio.sleep(0.1)
+
+    assert not guild.voice_client.connected
+
+
+@pytest.mark.asyncio
+async def test_disconnect_with_disabled_timeout():
+    """Tests that Disconnect does not start timers with a timeout of 0."""
+    bot = BotMock()
+    disconnect = Disconnect(bot, timeout=0)
+    guild = GuildMock()
+
+    disconnect.refresh(guild)
+
+    assert len(disconnect._timers) == 0
+    await disconnect.cog_unload()
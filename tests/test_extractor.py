@@ -0,0 +1,128 @@
+"""Tests for discord_bot/audio/extractor.py."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import yt_dlp
+
+from discord_bot.audio import Extractor
+from discord_bot.audio import extractor as extractor_module
+
+
+def test_extractor_with_invalid_arguments():
+    """Tests Extractor class with invalid arguments."""
+    with pytest.raises(ValueError):
+        Extractor(options={}, workers=0)
+    with pytest.raises(ValueError):
+        Extractor(options={}, mode="fiber")
+    with pytest.raises(ValueError):
+        Extractor(options={}, timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_extractor_with_fair_share(monkeypatch):
+    """Tests that Extractor class dispatches the servers in round-robin order."""
+    order = []
+    lock = threading.Lock()
+
+    def extract_info(options, url, sanitize):
+        with lock:
+            order.append(url)
+        time.sleep(0.001)
+        return {"url": url}
+
+    monkeypatch.setattr(extractor_module, "_extract_info", extract_info)
+    extractor = Extractor(options={}, workers=1)
+
+    # Server 1 sends a burst of extractions before server 2 sends one
+    tasks = [extractor.extract(f"1-{i}", guild_id=1) for i in range(5)]
+    tasks += [extractor.extract("2-0", guild_id=2)]
+    results = await asyncio.gather(*tasks)
+
+    assert [result["url"] for result in results] == [
+        "1-0",
+        "1-1",
+        "1-2",
+        "1-3",
+        "1-4",
+        "2-0",
+    ]
+    assert order.index("2-0") <= 2
+    assert extractor.stats() == {"running": 0, "queued": 0, "queued_per_guild": {}}
+    extractor.close()
+
+
+@pytest.mark.asyncio
+async def test_extractor_with_timeout(monkeypatch):
+    """Tests that Extractor class cancels extractions that take too long."""
+
+    def extract_info(options, url, sanitize):
+        time.sleep(0.2)
+        return {"url": url}
+
+    monkeypatch.setattr(extractor_module, "_extract_info", extract_info)
+    extractor = Extractor(options={}, workers=1, timeout=0.05)
+
+    with pytest.raises(yt_dlp.utils.DownloadError):
+        await extractor.extract("https://www.youtube.com/watch?v=123456789")
+    extractor.close()
+
+
+@pytest.mark.asyncio
+async def test_extractor_iterate(monkeypatch):
+    """Tests that Extractor.iterate() method streams the entries of a playlist."""
+
+    def extract_entries(options, url, sanitize, callback=None, stop=None):
+        entries = [{"url": f"https://youtu.be/{i}", "title": f"{i}"} for i in range(3)]
+        if callback is None:
+            return entries
+        for entry in entries:
+            callback(entry)
+        return []
+
+    monkeypatch.setattr(extractor_module, "_extract_entries", extract_entries)
+    extractor = Extractor(options={}, workers=1)
+
+    entries = [entry async for entry in extractor.iterate("playlist", guild_id=1)]
+    assert [entry["title"] for entry in entries] == ["0", "1", "2"]
+    extractor.close()
+
+
+@pytest.mark.asyncio
+async def test_extractor_timeout_starts_at_worker(monkeypatch):
+    """Tests that Extractor class does not count the queue wait into the timeout."""
+
+    def extract_info(options, url, sanitize):
+        time.sleep(0.03)
+        return {"url": url}
+
+    monkeypatch.setattr(extractor_module, "_extract_info", extract_info)
+    extractor = Extractor(options={}, workers=1, timeout=0.05)
+
+    # Each extraction is fast, but the last ones wait longer than the timeout
+    tasks = [extractor.extract(f"{i}", guild_id=1) for i in range(5)]
+    results = await asyncio.gather(*tasks)
+
+    assert [result["url"] for result in results] == ["0", "1", "2", "3", "4"]
+    extractor.close()
+
+
+@pytest.mark.asyncio
+async def test_extractor_with_queue_timeout(monkeypatch):
+    """Tests that Extractor class cancels extractions that are queued too long."""
+
+    def extract_info(options, url, sanitize):
+        time.sleep(0.2)
+        return {"url": url}
+
+    monkeypatch.setattr(extractor_module, "_extract_info", extract_info)
+    extractor = Extractor(options={}, workers=1, queue_timeout=0.05)
+    running = asyncio.ensure_future(extractor.extract("running"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(yt_dlp.utils.DownloadError):
+        await extractor.extract("queued")
+    assert (await running)["url"] == "running"
+    extractor.close()
@@ -0,0 +1,176 @@
+"""Tests for discord_bot/session/journal.py."""
+
+import functools
+import time
+
+import pytest
+
+from discord_bot.audio import AudioSource, Playlist, StreamResolver
+from discord_bot.session import GuildSession, SessionJournal, SessionRegistry
+from discord_bot.transformer import Prefetcher
+
+
+async def extract(url):
+    """Mock extract function."""
+    return {"url": url}
+
+
+def registry(journal: SessionJournal) -> SessionRegistry:
+    """Creates a registry, whose playlists and evictions are journaled."""
+    return SessionRegistry(
+        factory=lambda guild_id: GuildSession(
+            guild_id=guild_id,
+            playlist=Playlist(journal=functools.partial(journal.record, guild_id)),
+            prefetcher=Prefetcher(resolver=StreamResolver(extract=extract)),
+            volume=50,
+        ),
+        on_evict=functools.partial(journal.record, operation="evict"),
+    )
+
+
+def audio_source(i: int) -> AudioSource:
+    """Creates an audio source with a resolved stream."""
+    return AudioSource(
+        title=f"Song #{i}",
+        user="Ninja",
+        yt_url=f"https://youtu.be/{i}",
+        priority=i % 3,
+        stream_url=f"https://stream/{i}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_journal_restore(tmp_path):
+    """Tests that SessionJournal.restore() method replays the journaled mutations."""
+    journal = SessionJournal(path=str(tmp_path / "sessions.journal"))
+    sessions = registry(journal)
+    await journal.restore(sessions)
+
+    session = sessions.get(248897274002931722)
+    for i in range(6):
+        await session.playlist.add(audio_source(i))
+    await session.playlist.pop()
+    await session.playlist.remove(2)
+    await session.playlist.move(3, 1)
+    session.volume = 80
+    journal.record(248897274002931722, "volume", 80)
+    expected = [item.yt_url for item in session.playlist.snapshot()]
+
+    # Simulate a crash, where the last entry was not completely written
+    journal._file.write('[248897274002931722, "po')
+    journal._file.flush()
+
+    journal = SessionJournal(path=str(tmp_path / "sessions.journal"))
+    restored = registry(journal)
+
+    assert await journal.restore(restored) == 4
+    session = restored.get(248897274002931722)
+    assert [item.yt_url for item in session.playlist.snapshot()] == expected
+    assert all(item.stream_url is None for item in session.playlist.snapshot())
+    assert session.volume == 80
+
+
+@pytest.mark.asyncio
+async def test_session_journal_compact(tmp_path):
+    """Tests that SessionJournal compacts the journal into the snapshot."""
+    journal = SessionJournal(path=str(tmp_path / "sessions.journal"), compact_every=10)
+    sessions = registry(journal)
+    await journal.restore(sessions)
+
+    session = sessions.get(248897274002931722)
+    for i in range(1000):
+        await session.playlist.add(audio_source(i))
+    await journal.close()
+
+    assert not (tmp_path / "sessions.journal").exists()
+    assert not (tmp_path / "sessions.journal.old").exists()
+
+    journal = SessionJournal(path=str(tmp_path / "sessions.journal"))
+    start = time.perf_counter()
+    assert await journal.restore(registry(journal)) == 1000
+    assert time.perf_counter() - start < 1
+
+
+@pytest.mark.asyncio
+async def test_session_journal_evict(tmp_path):
+    """Tests that SessionJournal.restore() method replays evicted sessions."""
+    journal = SessionJournal(path=str(tmp_path / "sessions.journal"))
+    sessions = registry(journal)
+    await journal.restore(sessions)
+
+    session = sessions.get(248897274002931722)
+    await session.playlist.add(audio_source(0))
+    await session.playlist.add(audio_source(1))
+    session.volume = 80
+    journal.record(248897274002931722, "volume", 80)
+    # Bot was kicked from the voice channel without clearing the playlist
+    sessions.evict(248897274002931722)
+    session = sessions.get(248897274002931722)
+    await session.playlist.add(audio_source(2))
+    await session.playlist.remove(1)
+    assert session.playlist.snapshot() == []
+
+    journal = SessionJournal(path=str(tmp_path / "sessions.journal"))
+    restored = registry(journal)
+
+    assert await journal.restore(restored) == 0
+    session = restored.get(248897274002931722)
+    assert session.playlist.snapshot() == []
+    assert session.volume == 50
+
+
+@pytest.mark.asyncio
+async def test_session_journal_compact_in_background(tmp_path):
+    """Tests that SessionJournal keeps the mutations during a compaction."""
+    journal = SessionJournal(path=str(tmp_path / "sessions.journal"), compact_every=10)
+    sessions = registry(journal)
+    await journal.restore(sessions)
+
+    session = sessions.get(248897274002931722)
+    for i in range(10):
+        await session.playlist.add(audio_source(i))
+    # Snapshot is still written, while the next mutations are journaled
+    compaction = journal._compaction
+    assert compaction is not None
+    assert (tmp_path / "sessions.journal.old").exists()
+    for i in range(10, 15):
+        await session.playlist.add(audio_source(i))
+    await compaction
+
+    assert not (tmp_path / "sessions.journal.old").exists()
+    assert len((tmp_path / "sessions.journal").read_text().splitlines()) == 5
+
+    # Simulate a crash, without closing the journal
+    journal = SessionJournal(path=str(tmp_path / "sessions.journal"))
+    assert await journal.restore(registry(journal)) == 15
+    await journal.close()
+
+
+@pytest.mark.asyncio
+async def test_session_journal_restore_rotated(tmp_path):
+    """Tests that SessionJournal.restore() method replays an interrupted compaction."""
+    journal = SessionJournal(path=str(tmp_path / "sessions.journal"))
+    sessions = registry(journal)
+    await journal.restore(sessions)
+
+    session = sessions.get(248897274002931722)
+    for i in range(3):
+        await session.playlist.add(audio_source(i))
+    # Simulate a crash, before the snapshot of the rotated journal was written
+    journal._file.close()
+    (tmp_path / "sessions.journal").rename(tmp_path / "sessions.journal.old")
+    (tmp_path / "sessions.journal").write_text(
+        '[248897274002931722, "pop"]\n', encoding="utf-8"
+    )
+
+    journal = SessionJournal(path=str(tmp_path / "sessions.journal"))
+    restored = registry(journal)
+
+    assert await journal.restore(restored) == 2
+    session = restored.get(248897274002931722)
+    assert [item.yt_url for item in session.playlist.snapshot()] == [
+        "https://youtu.be/1",
+        "https://youtu.be/2",
+    ]
+    assert not (tmp_path / "sessions.journal.old").exists()
+    await journal.close()
@@ -0,0 +1,56 @@
+"""Tests for discord_bot/command/manager.py."""
+
+import pytest
+
+from discord_bot.command import Manager
+
+
+def manager() -> Manager:
+    """Creates a manager with empty blacklists of a single command."""
+    return Manager(
+        bot=None,
+        users={"play": []},
+        roles={"play": []},
+        text_channels={"play": []},
+        voice_channels={"play": []},
+    )
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {},
+        {"manager": None},
+        {"manager": {"users": None}},
+        {
+            "manager": {
+                "users": {"play": "248897274002931722"},
+                "roles": {"play": []},
+                "text_channels": {"play": []},
+                "voice_channels": {"play": []},
+            }
+        },
+    ],
+)
+def test_manager_reload_invalid(config):
+    """Tests that Manager._reload() method rejects malformed blacklists."""
+    with pytest.raises(ValueError):
+        manager()._reload(config)
+
+
+def test_manager_reload():
+    """Tests that Manager._reload() method applies the blacklists in place."""
+    cog = manager()
+    users = cog.users
+    cog._reload(
+        {
+            "manager": {
+                "users": {"play": [248897274002931722]},
+                "roles": {"play": []},
+                "text_channels": {"play": []},
+                "voice_channels": {"play": []},
+            }
+        }
+    )
+
+    assert users == {"play": [248897274002931722]}
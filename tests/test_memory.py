@@ -0,0 +1,76 @@
+"""Tests for discord_bot/chat/memory.py."""
+
+import time
+from typing import List
+
+import pytest
+
+from discord_bot.chat import ConversationMemory, Turn
+
+
+@pytest.mark.asyncio
+async def test_conversation_memory_messages():
+    """Tests that ConversationMemory.messages() method includes the history."""
+    memory = ConversationMemory()
+    await memory.append(725622500846993530, "Hi", "Hello!")
+
+    messages = memory.messages(725622500846993530, "Be short.", "Who are you?")
+
+    assert messages == [
+        {"role": "system", "content": "Be short."},
+        {"role": "user", "content": "Hi"},
+        {"role": "assistant", "content": "Hello!"},
+        {"role": "user", "content": "Who are you?"},
+    ]
+    assert len(memory.messages(248897274002931722, "Be short.", "Hi")) == 2
+
+
+@pytest.mark.asyncio
+async def test_conversation_memory_token_budget():
+    """Tests that ConversationMemory.messages() method keeps the newest turns."""
+    memory = ConversationMemory(max_turns=4, max_tokens=40)
+    for i in range(3):
+        await memory.append(725622500846993530, f"Question #{i} " * 5, f"Answer #{i}")
+
+    messages = memory.messages(725622500846993530, "Be short.", "Hi")
+
+    assert len(messages) < 2 + 4
+    assert messages[-2] == {"role": "assistant", "content": "Answer #2"}
+
+
+@pytest.mark.asyncio
+async def test_conversation_memory_summarize():
+    """Tests that ConversationMemory.append() method summarizes dropped turns."""
+    summarized: List[Turn] = []
+
+    async def summarize(summary: str, turns: List[Turn]) -> str:
+        summarized.extend(turns)
+        return "The user greeted the bot."
+
+    memory = ConversationMemory(max_turns=2, summarize=summarize)
+    await memory.append(725622500846993530, "Hi", "Hello!")
+    await memory.append(725622500846993530, "Who are you?", "A bot.")
+
+    messages = memory.messages(725622500846993530, "Be short.", "Bye")
+
+    assert [turn.content for turn in summarized] == ["Hi", "Hello!"]
+    assert messages[0]["content"].endswith("The user greeted the bot.")
+    assert len(messages) == 4
+
+
+@pytest.mark.asyncio
+async def test_conversation_memory_eviction(monkeypatch):
+    """Tests that ConversationMemory evicts idle and least recently used channels."""
+    memory = ConversationMemory(ttl=60, max_channels=2)
+    await memory.append(1, "Hi", "Hello!")
+    await memory.append(2, "Hi", "Hello!")
+    await memory.append(3, "Hi", "Hello!")
+
+    assert len(memory) == 2
+    assert len(memory.messages(1, "Be short.", "Hi")) == 2
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+    assert memory.evict_idle() == 2
+    assert len(memory) == 0
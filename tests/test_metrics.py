@@ -0,0 +1,134 @@
+"""Tests for discord_bot/util/metrics.py."""
+
+import logging
+import threading
+
+import pytest
+from discord.ext import commands
+
+from discord_bot.command import Metrics
+from discord_bot.util.metrics import Counter, Gauge, Histogram, render
+
+
+def test_counter_render():
+    """Tests that Counter.render() method exposes the value of each label."""
+    counter = Counter("commands_total", "Number of commands", ("command",))
+    counter.inc("play")
+    counter.inc("play")
+    counter.inc("skip")
+
+    assert list(counter.render()) == [
+        "# HELP commands_total Number of commands",
+        "# TYPE commands_total counter",
+        'commands_total{command="play"} 2',
+        'commands_total{command="skip"} 1',
+    ]
+
+
+def test_metrics_from_threads():
+    """Tests that Counter.inc() and Histogram.observe() methods are thread-safe."""
+    counter = Counter("frames_total", "Number of frames")
+    histogram = Histogram("frame_seconds", "Frame time", buckets=(0.5,))
+
+    def update():
+        for _ in range(10000):
+            counter.inc()
+            histogram.observe(0.1)
+
+    threads = [threading.Thread(target=update) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for _ in range(100):
+        # Rendering while the threads update must not fail
+        list(counter.render())
+        list(histogram.render())
+    for thread in threads:
+        thread.join()
+
+    assert "frames_total 40000" in list(counter.render())
+    assert "frame_seconds_count 40000" in list(histogram.render())
+
+
+@pytest.mark.asyncio
+async def test_histogram_time():
+    """Tests that Histogram.time() method observes the duration of a coroutine."""
+    histogram = Histogram("seconds", "Latency", ("operation",), buckets=(0.5, 1.0))
+
+    @histogram.time("add")
+    async def add(x: int) -> int:
+        return x + 1
+
+    assert await add(1) == 2
+    histogram.observe(0.7, "add")
+    histogram.observe(2.0, "add")
+
+    lines = list(histogram.render())
+    assert lines[2:5] == [
+        'seconds_bucket{operation="add",le="0.5"} 1',
+        'seconds_bucket{operation="add",le="1.0"} 2',
+        'seconds_bucket{operation="add",le="+Inf"} 3',
+    ]
+    assert lines[-1] == 'seconds_count{operation="add"} 3'
+
+
+def test_gauge_render():
+    """Tests that Gauge.render() method collects the values at scrape time."""
+    gauge = Gauge("playlist_size", "Number of songs", ("guild",))
+    assert len(list(gauge.render())) == 2
+
+    gauge.collect = lambda: [(("248897274002931722",), 42)]
+    assert list(gauge.render())[-1] == 'playlist_size{guild="248897274002931722"} 42'
+
+
+class MessageMock:
+    """Mock class for ctx.message."""
+
+    id = 1
+
+
+class ContextMock:
+    """Mock class for the context of an unknown command."""
+
+    message = MessageMock()
+    command = None
+    cog = None
+
+
+@pytest.mark.asyncio
+async def test_metrics_on_command_error(caplog):
+    """Tests that Metrics.on_command_error() method keeps logging the error."""
+    error = commands.CommandError("Boom")
+
+    with caplog.at_level(logging.ERROR, logger="discord"):
+        await Metrics(bot=None).on_command_error(ContextMock(), error)
+
+    assert "Ignoring exception in command None" in caplog.text
+    assert 'command="unknown",error="CommandError"' in render()
+
+
+class ExtractorMock:
+    """Mock class for discord_bot.audio.Extractor."""
+
+    def stats(self):
+        return {"running": 2, "queued": 3, "queued_per_guild": {1: 3}}
+
+
+class MusicMock:
+    """Mock class for discord_bot.command.Music."""
+
+    extractor = ExtractorMock()
+
+
+class BotMock:
+    """Mock class for commands.Bot."""
+
+    def get_cog(self, name: str):
+        return MusicMock()
+
+
+def test_metrics_extract_queue():
+    """Tests that Metrics collects the queued and running extractions."""
+    metrics = Metrics(bot=BotMock())
+
+    assert list(metrics._extract_queued()) == [(("1",), 3)]
+    assert list(metrics._extract_running()) == [((), 2)]
@@ -0,0 +1,152 @@
+"""Tests for discord_bot/command/music.py."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import pytest
+import yt_dlp
+
+from discord_bot.command import Music
+
+URL = "https://www.youtube.com/playlist?list=PL"
+
+
+@dataclass
+class RoleMock:
+    """Mock class for discord.Role."""
+
+    id: int = 248897274002931722
+
+
+@dataclass
+class AuthorMock:
+    """Mock class for ctx.author."""
+
+    name: str = "Ninja"
+    roles: List[RoleMock] = field(default_factory=lambda: [RoleMock()])
+
+
+class VoiceClientMock:
+    """Mock class for discord.VoiceClient."""
+
+    def is_playing(self) -> bool:
+        return False
+
+    def is_paused(self) -> bool:
+        return False
+
+
+@dataclass
+class GuildMock:
+    """Mock class for discord.Guild."""
+
+    id: int = 248897274002931722
+    voice_client: Any = None
+
+
+class MessageMock:
+    """Mock class for discord.Message."""
+
+    def __init__(self, content: str):
+        self.content = content
+
+    async def edit(self, content: str):
+        self.content = content
+
+
+class TypingMock:
+    """Mock class for ctx.typing()."""
+
+    async def __aenter__(self):
+        pass
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class ContextMock:
+    """Mock class for commands.Context."""
+
+    def __init__(self):
+        self.author = AuthorMock()
+        self.guild = GuildMock()
+        self.voice_client = VoiceClientMock()
+        self.messages: List[MessageMock] = []
+
+    async def send(self, content: str) -> MessageMock:
+        self.messages.append(MessageMock(content))
+        return self.messages[-1]
+
+    def typing(self) -> TypingMock:
+        return TypingMock()
+
+
+class IndexMock:
+    """Mock class for discord_bot.permission.PermissionIndex."""
+
+    def ranks(self, guild: GuildMock) -> Dict[int, int]:
+        return {248897274002931722: 0}
+
+
+class ManagerMock:
+    """Mock class for discord_bot.command.Manager."""
+
+    index = IndexMock()
+
+
+class BotMock:
+    """Mock class for commands.Bot."""
+
+    def get_cog(self, name: str) -> Any:
+        return ManagerMock()
+
+    def get_guild(self, guild_id: int) -> None:
+        return None
+
+    def dispatch(self, event: str, *args):
+        pass
+
+
+async def extract(url: str, guild_id: int | None = None) -> Dict[str, Any]:
+    """Mock extract function, which answers like a YouTube search."""
+    return {"entries": [{"url": f"https://youtu.be/{url}", "title": url}]}
+
+
+async def iterate(url: str, guild_id: int | None = None):
+    """Mock iterate function, which times out after two entries."""
+    for i in range(2):
+        yield {"url": f"https://youtu.be/{i}", "title": f"Song #{i}"}
+    raise yt_dlp.utils.DownloadError("Extraction timed out!")
+
+
+@pytest.mark.asyncio
+async def test_music_add_full():
+    """Tests that the add command reports a full playlist."""
+    music = Music(BotMock(), cache_path=":memory:", playlist_size=1)
+    music.extractor.extract = extract
+    ctx = ContextMock()
+
+    await music.add.callback(music, ctx, "Lemon")
+    await music.add.callback(music, ctx, "Dance")
+
+    assert ctx.messages[0].content.startswith("✅ Added [Lemon]")
+    assert ctx.messages[1].content.startswith("⚠️ Could not add [Dance]")
+    assert "maximum size" in ctx.messages[1].content
+    music.extractor.close()
+    music.cache.close()
+
+
+@pytest.mark.asyncio
+async def test_music_addlist_error():
+    """Tests that the addlist command reports a failed extraction."""
+    music = Music(BotMock(), cache_path=":memory:")
+    music.extractor.iterate = iterate
+    ctx = ContextMock()
+
+    await music.addlist.callback(music, ctx, URL)
+
+    assert ctx.messages[0].content.startswith("❌ Could not extract all songs")
+    assert "added 2 songs" in ctx.messages[0].content
+    assert len(music.sessions.get(ctx.guild.id).playlist) == 2
+    music.extractor.close()
+    music.cache.close()
@@ -0,0 +1,34 @@
+"""Tests for discord_bot/util/pages.py."""
+
+from discord_bot.util import paginate
+
+
+def test_paginate_packs_sections():
+    """Tests that paginate() function packs small sections into a single page."""
+    pages = paginate([("**Roles:**", ["•1: Genin", "•2: Chunin"]), ("**Users:**", [])])
+
+    assert pages == [
+        "**Roles:**\n```\n•1: Genin\n•2: Chunin\n```\n**Users:**\n```\n---\n```"
+    ]
+
+
+def test_paginate_splits_sections():
+    """Tests that paginate() function splits large sections at the limit."""
+    lines = [f"•{i}: Member #{i}" for i in range(500)]
+    pages = paginate([("**Users:**", lines), ("**Roles:**", ["•1: Genin"])])
+
+    assert len(pages) > 1
+    assert all(len(page) <= 2000 for page in pages)
+    assert pages[1].startswith("**Users:** (continued)\n```\n")
+    assert "\n".join(pages).count("Member #") == 500
+    assert pages[-1].endswith("**Roles:**\n```\n•1: Genin\n```")
+
+
+def test_paginate_wraps_lines():
+    """Tests that paginate() function wraps lines longer than the limit."""
+    names = ", ".join(f"Member #{i}" for i in range(300))
+    pages = paginate([("**Blacklisted users:**", [f"play: {names}"])])
+
+    assert len(pages) > 1
+    assert all(len(page) <= 2000 for page in pages)
+    assert "\n".join(pages).count("#") == 300
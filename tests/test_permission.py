@@ -0,0 +1,91 @@
+"""Tests for discord_bot/permission/index.py."""
+
+from dataclasses import dataclass, field
+from typing import List
+
+from discord_bot.permission import PermissionIndex
+
+
+@dataclass
+class RoleMock:
+    """Mock class for discord.Role."""
+
+    id: int
+    name: str
+
+
+@dataclass
+class GuildMock:
+    """Mock class for discord.Guild."""
+
+    id: int
+    roles: List[RoleMock] = field(default_factory=list)
+
+
+def guild() -> GuildMock:
+    """Creates a guild with roles sorted from lowest to highest."""
+    return GuildMock(
+        id=248897274002931722,
+        roles=[
+            RoleMock(id=248897274002931722, name="@everyone"),
+            RoleMock(id=248898155867930624, name="Genin"),
+            RoleMock(id=686645319718404100, name="Chunin"),
+            RoleMock(id=385159915918065664, name="Jonin"),
+        ],
+    )
+
+
+def test_permission_index_refresh():
+    """Tests that PermissionIndex.refresh() method picks up edited blacklists."""
+    users = {"play": [123898634924425216]}
+    index = PermissionIndex(
+        users=users,
+        roles={"play": []},
+        text_channels={"play": []},
+        voice_channels={"play": []},
+    )
+    users["play"] = [234898634924425216]
+
+    assert index.user_blacklisted("play", 123898634924425216)
+
+    index.refresh("users")
+
+    assert not index.user_blacklisted("play", 123898634924425216)
+    assert index.user_blacklisted("play", 234898634924425216)
+
+
+def test_permission_index_role_blacklisted():
+    """Tests that PermissionIndex.role_blacklisted() method blocks lower roles."""
+    index = PermissionIndex(
+        users={"play": []},
+        roles={"play": [686645319718404100]},
+        text_channels={"play": []},
+        voice_channels={"play": []},
+    )
+    discord_guild = guild()
+
+    assert index.role_blacklisted(discord_guild, "play", 248898155867930624)
+    assert index.role_blacklisted(discord_guild, "play", 686645319718404100)
+    assert not index.role_blacklisted(discord_guild, "play", 385159915918065664)
+
+
+def test_permission_index_invalidate():
+    """Tests that PermissionIndex.invalidate() method drops the cached ranks."""
+    index = PermissionIndex(
+        users={"play": []},
+        roles={"play": [686645319718404100]},
+        text_channels={"play": []},
+        voice_channels={"play": []},
+    )
+    discord_guild = guild()
+    assert not index.role_blacklisted(discord_guild, "play", 385159915918065664)
+
+    # Move Jonin below Chunin
+    discord_guild.roles[2], discord_guild.roles[3] = (
+        discord_guild.roles[3],
+        discord_guild.roles[2],
+    )
+    assert not index.role_blacklisted(discord_guild, "play", 385159915918065664)
+
+    index.invalidate(discord_guild.id)
+    assert index.role_blacklisted(discord_guild, "play", 385159915918065664)
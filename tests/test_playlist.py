@@ -0,0 +1,197 @@
+"""Tests for discord_bot/audio/playlist.py."""
+
+import random
+
+import pytest
+
+from discord_bot.audio import AudioSource, Playlist
+
+
+def audio_source(title: str, priority: int) -> AudioSource:
+    """Creates an audio source with the given title and priority."""
+    return AudioSource(
+        title=title,
+        user="User",
+        yt_url=f"https://www.youtube.com/watch?v={title}",
+        priority=priority,
+    )
+
+
+@pytest.mark.asyncio
+async def test_playlist_with_fifo_order():
+    """Tests that Playlist class pops audio sources of equal priority in FIFO order."""
+    playlist = Playlist()
+    for i in range(20):
+        await playlist.add(audio_source(f"{i}", 1))
+
+    assert [(await playlist.pop()).title for _ in range(20)] == [
+        f"{i}" for i in range(20)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_playlist_with_priority_order():
+    """Tests that Playlist class pops audio sources of higher priority first."""
+    playlist = Playlist()
+    await playlist.add(audio_source("a", 2))
+    await playlist.add(audio_source("b", 0))
+    await playlist.add(audio_source("c", 1))
+    await playlist.add(audio_source("d", 0))
+
+    assert [item.title for item in await playlist.peek(4)] == ["b", "d", "c", "a"]
+    assert [i async for i, _ in playlist.iterate()] == [0, 1, 2, 3]
+    assert (await playlist.pop()).title == "b"
+
+
+@pytest.mark.asyncio
+async def test_playlist_with_max_size():
+    """Tests that Playlist class raises an error if it is full."""
+    playlist = Playlist(max_size=1)
+    await playlist.add(audio_source("a", 0))
+
+    assert await playlist.full()
+    with pytest.raises(ValueError):
+        await playlist.add(audio_source("b", 0))
+
+    await playlist.clear()
+    assert await playlist.empty()
+
+
+@pytest.mark.asyncio
+async def test_playlist_peek_with_offset():
+    """Tests Playlist.peek() method with an offset."""
+    playlist = Playlist()
+    for i in range(10):
+        await playlist.add(audio_source(f"{i}", i % 2))
+
+    assert await playlist.size() == 10
+    assert [item.title for item in await playlist.peek(3, offset=4)] == [
+        "8",
+        "1",
+        "3",
+    ]
+    assert await playlist.peek(5, offset=10) == []
+
+
+@pytest.mark.asyncio
+async def test_playlist_remove():
+    """Tests Playlist.remove() method."""
+    playlist = Playlist()
+    for title in "abcde":
+        await playlist.add(audio_source(title, 0))
+
+    assert (await playlist.remove(2)).title == "b"
+    assert (await playlist.remove(4)).title == "e"
+    with pytest.raises(IndexError):
+        await playlist.remove(4)
+
+    assert await playlist.size() == 3
+    assert [(await playlist.pop()).title for _ in range(3)] == ["a", "c", "d"]
+    assert await playlist.empty()
+
+
+@pytest.mark.asyncio
+async def test_playlist_move():
+    """Tests Playlist.move() method."""
+    playlist = Playlist()
+    for title in "abc":
+        await playlist.add(audio_source(title, 0))
+    for title in "xy":
+        await playlist.add(audio_source(title, 1))
+
+    await playlist.move(5, 1)
+    assert [item.title for item in await playlist.peek(5)] == list("yabcx")
+    await playlist.move(1, 5)
+    assert [item.title for item in await playlist.peek(5)] == list("abcxy")
+    await playlist.move(4, 2)
+    assert [item.title for item in await playlist.peek(5)] == list("axbcy")
+    await playlist.move(2, 3)
+    assert [item.title for item in await playlist.peek(5)] == list("abxcy")
+    with pytest.raises(IndexError):
+        await playlist.move(1, 6)
+
+    # Moving an item many times between the same neighbours renumbers the entries
+    for _ in range(100):
+        await playlist.move(3, 2)
+        await playlist.move(2, 3)
+    assert [item.title for item in await playlist.peek(5)] == list("abxcy")
+    assert [(await playlist.pop()).title for _ in range(5)] == list("abxcy")
+
+
+@pytest.mark.asyncio
+async def test_playlist_positions():
+    """Tests that Playlist keeps its positions in random removes and moves."""
+    rng = random.Random(0)
+    playlist = Playlist()
+    expected = []
+    for i in range(200):
+        await playlist.add(audio_source(str(i), 0))
+        expected.append(str(i))
+
+    for _ in range(500):
+        position = rng.randint(1, len(expected))
+        if rng.random() < 0.2:
+            await playlist.remove(position)
+            del expected[position - 1]
+        else:
+            new_position = rng.randint(1, len(expected))
+            await playlist.move(position, new_position)
+            expected.insert(new_position - 1, expected.pop(position - 1))
+        if rng.random() < 0.1:
+            await playlist.add(audio_source(f"new{len(expected)}", 0))
+            expected.append(f"new{len(expected)}")
+
+    assert [item.title for item in playlist.snapshot()] == expected
+    assert [(await playlist.pop()).title for _ in expected] == expected
+
+
+@pytest.mark.asyncio
+async def test_playlist_dedupe():
+    """Tests Playlist.dedupe() method."""
+    playlist = Playlist()
+    for title in "abacbad":
+        await playlist.add(audio_source(title, 0))
+
+    assert await playlist.dedupe() == 3
+    assert [item.title for item in await playlist.peek(10)] == list("abcd")
+
+
+def assert_consistent(playlist: Playlist):
+    """Asserts that the sorted keys and both indexes describe the same entries."""
+    assert list(playlist._order) == sorted(
+        entry[:2] for entry in playlist._entries.values()
+    )
+    assert all(seq == entry[1] for seq, entry in playlist._entries.items())
+    urls = {}
+    for seq, entry in playlist._entries.items():
+        urls.setdefault(entry[2].yt_url, set()).add(seq)
+    assert playlist._urls == urls
+
+
+@pytest.mark.asyncio
+async def test_playlist_consistency():
+    """Tests that Playlist keeps its indexes consistent in interleaved mutations."""
+    rng = random.Random(1)
+    playlist = Playlist()
+    for i in range(60):
+        await playlist.add(audio_source(str(i % 20), i % 3))
+    assert_consistent(playlist)
+
+    for i in range(300):
+        size = await playlist.size()
+        operation = rng.random()
+        if operation < 0.5 and size > 1:
+            await playlist.move(rng.randint(1, size), rng.randint(1, size))
+        elif operation < 0.6 and size > 3:
+            # Moving between the same neighbours exhausts the sequence numbers
+            for _ in range(60):
+                await playlist.move(3, 2)
+        elif operation < 0.7:
+            await playlist.dedupe()
+        elif operation < 0.8 and size > 0:
+            await playlist.remove(rng.randint(1, size))
+        elif operation < 0.9 and size > 0:
+            await playlist.pop()
+        else:
+            await playlist.add(audio_source(str(rng.randrange(20)), rng.randrange(3)))
+        assert_consistent(playlist)
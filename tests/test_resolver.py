@@ -0,0 +1,97 @@
+"""Tests for discord_bot/audio/resolver.py."""
+
+import asyncio
+import time
+
+import pytest
+
+from discord_bot.audio import AudioSource, StreamResolver
+from discord_bot.audio.resolver import parse_expiry
+
+
+def test_parse_expiry_with_query():
+    """Tests parse_expiry() function with the expiry as query parameter."""
+    url = "https://rr1---sn.googlevideo.com/videoplayback?expire=1700000000&ei=abc"
+
+    assert parse_expiry(url) == 1700000000
+
+
+def test_parse_expiry_with_path():
+    """Tests parse_expiry() function with the expiry as part of the path."""
+    url = "https://manifest.googlevideo.com/api/manifest/hls/expire/1700000000/ei/abc"
+
+    assert parse_expiry(url) == 1700000000
+
+
+def test_parse_expiry_without_expiry():
+    """Tests parse_expiry() function with an URL that does not expire."""
+    url = "https://example.com/audio.webm"
+
+    assert parse_expiry(url) is None
+
+
+@pytest.mark.asyncio
+async def test_stream_resolver_with_valid_stream_url():
+    """Tests StreamResolver.resolve() method with a stream URL that is still valid."""
+
+    async def extract(url):
+        raise AssertionError("extract should not be called!")
+
+    stream_url = f"https://googlevideo.com/videoplayback?expire={time.time() + 3600}"
+    audio_source = AudioSource(
+        title="Title",
+        user="User",
+        yt_url="https://www.youtube.com/watch?v=123456789",
+        priority=0,
+        stream_url=stream_url,
+    )
+    resolver = StreamResolver(extract=extract, margin=600)
+
+    await resolver.resolve(audio_source)
+    assert audio_source.stream_url == stream_url
+
+
+@pytest.mark.asyncio
+async def test_stream_resolver_with_expired_stream_url():
+    """Tests StreamResolver.resolve() method with a stream URL that expires soon."""
+
+    async def extract(url):
+        return {"url": "https://googlevideo.com/videoplayback?expire=9999999999"}
+
+    audio_source = AudioSource(
+        title="Title",
+        user="User",
+        yt_url="https://www.youtube.com/watch?v=123456789",
+        priority=0,
+        stream_url=f"https://googlevideo.com/videoplayback?expire={time.time() + 60}",
+    )
+    resolver = StreamResolver(extract=extract, margin=600)
+
+    await resolver.resolve(audio_source)
+    assert audio_source.stream_url.endswith("expire=9999999999")
+
+
+@pytest.mark.asyncio
+async def test_stream_resolver_with_concurrent_resolutions():
+    """Tests that StreamResolver.resolve() method extracts the same video once."""
+    calls = []
+
+    async def extract(url):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return {"url": "https://googlevideo.com/videoplayback"}
+
+    audio_sources = [
+        AudioSource(
+            title="Title",
+            user="User",
+            yt_url="https://www.youtube.com/watch?v=123456789",
+            priority=0,
+        )
+        for _ in range(5)
+    ]
+    resolver = StreamResolver(extract=extract)
+
+    await asyncio.gather(*(resolver.resolve(item) for item in audio_sources))
+    assert len(calls) == 1
+    assert all(item.stream_url is not None for item in audio_sources)
@@ -0,0 +1,38 @@
+"""Tests for discord_bot/chat/cache.py."""
+
+import time
+
+from discord_bot.chat import ResponseCache
+from discord_bot.util.metrics import render
+
+
+def test_response_cache_get():
+    """Tests that ResponseCache.get() method returns the response to equal messages."""
+    cache = ResponseCache()
+    cache.put("gemma3:1b", "Be short.", "Who are you?", "A bot.")
+
+    assert cache.get("gemma3:1b", "Be short.", "  who ARE  you? ") == "A bot."
+    assert cache.get("gemma3:1b", "Be long.", "Who are you?") is None
+    assert cache.get("llama3:8b", "Be short.", "Who are you?") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.hit_rate == 1 / 3
+    assert "discord_bot_chat_cache_hits_total " in render()
+
+
+def test_response_cache_eviction(monkeypatch):
+    """Tests that ResponseCache evicts expired and least recently used responses."""
+    cache = ResponseCache(max_size=2, ttl=60)
+    cache.put("gemma3:1b", "Be short.", "Hi", "Hello!")
+    cache.put("gemma3:1b", "Be short.", "Bye", "Goodbye!")
+    cache.get("gemma3:1b", "Be short.", "Hi")
+    cache.put("gemma3:1b", "Be short.", "Thanks", "You're welcome!")
+
+    assert len(cache) == 2
+    assert cache.get("gemma3:1b", "Be short.", "Bye") is None
+    assert cache.get("gemma3:1b", "Be short.", "Hi") == "Hello!"
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+    assert cache.get("gemma3:1b", "Be short.", "Hi") is None
+    assert len(cache) == 1
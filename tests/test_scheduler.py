@@ -0,0 +1,96 @@
+"""Tests for discord_bot/chat/scheduler.py."""
+
+import asyncio
+
+import pytest
+
+from discord_bot.chat import ChatScheduler, Overloaded
+
+
+@pytest.mark.asyncio
+async def test_chat_scheduler_coalesces():
+    """Tests that ChatScheduler.run() method shares the result of identical requests."""
+    scheduler = ChatScheduler()
+    calls = 0
+
+    async def generate() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "Hello!"
+
+    results = await asyncio.gather(
+        scheduler.run((725622500846993530, "hi"), 1, generate),
+        scheduler.run((725622500846993530, "hi"), 2, generate),
+    )
+
+    assert results == [("Hello!", False), ("Hello!", True)]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_chat_scheduler_concurrency():
+    """Tests that ChatScheduler.run() method limits the number of running requests."""
+    scheduler = ChatScheduler(max_concurrency=2, max_queue=8)
+    running = 0
+    peak = 0
+
+    async def generate() -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "Hello!"
+
+    await asyncio.gather(*(scheduler.run(i, i, generate) for i in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_chat_scheduler_sheds_load():
+    """Tests that ChatScheduler.run() method rejects requests above the limits."""
+    scheduler = ChatScheduler(max_concurrency=1, max_per_user=1, max_queue=1)
+    event = asyncio.Event()
+
+    async def generate() -> str:
+        await event.wait()
+        return "Hello!"
+
+    first = asyncio.create_task(scheduler.run("a", 1, generate))
+    second = asyncio.create_task(scheduler.run("b", 2, generate))
+    await asyncio.sleep(0)
+
+    with pytest.raises(Overloaded):
+        await scheduler.run("c", 1, generate)
+    with pytest.raises(Overloaded):
+        await scheduler.run("c", 3, generate)
+
+    event.set()
+    assert await first == ("Hello!", False)
+    assert await second == ("Hello!", False)
+    assert await scheduler.run("c", 3, generate) == ("Hello!", False)
+
+
+@pytest.mark.asyncio
+async def test_chat_scheduler_propagates_errors():
+    """Tests that ChatScheduler.run() method raises the error to identical requests."""
+    scheduler = ChatScheduler()
+
+    async def generate() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("Chat model is offline!")
+
+    results = await asyncio.gather(
+        scheduler.run("hi", 1, generate),
+        scheduler.run("hi", 2, generate),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def retry() -> str:
+        return "Hello!"
+
+    assert await scheduler.run("hi", 1, retry) == ("Hello!", False)
@@ -0,0 +1,62 @@
+"""Tests for discord_bot/session/registry.py."""
+
+from discord_bot.audio import Playlist, StreamResolver
+from discord_bot.session import GuildSession, SessionRegistry
+from discord_bot.transformer import Prefetcher
+
+
+async def extract(url):
+    """Mock extract function."""
+    return {"url": url}
+
+
+def factory(guild_id: int) -> GuildSession:
+    """Creates an empty session for the given guild."""
+    return GuildSession(
+        guild_id=guild_id,
+        playlist=Playlist(),
+        prefetcher=Prefetcher(resolver=StreamResolver(extract=extract)),
+        volume=50,
+    )
+
+
+def test_session_registry_get():
+    """Tests that SessionRegistry.get() method creates one session per guild."""
+    sessions = SessionRegistry(factory=factory)
+
+    session = sessions.get(248897274002931722)
+    session.volume = 100
+
+    assert sessions.get(248897274002931722) is session
+    assert sessions.get(248897274002931723).volume == 50
+    assert len(sessions) == 2
+
+
+def test_session_registry_find():
+    """Tests that SessionRegistry.find() method does not create sessions."""
+    sessions = SessionRegistry(factory=factory)
+
+    assert sessions.find(248897274002931722) is None
+    assert len(sessions) == 0
+    session = sessions.get(248897274002931722)
+    assert sessions.find(248897274002931722) is session
+
+
+def test_session_registry_evict():
+    """Tests that SessionRegistry.evict() method removes the session of the guild."""
+    sessions = SessionRegistry(factory=factory)
+    session = sessions.get(248897274002931722)
+
+    assert sessions.evict(248897274002931722) is session
+    assert sessions.evict(248897274002931722) is None
+    assert len(sessions) == 0
+
+
+def test_session_registry_clear():
+    """Tests that SessionRegistry.clear() method removes all sessions."""
+    sessions = SessionRegistry(factory=factory)
+    for guild_id in range(100):
+        sessions.get(guild_id)
+
+    sessions.clear()
+    assert len(sessions) == 0
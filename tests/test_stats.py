@@ -0,0 +1,53 @@
+"""Tests for discord_bot/transformer/stats.py."""
+
+import time
+
+import pytest
+
+from discord_bot.transformer import FrameStats
+
+
+def test_frame_stats_measure(monkeypatch):
+    """Tests that FrameStats.measure() method counts late frames and underruns."""
+    # Start and end of each read: on time, on time, late, blocking
+    clock = iter([0.0, 0.001, 0.02, 0.021, 0.1, 0.101, 0.12, 0.15])
+    monkeypatch.setattr(time, "perf_counter", lambda: next(clock))
+    stats = FrameStats()
+
+    for _ in range(4):
+        assert stats.measure(lambda: b"frame") == b"frame"
+
+    assert stats.frames == 4
+    assert stats.late == 1
+    assert stats.underruns == 1
+    assert sum(stats.intervals) == 3
+
+
+def test_frame_stats_percentile():
+    """Tests FrameStats.percentile() method with the buckets of the intervals."""
+    stats = FrameStats()
+    assert stats.percentile(50) == (0.0, False)
+
+    stats.intervals[3] = 98
+    stats.intervals[-1] = 2
+
+    assert stats.percentile(50) == (0.02, False)
+    assert stats.percentile(99) == (0.25, True)
+    with pytest.raises(ValueError):
+        stats.percentile(101)
+
+
+def test_frame_stats_reset(monkeypatch):
+    """Tests that FrameStats.reset() method does not count a pause as late frame."""
+    clock = iter([0.0, 0.001, 0.02, 0.021, 5.0, 5.001])
+    monkeypatch.setattr(time, "perf_counter", lambda: next(clock))
+    stats = FrameStats()
+
+    stats.measure(lambda: b"frame")
+    stats.measure(lambda: b"frame")
+    stats.reset()
+    stats.measure(lambda: b"frame")
+
+    assert stats.frames == 3
+    assert stats.late == 0
+    assert sum(stats.intervals) == 1
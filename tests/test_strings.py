@@ -0,0 +1,33 @@
+"""Tests for discord_bot/util/strings.py."""
+
+import pytest
+
+from discord_bot.util import remove_emojis, truncate
+
+
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        ("Never Gonna Give You Up", "Never Gonna Give You Up"),
+        ("  Lo-Fi   Beats  ", "Lo-Fi Beats"),
+        ("🔥 Best Of 2024 🔥", "Best Of 2024"),
+        ("Party🎉Mix", "PartyMix"),
+        # Skin tone, zero width joiner and variation selector
+        ("Dance 👍🏽 Family 👨‍👩‍👧 Love ❤️ Song", "Dance Family Love Song"),
+        # Regional indicators and tags of a subdivision flag
+        ("Anthem 🇩🇪 🏴󠁧󠁢󠁳󠁣󠁴󠁿", "Anthem"),
+        ("Top 1️⃣0️⃣", "Top 10"),
+        ("米津玄師 - Lemon", "米津玄師 - Lemon"),
+        ("Tab\tand\nnewline", "Tab\tand\nnewline"),
+        ("🎵🎶", ""),
+    ],
+)
+def test_remove_emojis(s: str, expected: str):
+    """Tests remove_emojis() function."""
+    assert remove_emojis(s) == expected
+
+
+def test_truncate():
+    """Tests truncate() function."""
+    assert truncate("Lemon", 5) == "Lemon"
+    assert truncate("Never Gonna Give You Up", 5) == "Never..."
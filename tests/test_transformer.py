@@ -0,0 +1,109 @@
+"""Tests for discord_bot/transformer/opus_transformer.py."""
+
+import io
+
+import discord
+import pytest
+import yaml
+
+from discord_bot.audio import AudioSource
+from discord_bot.command import Music
+from discord_bot.transformer import YTDLOpusTransformer
+
+
+class MockProcess:
+    """Mock ffmpeg process that has already terminated."""
+
+    pid = 0
+    returncode = 0
+
+    def __init__(self):
+        self.stdout = io.BytesIO()
+
+    def kill(self):
+        pass
+
+    def poll(self):
+        return self.returncode
+
+
+@pytest.fixture
+def spawned(monkeypatch):
+    """Replaces the ffmpeg process and records its arguments."""
+    calls = []
+
+    def spawn_process(self, args, **kwargs):
+        calls.append(args)
+        return MockProcess()
+
+    monkeypatch.setattr(discord.FFmpegAudio, "_spawn_process", spawn_process)
+    return calls
+
+
+def audio_source(codec: str | None) -> AudioSource:
+    """Creates a resolved audio source with the given codec."""
+    return AudioSource(
+        title="Never Gonna Give You Up",
+        user="Rick Astley",
+        yt_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        priority=0,
+        stream_url="https://googlevideo.com/videoplayback",
+        codec=codec,
+    )
+
+
+@pytest.mark.asyncio
+async def test_opus_transformer_copies_opus_stream(spawned):
+    """Tests that YTDLOpusTransformer copies Opus streams with a volume of 100."""
+    player = await YTDLOpusTransformer.from_audio_source(audio_source("opus"), 100)
+
+    assert player.is_opus()
+    assert "copy" in spawned[0]
+    assert not any(arg.startswith("volume=") for arg in spawned[0])
+
+
+@pytest.mark.asyncio
+async def test_opus_transformer_copies_by_default(spawned):
+    """Tests that the default configuration copies Opus streams."""
+    with open("config.yaml", "r", encoding="utf-8") as file:
+        config = yaml.safe_load(file)["music"]
+
+    for music in (
+        Music(None, cache_path=":memory:"),
+        Music(
+            None, cache_path=":memory:", opus=config["opus"], volume=config["volume"]
+        ),
+    ):
+        await music.transformer.from_audio_source(
+            audio_source("opus"), music.default_volume
+        )
+        music.extractor.close()
+        music.cache.close()
+
+    assert all("copy" in args for args in spawned)
+
+
+@pytest.mark.asyncio
+async def test_opus_transformer_encodes_with_volume(spawned):
+    """Tests that YTDLOpusTransformer lets ffmpeg apply the volume and encode."""
+    await YTDLOpusTransformer.from_audio_source(audio_source("opus"), 50)
+    await YTDLOpusTransformer.from_audio_source(audio_source("mp4a.40.2"), 100)
+
+    assert "libopus" in spawned[0]
+    assert "volume=0.50" in spawned[0]
+    assert "libopus" in spawned[1]
+
+
+@pytest.mark.asyncio
+async def test_opus_transformer_with_volume(spawned):
+    """Tests that YTDLOpusTransformer.with_volume() restarts at the elapsed time."""
+    player = await YTDLOpusTransformer.from_audio_source(audio_source("opus"), 100)
+    player._packets = 500
+
+    assert player.with_volume(100) is player
+
+    new_player = player.with_volume(25)
+    assert new_player.volume == 0.25
+    assert new_player.offset == pytest.approx(10.0)
+    assert "10.000" in spawned[1]
+    assert "volume=0.25" in spawned[1]
@@ -0,0 +1,77 @@
+"""Tests for discord_bot/util/watchdog.py."""
+
+import asyncio
+import logging
+import time
+
+import pytest
+
+from discord_bot.util import LoopWatchdog
+from discord_bot.util import watchdog as watchdog_module
+
+
+class CommandMock:
+    """Mock of discord.ext.commands.Command."""
+
+    name = "play"
+
+
+class ContextMock:
+    """Mock of discord.ext.commands.Context."""
+
+    command = CommandMock()
+
+
+def blocking_command(ctx: ContextMock):
+    """Blocks the event loop inside of a command."""
+    time.sleep(0.3)
+
+
+def test_loop_watchdog_init():
+    """Tests that LoopWatchdog.__init__() method validates its arguments."""
+    with pytest.raises(ValueError):
+        LoopWatchdog(threshold=0)
+    with pytest.raises(ValueError):
+        LoopWatchdog(threshold=0.1, interval=0.1)
+    with pytest.raises(ValueError):
+        LoopWatchdog(log_interval=-1)
+
+
+@pytest.mark.asyncio
+async def test_loop_watchdog_stall(monkeypatch, caplog):
+    """Tests that LoopWatchdog reports the command and function of a stall."""
+    monkeypatch.setattr(watchdog_module, "PACKAGE", "tests")
+    watchdog = LoopWatchdog(threshold=0.1, interval=0.01, log_interval=0)
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.05)
+        with caplog.at_level(logging.WARNING, logger="discord"):
+            blocking_command(ContextMock())
+            await asyncio.sleep(0.1)
+    finally:
+        await watchdog.stop()
+
+    assert "Event loop stalled 1 times" in caplog.text
+    assert "!play blocking_command" in caplog.text
+    assert "time.sleep(0.3)" in caplog.text
+    # Report resets the counts for the rate limit
+    assert watchdog.stalls == 0
+    assert not watchdog.offenders
+
+
+@pytest.mark.asyncio
+async def test_loop_watchdog_rate_limit(caplog):
+    """Tests that LoopWatchdog rate-limits its reports."""
+    watchdog = LoopWatchdog(threshold=0.1, interval=0.01, log_interval=60)
+    watchdog._last_log = time.monotonic()
+    watchdog.start()
+    try:
+        with caplog.at_level(logging.WARNING, logger="discord"):
+            time.sleep(0.2)
+            await asyncio.sleep(0.1)
+    finally:
+        await watchdog.stop()
+
+    assert "Event loop stalled" not in caplog.text
+    assert watchdog.stalls == 1
+    assert watchdog.offenders